@@ -0,0 +1,102 @@
+'''
+Benchmark of `GmxFrfReader.get_position_info` against a local stub node with a
+simulated round trip latency. Compares the previous implementation, which read each
+input with its own request, with the batched one, on a cold and on a warm market
+metadata cache.
+
+Usage: python -m examples.benchmarks.position_info
+'''
+
+import statistics
+import time
+
+from goldlink import Client
+from goldlink import constants
+
+from examples.benchmarks.stub_node import StubNode
+
+# Runs per implementation.
+RUNS = 20
+
+MARKET = '0x70d95587d40A2caf56bd97485aB3Eec10Bee6336'
+STRATEGY_ACCOUNT = '0x1111111111111111111111111111111111111111'
+
+
+def get_position_info_sequentially(reader, market, strategy_account):
+    '''
+    Previous implementation of `get_position_info`, one request per input.
+    '''
+    def get_token_addresses():
+        return reader.parse_token_addresses_for_market(
+            reader.gmx_v2_reader.functions.getMarket(reader.data_store_address, market).call(),
+        )
+
+    def get_position_key():
+        get_token_addresses()
+        return reader.get_position_key(market, strategy_account)
+
+    market_addresses = get_token_addresses()
+    short_prices = reader.get_asset_price(market_addresses['short_token'])
+    long_prices = reader.get_asset_price(market_addresses['long_token'])
+
+    position = reader.parse_position(
+        reader.gmx_v2_reader.functions.getPosition(
+            reader.data_store_address,
+            get_position_key(),
+        ).call(),
+    )
+
+    position_info = reader.gmx_v2_reader.functions.getPositionInfo(
+        reader.data_store_address,
+        reader.get_referral_storage(),
+        get_position_key(),
+        (
+            (long_prices["price"], long_prices["price"]),
+            (long_prices["price"], long_prices["price"]),
+            (short_prices["price"], short_prices["price"]),
+        ),
+        position["numbers"]["size_in_usd"],
+        reader.get_ui_fee_receiver(),
+        True,
+    ).call()
+
+    return reader.parse_position_info(position_info)
+
+
+def run(node, label, get_position_info, clear_cache):
+    '''
+    Time `get_position_info` and count the requests it sends.
+    '''
+    latencies = []
+    requests = []
+    for _ in range(RUNS):
+        if clear_cache:
+            reader.market_metadata.clear()
+
+        request_count = node.request_count
+        start = time.perf_counter()
+        get_position_info(MARKET, STRATEGY_ACCOUNT)
+        latencies.append(time.perf_counter() - start)
+        requests.append(node.request_count - request_count)
+
+    print(
+        f'{label}: {statistics.median(requests):.0f} requests, '
+        f'{statistics.median(latencies) * 1000:.1f} ms median',
+    )
+
+
+node = StubNode()
+client = Client(host=node.start(), network_id=constants.NETWORK_ID_MAINNET)
+reader = client.gmx_frf_reader
+
+print(f'Stub node latency: {node.latency * 1000:.0f} ms per request')
+run(
+    node,
+    'Sequential',
+    lambda market, account: get_position_info_sequentially(reader, market, account),
+    clear_cache=False,
+)
+run(node, 'Batched, cold metadata cache', reader.get_position_info, clear_cache=True)
+run(node, 'Batched, warm metadata cache', reader.get_position_info, clear_cache=False)
+
+node.stop()
@@ -0,0 +1,82 @@
+'''
+Benchmark of client startup: importing the package and preparing the first call. The
+previous implementation, which parsed the JSON ABI of a contract whenever it bound
+one, is compared with the contract registry, which parses each ABI once on first use
+with its selectors and topics precomputed, and with every ABI preloaded up front.
+Every run is a fresh interpreter and no requests are sent to a node.
+
+Usage: python -m examples.benchmarks.startup
+'''
+
+import statistics
+import subprocess
+import sys
+
+# Runs per implementation.
+RUNS = 10
+
+# Imports the client, creates it and encodes a first call to the strategy manager.
+STARTUP_SCRIPT = '''
+import time
+start = time.perf_counter()
+
+from goldlink import Client
+imported = time.perf_counter()
+
+client = Client(host='http://localhost:8545', network_id=42161)
+{first_call}
+prepared = time.perf_counter()
+
+print(imported - start, prepared - imported)
+'''
+
+# First call of each implementation.
+FIRST_CALLS = {
+    'Previous (JSON per contract)': '''
+from goldlink import constants
+from goldlink.modules.abi_loader import load_json_abi
+client.web3.eth.contract(
+    address=client.gmx_frf_reader.manager_address,
+    abi=load_json_abi(constants.GMX_FRF_STRATEGY_MANAGER_ABI),
+).functions.getAvailableMarkets()._encode_transaction_data()
+''',
+    'Registry (lazy)': '''
+client.gmx_frf_reader.manager.functions.getAvailableMarkets()._encode_transaction_data()
+''',
+    'Registry (all ABIs preloaded)': '''
+from goldlink.modules.abi_loader import ABI_FILE_PATHS
+from goldlink.modules.contract_registry import CONTRACT_REGISTRY
+for file_path in ABI_FILE_PATHS:
+    CONTRACT_REGISTRY.load_abi(file_path)
+client.gmx_frf_reader.manager.functions.getAvailableMarkets()._encode_transaction_data()
+''',
+}
+
+
+def run(first_call):
+    '''
+    Time import and first call preparation in fresh interpreters.
+
+    :param first_call: required
+    :type first_call: string
+
+    :returns: ([]float, []float)
+    '''
+    import_times = []
+    first_call_times = []
+    for _ in range(RUNS):
+        output = subprocess.check_output(
+            [sys.executable, '-c', STARTUP_SCRIPT.format(first_call=first_call)],
+        )
+        import_time, first_call_time = map(float, output.split())
+        import_times.append(import_time)
+        first_call_times.append(first_call_time)
+    return import_times, first_call_times
+
+
+for label, first_call in FIRST_CALLS.items():
+    import_times, first_call_times = run(first_call)
+    print(
+        f'{label}: import {statistics.median(import_times) * 1000:.1f} ms, '
+        f'first call {statistics.median(first_call_times) * 1000:.1f} ms',
+    )
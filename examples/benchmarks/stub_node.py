@@ -0,0 +1,196 @@
+'''
+Local JSON-RPC node for benchmarks. Answers `eth_call` to any function of the bundled
+ABIs with its zero value, including calls aggregated through Multicall3, and delays
+every HTTP request by a fixed latency to stand in for the round trip to a remote node.
+'''
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from eth_abi import decode_abi, encode_abi
+from web3 import Web3
+
+import goldlink.constants as Constants
+from goldlink.helpers import get_encodable_type
+from goldlink.modules.abi_loader import ABI_FILE_PATHS
+from goldlink.modules.contract_registry import CONTRACT_REGISTRY
+
+# Simulated round trip latency, in seconds.
+DEFAULT_LATENCY = 0.02
+
+# Chain the node reports.
+STUB_CHAIN_ID = Constants.NETWORK_ID_MAINNET
+
+# Block the node reports.
+STUB_BLOCK_NUMBER = 1000000
+
+
+class StubNode(object):
+    '''
+    JSON-RPC node served from a background thread, counting the HTTP requests it gets.
+    '''
+
+    def __init__(self, latency=DEFAULT_LATENCY):
+        self.latency = latency
+        self.request_count = 0
+        self._outputs_by_selector = _get_outputs_by_selector()
+        self._aggregate3_selector = CONTRACT_REGISTRY.get_function_selectors(
+            Constants.MULTICALL3_ABI,
+        )['aggregate3']
+        self._server = None
+
+    @property
+    def url(self):
+        '''
+        Get the URL the node is served on.
+        '''
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def start(self):
+        '''
+        Serve the node on a free local port.
+
+        :returns: string, URL of the node
+        '''
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                node.request_count += 1
+                time.sleep(node.latency)
+
+                if isinstance(body, list):
+                    response = [node.handle(request) for request in body]
+                else:
+                    response = node.handle(body)
+
+                payload = json.dumps(response).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self):
+        '''
+        Stop serving the node.
+        '''
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, request):
+        '''
+        Answer a single JSON-RPC request.
+
+        :param request: required
+        :type request: Object
+
+        :returns: Object
+        '''
+        method = request['method']
+        if method == 'eth_call':
+            result = '0x' + self.call(request['params'][0]['data']).hex()
+        elif method in ('eth_chainId', 'eth_blockNumber'):
+            result = hex(STUB_CHAIN_ID if method == 'eth_chainId' else STUB_BLOCK_NUMBER)
+        elif method == 'net_version':
+            result = str(STUB_CHAIN_ID)
+        else:
+            return {
+                'jsonrpc': '2.0',
+                'id': request['id'],
+                'error': {'code': -32601, 'message': f'Method {method} not supported'},
+            }
+
+        return {'jsonrpc': '2.0', 'id': request['id'], 'result': result}
+
+    def call(self, data):
+        '''
+        Get the zero valued return data of a call, by its selector.
+
+        :param data: required
+        :type data: string
+
+        :returns: bytes
+        '''
+        data = Web3.toBytes(hexstr=data)
+        selector = '0x' + data[:4].hex()
+
+        if selector == self._aggregate3_selector:
+            calls, = decode_abi(['(address,bool,bytes)[]'], data[4:])
+            return encode_abi(
+                ['(bool,bytes)[]'],
+                [[(True, self.call('0x' + call_data.hex())) for _, _, call_data in calls]],
+            )
+
+        output_types, output_values = self._outputs_by_selector[selector]
+        return encode_abi(output_types, output_values)
+
+
+def _get_outputs_by_selector():
+    '''
+    Get the output types and zero valued outputs of every bundled function.
+
+    :returns: Object
+    '''
+    outputs_by_selector = {}
+    for file_path in ABI_FILE_PATHS:
+        selectors = CONTRACT_REGISTRY.get_function_selectors(file_path)
+        for fragment in CONTRACT_REGISTRY.load_abi(file_path):
+            if fragment['type'] == 'function':
+                outputs_by_selector[selectors[fragment['name']]] = (
+                    [_get_type(output) for output in fragment['outputs']],
+                    [_get_zero_value(output) for output in fragment['outputs']],
+                )
+    return outputs_by_selector
+
+
+def _get_type(param):
+    '''
+    Get the encodable type of an ABI parameter, with tuples collapsed.
+
+    :returns: string
+    '''
+    abi_type = param['type']
+    if abi_type.startswith('tuple'):
+        components = ','.join(_get_type(component) for component in param['components'])
+        return f'({components}){abi_type[len("tuple"):]}'
+    return get_encodable_type(abi_type)
+
+
+def _get_zero_value(param, abi_type=None):
+    '''
+    Get the zero value of an ABI parameter.
+
+    :returns: any
+    '''
+    abi_type = abi_type or param['type']
+    if abi_type.endswith(']'):
+        length = abi_type[abi_type.rindex('[') + 1:-1]
+        element_type = abi_type[:abi_type.rindex('[')]
+        return [_get_zero_value(param, element_type) for _ in range(int(length or 0))]
+    if abi_type == 'tuple':
+        return tuple(_get_zero_value(component) for component in param['components'])
+
+    abi_type = get_encodable_type(abi_type)
+    if abi_type == 'address':
+        return '0x' + '00' * 20
+    if abi_type == 'bool':
+        return False
+    if abi_type == 'string':
+        return ''
+    if abi_type == 'bytes':
+        return b''
+    if abi_type.startswith('bytes'):
+        return b'\x00' * int(abi_type[len('bytes'):])
+    return 0
@@ -0,0 +1,44 @@
+'''
+Example for scanning a strategy bank for liquidatable strategy accounts every block,
+initiating the liquidation of each one found.
+
+Usage: python -m examples.liquidation_scanner
+'''
+
+import os
+from web3 import Web3
+from dotenv import load_dotenv
+
+from goldlink import Client
+from goldlink import constants
+from goldlink.modules.liquidation_scanner import LiquidationScanner
+
+load_dotenv()
+
+# Load in ENVVAR
+PRIVATE_KEY = os.getenv('TEST_ACCOUNT_3_PRIVATE_KEY')
+
+# Initialize client.
+client = Client(
+    network_id=constants.NETWORK_ID_FUJI,
+    web3=Web3(Web3.HTTPProvider(constants.WEB_PROVIDER_URL_FUJI)),
+    private_key=PRIVATE_KEY,
+    strategy_bank=constants.CONTRACTS[constants.BANK][constants.NETWORK_ID_FUJI],
+)
+
+options = {
+    'gasPrice': 25000000000
+}
+
+
+def initiate_liquidation(candidate):
+    print(f"Initiating liquidation for strategy account {candidate['strategy_account']}")
+    initiate_liquidation_transaction = client.writer.initiate_liquidation(
+        strategy_account=candidate['strategy_account'],
+        send_options=options
+    )
+    print("Initiate liquidation, transaction: ", initiate_liquidation_transaction)
+
+
+scanner = LiquidationScanner(client.reader, initiate_liquidation)
+scanner.run()
@@ -29,7 +29,9 @@ client = Client(
     web3=Web3(Web3.HTTPProvider(constants.WEB_PROVIDER_URL_ARBITRUM_MAINNET)),
 )
 
-print("Get settled funding fees: ", client.gmx_frf_reader.get_settled_funding_fees(STRATEGY_ACCOUNT, WETH_USDC, USDC, WETH))
+settled_fees = client.gmx_frf_reader.get_settled_funding_fees(STRATEGY_ACCOUNT, WETH_USDC, USDC, WETH)
+print("Get settled funding fees in USDC: ", settled_fees['short_token_amount_settled'])
+print("Get settled funding fees in WETH: ", settled_fees['long_token_amount_settled'])
 print("Get settled WETH funding fees: ", client.gmx_frf_reader.get_settled_funding_fees_for_token(STRATEGY_ACCOUNT, WETH_USDC, WETH))
 print("Get settled USDC funding fees: ", client.gmx_frf_reader.get_settled_funding_fees_for_token(STRATEGY_ACCOUNT, WETH_USDC, USDC))
 
@@ -0,0 +1,52 @@
+'''
+Example for batching strategy account actions into one multi-call transaction. Claims
+funding fees and collateral of a GMX market at once. Additionally, only works if
+a GMX position had been created. Use `python -m examples.strategies.gmx_frf.increase_position` to create a
+GMX position on Fuji.
+
+Usage: python -m examples.strategies.gmx_frf.multi_call
+'''
+
+import os
+from web3 import Web3
+from dotenv import load_dotenv
+
+from goldlink import Client
+from goldlink import constants
+
+load_dotenv()
+
+# Load in ENVVAR
+PUBLIC_KEY = os.getenv('TEST_OWNER_PUBLIC_KEY')
+PRIVATE_KEY = os.getenv('TEST_OWNER_PRIVATE_KEY')
+STRATEGY_ACCOUNT = os.getenv('GMX_FRF_ACCOUNT')
+CLAIM_TIME_KEY = int(os.getenv('GMX_CLAIM_TIME_KEY', '0'))
+
+# Market
+AVAX_USDC = "0xD996ff47A1F763E1e55415BC4437c59292D1F415"
+
+# Initialize client.
+client = Client(
+    network_id=constants.NETWORK_ID_FUJI,
+    web3=Web3(Web3.HTTPProvider(constants.WEB_PROVIDER_URL_FUJI)),
+    private_key=PRIVATE_KEY,
+)
+
+client.strategy_account = STRATEGY_ACCOUNT
+
+options = {
+    'gasPrice': 25000000000
+}
+
+USDC = constants.CONTRACTS[constants.ASSET_USDC][constants.NETWORK_ID_FUJI]
+
+# Claim funding fees and collateral in one transaction.
+print("Claiming fees and collateral for a GMX Market position in one multi-call")
+multi_call_transaction = (
+    client.gmx_frf_writer.build_multi_call()
+    .claim_funding_fees(markets=[AVAX_USDC], assets=[USDC])
+    .claim_collateral(market=AVAX_USDC, asset=USDC, time_key=CLAIM_TIME_KEY)
+    .send(send_options=options)
+)
+receipt = client.gmx_frf_writer.wait_for_transaction(multi_call_transaction)
+print("Multi-call events: ", client.gmx_frf_event_handler.decode_receipt(receipt))
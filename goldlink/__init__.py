@@ -1,5 +1,6 @@
 """Module providing access to GoldLink Client and Constants."""
 
 from goldlink.goldlink_client import Client
+from goldlink.async_goldlink_client import AsyncClient
 import goldlink.constants as Constants
 import goldlink.modules.strategies.gmx_frf.constants as GMX_FRF_CONSTANTS
@@ -0,0 +1,299 @@
+"""The asynchronous GoldLink Client for interacting with the protocol."""
+
+from aiohttp import ClientSession, ClientTimeout
+from web3 import Web3
+from web3.eth import AsyncEth
+from web3.net import AsyncNet
+from web3.providers.async_rpc import AsyncHTTPProvider
+
+from goldlink.modules.async_reader import AsyncReader
+from goldlink.modules.async_writer import AsyncWriter
+from goldlink.modules.event_handler import EventHandler
+from goldlink.modules.event_stream import EventStream
+from goldlink.modules.strategies.gmx_frf.async_gmx_frf_reader import AsyncGmxFrfReader
+from goldlink.modules.strategies.gmx_frf.async_gmx_frf_writer import AsyncGmxFrfWriter
+from goldlink.modules.strategies.gmx_frf.gmx_frf_event_handler import GmxFrfEventHandler
+from goldlink.constants import NETWORK_ID_MAINNET, DEFAULT_API_TIMEOUT
+from goldlink.signing.signer import SignWithKey
+
+
+class AsyncClient(object):
+    '''
+    Asynchronous client users of the GoldLink-Client-Python can interact with the
+    GoldLink Protocol through from asyncio code. Offers the modules of `Client`, with
+    reader and writer methods returning coroutines. Requests share one aiohttp session,
+    opened by `connect` and closed by `close`, or by using the client as an async
+    context manager.
+    '''
+
+    def __init__(
+        self,
+        send_options=None,
+        api_timeout=None,
+        async_web3=None,
+        network_id=None,
+        private_key=None,
+        web3_account=None,
+        async_web3_provider=None,
+        host=None,
+        session=None,
+        strategy_reserve=None,
+        strategy_bank=None,
+        strategy_account=None,
+        market_metadata_path=None,
+    ):
+        # Set Contracts if input.
+        self.strategy_reserve = strategy_reserve
+        self.strategy_bank = strategy_bank
+        self.strategy_account = strategy_account
+
+        # Set API parameters if input.
+        self.send_options = send_options or {}
+        self.api_timeout = api_timeout or DEFAULT_API_TIMEOUT
+
+        # Set where GMX market metadata is persisted, if anywhere.
+        self.market_metadata_path = market_metadata_path
+
+        # Default web3 related parameters to None.
+        self.async_web3 = None
+        self.signer = None
+        self.default_address = None
+
+        # A passed in session is left open on close, a session opened on connect is closed.
+        self.session = session
+        self._owns_session = False
+
+        # Trust a passed in network ID. Otherwise it is read on connect.
+        self._network_id = int(network_id) if network_id else None
+        self._detect_network_id = False
+
+        # If async web3 or async web3 provider, set async web3.
+        if async_web3 is not None or async_web3_provider is not None:
+            if isinstance(async_web3_provider, str):
+                async_web3_provider = self._create_provider(async_web3_provider)
+            self.async_web3 = async_web3 or self._create_async_web3(async_web3_provider)
+            self._detect_network_id = True
+
+        # If a private key was passed in or a web3 account, set signer and default address.
+        if private_key is not None or web3_account is not None:
+            key = private_key or web3_account.key
+            self.signer = SignWithKey(key)
+            self.default_address = self.signer.address
+
+        # Make sure async web3 is/can be set or revert.
+        if not self.async_web3 and not host:
+            raise Exception(
+                'Async web3 not passed in and cannot set async web3 with no host or ' +
+                'async web3 provider.'
+            )
+        self.async_web3 = self.async_web3 or self._create_async_web3(self._create_provider(host))
+
+        # Contract functions are built, encoded, decoded and signed without a provider.
+        self.web3 = Web3()
+
+        # Modules are initialized on demand, so constructing a client makes no requests.
+        self._reader = None
+        self._gmx_frf_reader = None
+        self._event_handler = None
+        self._gmx_frf_event_handler = None
+        self._writer = None
+        self._gmx_frf_writer = None
+
+    async def connect(self):
+        '''
+        Open the aiohttp session requests are sent through and, unless passed in, read
+        the network ID.
+
+        :returns: AsyncClient
+        '''
+        provider = self.async_web3.provider
+        if isinstance(provider, AsyncHTTPProvider):
+            if self.session is None:
+                self.session = ClientSession()
+                self._owns_session = True
+            await provider.cache_async_session(self.session)
+
+        if self._network_id is None and self._detect_network_id:
+            self._network_id = int(await self.async_web3.net.version)
+        return self
+
+    async def close(self):
+        '''
+        Close the aiohttp session, if opened by `connect`.
+        '''
+        if self._owns_session:
+            await self.session.close()
+            self.session = None
+            self._owns_session = False
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def network_id(self):
+        '''
+        Get the network ID. Unless passed in, it is read on connect if async web3 or an
+        async web3 provider was given, and defaults to mainnet otherwise.
+        '''
+        if self._network_id is None:
+            if self._detect_network_id:
+                raise Exception(
+                    'Network ID is read on connect, await connect() before using modules.'
+                )
+            self._network_id = NETWORK_ID_MAINNET
+        return self._network_id
+
+    @network_id.setter
+    def network_id(self, network_id):
+        self._network_id = int(network_id)
+
+    def _create_async_web3(self, provider):
+        '''
+        Create async web3 for `provider`.
+
+        :param provider: required
+        :type provider: AsyncBaseProvider
+
+        :returns: Web3
+        '''
+        return Web3(
+            provider,
+            modules={'eth': (AsyncEth,), 'net': (AsyncNet,)},
+            middlewares=[],
+        )
+
+    def _create_provider(self, endpoint_uri):
+        '''
+        Create an async HTTP provider for `endpoint_uri`.
+
+        :param endpoint_uri: required
+        :type endpoint_uri: string
+
+        :returns: AsyncHTTPProvider
+        '''
+        return AsyncHTTPProvider(
+            endpoint_uri,
+            request_kwargs={'timeout': ClientTimeout(total=self.api_timeout)},
+        )
+
+    @property
+    def reader(self):
+        '''
+        Get the async reader module, used for reading from protocol.
+        '''
+        if not self._reader:
+            self._reader = AsyncReader(
+                web3=self.web3,
+                async_web3=self.async_web3,
+                network_id=self.network_id,
+                strategy_bank=self.strategy_bank,
+                strategy_reserve=self.strategy_reserve,
+            )
+        return self._reader
+
+    @property
+    def gmx_frf_reader(self):
+        '''
+        Get the async GMX Funding-rate Farming reader module, used for reading from
+        protocol for GMX Funding-rate Farming Strategy.
+        '''
+        if not self._gmx_frf_reader:
+            self._gmx_frf_reader = AsyncGmxFrfReader(
+                web3=self.web3,
+                async_web3=self.async_web3,
+                network_id=self.network_id,
+                market_metadata_path=self.market_metadata_path,
+            )
+        return self._gmx_frf_reader
+
+    @property
+    def event_handler(self):
+        '''
+        Get the event handler module, used for handling events emitted from the protocol.
+        '''
+        if not self._event_handler:
+            self._event_handler = EventHandler(web3=self.web3)
+        return self._event_handler
+
+    @property
+    def gmx_frf_event_handler(self):
+        '''
+        Get the GMX Funding-rate Farming strategy event handler module, used for handling events
+        emitted from the protocol for GMX Funding-rate Farming Strategy.
+        '''
+        if not self._gmx_frf_event_handler:
+            self._gmx_frf_event_handler = GmxFrfEventHandler(web3=self.web3)
+        return self._gmx_frf_event_handler
+
+    def create_event_stream(self, websocket_uri=None, **kwargs):
+        '''
+        Create a stream of the events emitted from the protocol, pushed over
+        `websocket_uri` if given and polled through async web3 otherwise. Takes the
+        other arguments of `EventStream`.
+
+        :param websocket_uri: optional
+        :type websocket_uri: string
+
+        :returns: EventStream
+        '''
+        return EventStream(self.async_web3, websocket_uri=websocket_uri, **kwargs)
+
+    @property
+    def writer(self):
+        '''
+        Get the async writer module, used for sending transactions to the protocol.
+        '''
+        if not self._writer:
+            private_key = getattr(self.signer, '_private_key', None)
+            if private_key:
+                self._writer = AsyncWriter(
+                    web3=self.web3,
+                    async_web3=self.async_web3,
+                    private_key=private_key,
+                    default_address=self.default_address,
+                    send_options=self.send_options,
+                    strategy_bank=self.strategy_bank,
+                    strategy_reserve=self.strategy_reserve,
+                    strategy_account=self.strategy_account,
+                )
+            else:
+                raise Exception(
+                    'Writer module is not supported since neither ' +
+                    'private_key nor web3_account was provided',
+                )
+
+        if self.strategy_account and not self._writer.strategy_account:
+            self._writer.set_strategy_account(self.strategy_account)
+
+        return self._writer
+
+    @property
+    def gmx_frf_writer(self):
+        '''
+        Get the async GMX Funding-Rate Farming Writer module, used for sending strategy
+        specific transactions to the protocol for GMX Funding-rate Farming Strategy.
+        '''
+        if not self._gmx_frf_writer:
+            private_key = getattr(self.signer, '_private_key', None)
+            if private_key:
+                self._gmx_frf_writer = AsyncGmxFrfWriter(
+                    web3=self.web3,
+                    async_web3=self.async_web3,
+                    private_key=private_key,
+                    default_address=self.default_address,
+                    send_options=self.send_options,
+                    strategy_account=self.strategy_account,
+                )
+            else:
+                raise Exception(
+                    'GMX Funding-Rate Farming Writer module is not supported since neither ' +
+                    'private_key nor web3_account was provided',
+                )
+
+        if self.strategy_account and not self._gmx_frf_writer.strategy_account:
+            self._gmx_frf_writer.set_strategy_account(self.strategy_account)
+
+        return self._gmx_frf_writer
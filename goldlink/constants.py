@@ -21,6 +21,7 @@ ASSET_USDC = 'USDC'
 CONTROLLER = 'Controller'
 BANK = 'Bank'
 RESERVE = 'Reserve'
+MULTICALL3 = 'Multicall3'
 
 # ------------ Transactions ------------
 DEFAULT_GAS_AMOUNT = 2500000
@@ -45,19 +46,76 @@ CONTRACTS = {
     RESERVE: {
         NETWORK_ID_MAINNET: '0xd8dD54dF1A7d2EA022B983756d8a481Eea2a382a',
         NETWORK_ID_FUJI: '0x4b927EC02cFAB1237eA9e13d5568850Dc0FDFBF5'
+    },
+    MULTICALL3: {
+        NETWORK_ID_MAINNET: '0xcA11bde05977b3631167028862bE2a173976CA11',
+        NETWORK_ID_FUJI: '0xcA11bde05977b3631167028862bE2a173976CA11'
     }
 }
 COLLATERAL_TOKEN_DECIMALS = 6
 DEFAULT_GAS_PRICE_ADDITION = 3
 
+# ------------ Contract Registry Defaults ------------
+DEFAULT_MAX_CACHED_CONTRACTS = 1024
+
+# ------------ Nonce Defaults ------------
+DEFAULT_MAX_NONCE_RESYNCS = 3
+DEFAULT_NONCE_GAP_CHECK_INTERVAL = 10
+
+# ------------ Fee Oracle Defaults ------------
+DEFAULT_FEE_MAX_AGE = 0.25
+DEFAULT_FEE_HISTORY_BLOCKS = 5
+DEFAULT_PRIORITY_FEE_PERCENTILE = 50
+DEFAULT_BASE_FEE_MULTIPLIER = 2
+
+# ------------ Gas Estimator Defaults ------------
+DEFAULT_GAS_PERCENTILE = 95
+DEFAULT_MIN_GAS_SAMPLES = 3
+DEFAULT_MAX_GAS_SAMPLES = 20
+DEFAULT_MAX_TRACKED_TRANSACTIONS = 1000
+
+# ------------ Transaction Pipeline Defaults ------------
+DEFAULT_TRANSACTION_TIMEOUT = 120
+
 # ------------ API Defaults ------------
 DEFAULT_API_TIMEOUT = 3000
 
+# ------------ Batch Read Defaults ------------
+DEFAULT_MULTICALL_BATCH_SIZE = 100
+DEFAULT_MAX_BATCH_SIZE = 50
+DEFAULT_BATCH_FLUSH_INTERVAL = 0.005
+
+# ------------ Concurrent Read Defaults ------------
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+
+# ------------ Liquidation Scanner Defaults ------------
+ONE_HUNDRED_PERCENT = 10 ** 18
+DEFAULT_RISKY_HEALTH_SCORE_MARGIN = 10 ** 17
+DEFAULT_RISKY_CHECK_INTERVAL = 1
+DEFAULT_SAFE_CHECK_INTERVAL = 20
+DEFAULT_BLOCK_POLL_INTERVAL = 1
+DEFAULT_MAX_SCAN_BACKOFF = 30
+
+# ------------ Log Backfill Defaults ------------
+DEFAULT_LOG_CHUNK_SIZE = 2000
+DEFAULT_MAX_LOG_CHUNK_SIZE = 100000
+DEFAULT_TARGET_LOGS_PER_CHUNK = 1000
+
+# ------------ Event Store Defaults ------------
+DEFAULT_REORG_DEPTH = 64
+DEFAULT_EVENT_STORE_BATCH_SIZE = 1000
+
+# ------------ Event Stream Defaults ------------
+DEFAULT_EVENT_QUEUE_SIZE = 1000
+
 # ------------ GoldLink Protocol ABI Paths ------------
 ERC20 = 'abi/erc20.json'
 STRATEGY_ACCOUNT_ABI = 'abi/strategy-account.json'
 STRATEGY_BANK_ABI = 'abi/strategy-bank.json'
 STRATEGY_RESERVE_ABI = 'abi/strategy-reserve.json'
+MULTICALL3_ABI = 'abi/multicall3.json'
 
 # ------------ GoldLink Protocol GMX FRF ABI Paths ------------
 
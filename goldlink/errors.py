@@ -14,3 +14,13 @@ class TransactionReverted(GoldLinkError):
 
     def __init__(self, transaction_receipt):
         self.transaction_receipt = transaction_receipt
+
+
+class RpcError(GoldLinkError):
+    '''
+    Class representing an error returned by a JSON-RPC node.
+    '''
+
+    def __init__(self, error):
+        super().__init__(error)
+        self.error = error
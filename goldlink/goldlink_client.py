@@ -1,13 +1,18 @@
 """The GoldLink Client for interacting with the protocol."""
 
 from web3 import Web3
+from web3.middleware import construct_simple_cache_middleware
 
+from goldlink.modules.batch_http_provider import BatchHTTPProvider
 from goldlink.modules.reader import Reader
 from goldlink.modules.event_handler import EventHandler
+from goldlink.modules.log_fetcher import LogFetcher
+from goldlink.modules.transaction_pipeline import TransactionPipeline
 from goldlink.modules.writer import Writer
 from goldlink.modules.strategies.gmx_frf.gmx_frf_writer import GmxFrfWriter
 from goldlink.modules.strategies.gmx_frf.gmx_frf_event_handler import GmxFrfEventHandler
 from goldlink.modules.strategies.gmx_frf.gmx_frf_reader import GmxFrfReader
+from goldlink.modules.strategies.gmx_frf.market_scanner import MarketScanner
 from goldlink.constants import NETWORK_ID_MAINNET, DEFAULT_API_TIMEOUT
 from goldlink.signing.signer import SignWithWeb3, SignWithKey
 
@@ -31,6 +36,10 @@ class Client(object):
         strategy_reserve=None,
         strategy_bank=None,
         strategy_account=None,
+        batch_requests=False,
+        max_batch_size=None,
+        batch_flush_interval=None,
+        market_metadata_path=None,
     ):
         # Set Contracts if input.
         self.strategy_reserve = strategy_reserve
@@ -41,21 +50,34 @@ class Client(object):
         self.send_options = send_options or {}
         self.api_timeout = api_timeout or DEFAULT_API_TIMEOUT
 
+        # Set JSON-RPC batching parameters, used for providers created from a URL.
+        self.batch_requests = batch_requests
+        self.max_batch_size = max_batch_size
+        self.batch_flush_interval = batch_flush_interval
+
+        # Set where GMX market metadata is persisted, if anywhere.
+        self.market_metadata_path = market_metadata_path
+
         # Default web3 related parameters to None.
         self.web3 = None
         self.signer = None
-        self.network_id = None
+        self.default_address = None
+
+        # Trust a passed in network ID. Otherwise it is resolved on first use.
+        self._network_id = int(network_id) if network_id else None
+        self._detect_network_id = False
 
-        # If web3 or web3 provider, set web3, signer, default address and network id.
+        # Providers created from a URL are closed on close.
+        self._created_provider = None
+
+        # If web3 or web3 provider, set web3, signer and default address.
         if web3 is not None or web3_provider is not None:
             if isinstance(web3_provider, str):
-                web3_provider = Web3.HTTPProvider(
-                    web3_provider, request_kwargs={'timeout': self.api_timeout}
-                )
-            self.web3 = web3 or Web3(web3_provider)
+                web3_provider = self._created_provider = self._create_provider(web3_provider)
+            self.web3 = web3 or self._create_web3(web3_provider)
             self.signer = SignWithWeb3(self.web3)
             self.default_address = self.web3.eth.defaultAccount or None
-            self.network_id = self.web3.net.version
+            self._detect_network_id = True
 
         # If a private key was passed in or a web3 account, set signer and default address.
         if private_key is not None or web3_account is not None:
@@ -65,39 +87,101 @@ class Client(object):
             self.default_address = self.signer.address
 
         # Make sure web3 is/can be set or revert.
-        if not web3 and not host:
+        if not self.web3 and not host:
             raise Exception(
                 'Web3 not passed in and cannot set web3 with no host or web3 provider.'
             )
-        self.web3 = web3 or Web3(Web3.HTTPProvider(host))
-
-        # Set default network ID.
-        self.network_id = int(
-            network_id or self.network_id or NETWORK_ID_MAINNET
-        )
+        if not self.web3:
+            self._created_provider = self._create_provider(host)
+            self.web3 = self._create_web3(self._created_provider)
 
-        # Initialize the reader and event handler modules. Other modules are initialized on
-        # demand, if the necessary configuration options were provided.
-        self._reader = Reader(
-            web3=self.web3,
-            network_id=self.network_id,
-            strategy_bank=self.strategy_bank,
-            strategy_reserve=self.strategy_reserve,
-        )
-        self._gmx_frf_reader = GmxFrfReader(
-            web3=self.web3,
-            network_id=self.network_id,
-        )
-        self._event_handler = EventHandler(web3=self.web3)
-        self._gmx_frf_event_handler = GmxFrfEventHandler(web3=self.web3)
+        # Modules are initialized on demand, so constructing a client makes no requests.
+        self._reader = None
+        self._gmx_frf_reader = None
+        self._gmx_frf_market_scanner = None
+        self._event_handler = None
+        self._gmx_frf_event_handler = None
+        self._log_fetcher = None
         self._writer = None
         self._gmx_frf_writer = None
 
+    def close(self):
+        '''
+        Release the thread pool of the reader and the connections of a provider created
+        from a URL.
+        '''
+        if self._reader:
+            self._reader.close()
+        if isinstance(self._created_provider, BatchHTTPProvider):
+            self._created_provider.close()
+
+    @property
+    def network_id(self):
+        '''
+        Get the network ID. Unless passed in, it is read from the node on first use if
+        web3 or a web3 provider was given, and defaults to mainnet otherwise.
+        '''
+        if self._network_id is None:
+            self._network_id = (
+                int(self.web3.net.version) if self._detect_network_id else NETWORK_ID_MAINNET
+            )
+        return self._network_id
+
+    @network_id.setter
+    def network_id(self, network_id):
+        self._network_id = int(network_id)
+
+    def _create_web3(self, provider):
+        '''
+        Create web3 for `provider`. The chain ID, which web3 requests before every
+        contract call, is cached since it never changes for a provider.
+
+        :param provider: required
+        :type provider: BaseProvider
+
+        :returns: Web3
+        '''
+        web3 = Web3(provider)
+        web3.middleware_onion.add(
+            construct_simple_cache_middleware(
+                cache_class=dict,
+                rpc_whitelist={'eth_chainId', 'net_version'},
+            ),
+            name='chain_id_cache',
+        )
+        return web3
+
+    def _create_provider(self, endpoint_uri):
+        '''
+        Create an HTTP provider for `endpoint_uri`, batching JSON-RPC requests if enabled.
+
+        :param endpoint_uri: required
+        :type endpoint_uri: string
+
+        :returns: HTTPProvider
+        '''
+        request_kwargs = {'timeout': self.api_timeout}
+        if self.batch_requests:
+            return BatchHTTPProvider(
+                endpoint_uri,
+                request_kwargs=request_kwargs,
+                max_batch_size=self.max_batch_size,
+                flush_interval=self.batch_flush_interval,
+            )
+        return Web3.HTTPProvider(endpoint_uri, request_kwargs=request_kwargs)
+
     @property
     def reader(self):
         '''
         Get the reader module, used for reading from protocol.
         '''
+        if not self._reader:
+            self._reader = Reader(
+                web3=self.web3,
+                network_id=self.network_id,
+                strategy_bank=self.strategy_bank,
+                strategy_reserve=self.strategy_reserve,
+            )
         return self._reader
 
     @property
@@ -106,13 +190,31 @@ class Client(object):
         Get th GMX Funding-rate Farming reader module, used for reading from protocol for
         GMX Funding-rate Farming Strategy.
         '''
+        if not self._gmx_frf_reader:
+            self._gmx_frf_reader = GmxFrfReader(
+                web3=self.web3,
+                network_id=self.network_id,
+                market_metadata_path=self.market_metadata_path,
+            )
         return self._gmx_frf_reader
 
+    @property
+    def gmx_frf_market_scanner(self):
+        '''
+        Get the GMX Funding-rate Farming market scanner module, used for ranking the
+        strategy markets by funding rate. Requires NumPy.
+        '''
+        if not self._gmx_frf_market_scanner:
+            self._gmx_frf_market_scanner = MarketScanner(self.gmx_frf_reader)
+        return self._gmx_frf_market_scanner
+
     @property
     def event_handler(self):
         '''
         Get the event handler module, used for handling events emitted from the protocol.
         '''
+        if not self._event_handler:
+            self._event_handler = EventHandler(web3=self.web3)
         return self._event_handler
 
     @property
@@ -121,8 +223,19 @@ class Client(object):
         Get the GMX Funding-rate Farming strategy event handler module, used for handling events
         emitted from the protocol for GMX Funding-rate Farming Strategy.
         '''
+        if not self._gmx_frf_event_handler:
+            self._gmx_frf_event_handler = GmxFrfEventHandler(web3=self.web3)
         return self._gmx_frf_event_handler
 
+    @property
+    def log_fetcher(self):
+        '''
+        Get the log fetcher module, used for backfilling events emitted from the protocol.
+        '''
+        if not self._log_fetcher:
+            self._log_fetcher = LogFetcher(web3=self.web3)
+        return self._log_fetcher
+
     @property
     def writer(self):
         '''
@@ -179,3 +292,16 @@ class Client(object):
             self._gmx_frf_writer.set_strategy_account(self.strategy_account)
 
         return self._gmx_frf_writer
+
+    def create_transaction_pipeline(self, writer=None, **kwargs):
+        '''
+        Create a pipeline sending transactions through `writer`, the writer module by
+        default, and tracking their receipts together. Takes the other arguments of
+        `TransactionPipeline`.
+
+        :param writer: optional
+        :type writer: Writer | GmxFrfWriter
+
+        :returns: TransactionPipeline
+        '''
+        return TransactionPipeline(writer or self.writer, **kwargs)
@@ -1,7 +1,27 @@
 """General helpers for sending/handling blockchain queries."""
 
-from web3 import Web3
+import functools
+import itertools
+import json
+import time
+
 import requests
+from eth_abi import encode_abi, decode_abi
+from eth_abi.exceptions import DecodingError
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.contracts import encode_abi as encode_function_call
+from web3._utils.events import get_event_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import make_post_request
+from web3.exceptions import ContractLogicError, LogTopicError, MismatchedABI
+
+from goldlink.constants import DEFAULT_API_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_RETRY_BACKOFF
+from goldlink.errors import RpcError
+from goldlink.modules.contract_registry import CONTRACT_REGISTRY
+
+# Ids for raw JSON-RPC requests, unique within the process.
+_raw_query_ids = itertools.count(1)
 
 
 def handle_event(event):
@@ -16,14 +36,185 @@ def handle_event(event):
     return event[0]['args']
 
 
+def decode_receipt(web3, transaction_receipt, file_paths=None):
+    '''
+    Decode every event of a receipt in one pass, dispatching each log on its topic to
+    the event ABIs of the bundled ABIs. Logs of other events are skipped.
+
+    :param web3: required
+    :type web3: Web3
+
+    :param transaction_receipt: required
+    :type transaction_receipt: transactionReceipt
+
+    :param file_paths: optional
+    :type file_paths: []string, every bundled ABI by default
+
+    :returns: []AttributeDict, in log order
+    '''
+    event_abis_by_topic = CONTRACT_REGISTRY.get_merged_event_abis_by_topic(file_paths)
+
+    events = []
+    for log in transaction_receipt['logs']:
+        event = decode_log(web3, event_abis_by_topic, log)
+        if event is not None:
+            events.append(event)
+
+    return events
+
+
+def decode_log(web3, event_abis_by_topic, log):
+    '''
+    Decode a log with the first of the event ABIs for its topic that matches it.
+
+    :param web3: required
+    :type web3: Web3
+
+    :param event_abis_by_topic: required
+    :type event_abis_by_topic: Object, []event ABI per topic
+
+    :param log: required
+    :type log: LogReceipt
+
+    :returns: AttributeDict | None, None if no event ABI matches
+    '''
+    if not log['topics']:
+        return None
+
+    for event_abi in event_abis_by_topic.get(log['topics'][0].hex(), ()):
+        try:
+            return get_event_data(web3.codec, event_abi, log)
+        except (MismatchedABI, LogTopicError, DecodingError):
+            # The same event declared with different indexed parameters.
+            continue
+
+    return None
+
+
+def decode_function_result(web3, function_abi, return_data):
+    '''
+    Decode the return data of a contract function the same way `.call()` does.
+
+    :param web3: required
+    :type web3: Web3
+
+    :param function_abi: required
+    :type function_abi: dict
+
+    :param return_data: required
+    :type return_data: bytes
+
+    :returns: any
+    '''
+    output_types = get_abi_output_types(function_abi)
+    decoded = web3.codec.decode_abi(output_types, return_data)
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+
+    if len(normalized) == 1:
+        return normalized[0]
+    return normalized
+
+
+@functools.lru_cache(maxsize=None)
+def get_function_selector(function_signature):
+    '''
+    Get the 4-byte selector of a function signature, e.g. `balanceOf(address)`.
+
+    :param function_signature: required
+    :type function_signature: string
+
+    :returns: string
+    '''
+    return Web3.keccak(text=function_signature)[:4].hex()
+
+
+def get_encodable_type(abi_type):
+    '''
+    Get the type a raw ABI type is encoded as. Library ABIs name contract parameters
+    by their interface, e.g. `IGmxFrfStrategyManager`, which are encoded as addresses.
+
+    :param abi_type: required
+    :type abi_type: string
+
+    :returns: string
+    '''
+    if abi_type[:1].isupper():
+        return 'address'
+    return abi_type
+
+
+class RawContractFunction(object):
+    '''
+    Contract function called by its raw signature, for library ABIs that web3 cannot
+    bind. Exposes the parts of a web3 contract function used for reading, so it can also
+    be batched with `call_many`.
+    '''
+
+    def __init__(
+        self,
+        web3,
+        address,
+        abi,
+        *args
+    ):
+        self.web3 = web3
+        self.address = address
+        self.abi = abi
+        self.fn_name = abi['name']
+        self.args = args
+        self.selector = get_function_selector(
+            '{}({})'.format(abi['name'], ','.join(i['type'] for i in abi['inputs'])),
+        )
+
+        # ABI with contract parameter types replaced by `address`, used for encoding.
+        self._encodable_abi = dict(
+            abi,
+            inputs=[dict(i, type=get_encodable_type(i['type'])) for i in abi['inputs']],
+        )
+
+    def _encode_transaction_data(self):
+        '''
+        Encode the selector and arguments of the call.
+
+        :returns: string
+        '''
+        if not self.args:
+            return self.selector
+        return encode_function_call(self.web3, self._encodable_abi, self.args, self.selector)
+
+    def call(self, block_identifier='latest'):
+        '''
+        Call the function through the web3 provider and decode its result.
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: any
+        '''
+        return_data = self.web3.eth.call(
+            {
+                'to': self.address,
+                'data': self._encode_transaction_data(),
+            },
+            block_identifier,
+        )
+        return decode_function_result(self.web3, self.abi, return_data)
+
+
 def send_raw_query(
         node_url,
         contract_address,
         function_signature,
-        *args
+        *args,
+        output_types=('uint256',),
+        block_identifier='latest',
+        timeout=None
 ):
     '''
-    Send a raw query to a contract.
+    Send a raw query to a contract. Arguments are ABI encoded using the types in
+    `function_signature`, where non-elementary names such as `IGmxFrfStrategyManager`
+    are encoded as addresses. Requests reuse the pooled HTTP session web3 keeps for
+    `node_url`.
 
     :param node_url: required
     :type node_url: string
@@ -34,16 +225,34 @@ def send_raw_query(
     :param function_signature: required
     :type function_signature: string
 
+    :param output_types: optional
+    :type output_types: []string
+
+    :param block_identifier: optional
+    :type block_identifier: integer | string
+
+    :param timeout: optional
+    :type timeout: number
+
     :returns: any
+
+    :raises: RpcError
     '''
-    # Encode function call
-    function_call_data = Web3.keccak(text=function_signature)[:4].hex()
+    # Encode function call.
+    input_types = [
+        get_encodable_type(t)
+        for t in function_signature[function_signature.index('(') + 1:-1].split(',') if t
+    ]
+    function_call_data = get_function_selector(function_signature) + encode_abi(
+        input_types,
+        [
+            Web3.toBytes(hexstr=arg) if t.startswith('bytes') and isinstance(arg, str) else arg
+            for t, arg in zip(input_types, args)
+        ],
+    ).hex()
 
-    # Encode parameters
-    for arg in args:
-        hex_arg = Web3.toBytes(hexstr=arg)
-        padded_hex_arg = hex_arg.rjust(32, b'\x00')
-        function_call_data += padded_hex_arg.hex()
+    if isinstance(block_identifier, int):
+        block_identifier = hex(block_identifier)
 
     # Construct `data` to send.
     data = {
@@ -54,16 +263,62 @@ def send_raw_query(
                 "to": contract_address,
                 "data": function_call_data
             },
-            "latest",
+            block_identifier,
         ],
-        "id": 1
+        "id": next(_raw_query_ids)
     }
 
-    # Send the JSON-RPC request
-    response = requests.post(node_url, json=data)
+    # Send the JSON-RPC request.
+    response = json.loads(make_post_request(
+        node_url,
+        json.dumps(data).encode('utf-8'),
+        timeout=timeout or DEFAULT_API_TIMEOUT,
+    ))
+    if 'error' in response:
+        raise RpcError(response['error'])
+
+    # Decode the response.
+    result = decode_abi(list(output_types), Web3.toBytes(hexstr=response['result']))
+    if len(result) == 1:
+        return result[0]
+    return result
 
-    # Parse the response
-    result_hex = response.json()["result"]
-    result_decoded = int(result_hex, 16)
 
-    return result_decoded
+def call_with_retries(
+    function,
+    max_retries=DEFAULT_MAX_RETRIES,
+    retry_backoff=DEFAULT_RETRY_BACKOFF,
+    rate_limiter=None,
+):
+    '''
+    Call `function`, retrying with exponential backoff when the request fails. Reverts
+    are deterministic, so they are raised without retrying.
+
+    :param function: required
+    :type function: function, taking no arguments
+
+    :param max_retries: optional
+    :type max_retries: integer
+
+    :param retry_backoff: optional
+    :type retry_backoff: number, seconds before the first retry
+
+    :param rate_limiter: optional
+    :type rate_limiter: RateLimiter, acquired before every attempt
+
+    :returns: any
+
+    :raises: RequestException, RpcError, ValueError
+    '''
+    for attempt in itertools.count():
+        if rate_limiter:
+            rate_limiter.acquire()
+        try:
+            return function()
+        except ContractLogicError:
+            raise
+        except (requests.exceptions.RequestException, RpcError, ValueError):
+            # Nodes report rate limits and transient failures as JSON-RPC errors.
+            if attempt >= max_retries:
+                raise
+            time.sleep(retry_backoff * 2 ** attempt)
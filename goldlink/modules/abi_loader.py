@@ -0,0 +1,80 @@
+"""Module providing loading of the ABIs shipped with GoldLink."""
+
+import json
+import os
+
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector
+
+import goldlink.constants as Constants
+
+# ABIs shipped with the package.
+ABI_FILE_PATHS = [
+    Constants.ERC20,
+    Constants.STRATEGY_ACCOUNT_ABI,
+    Constants.STRATEGY_BANK_ABI,
+    Constants.STRATEGY_RESERVE_ABI,
+    Constants.MULTICALL3_ABI,
+    Constants.GMX_FRF_STRATEGY_ACCOUNT_ABI,
+    Constants.GMX_FRF_STRATEGY_MANAGER_ABI,
+    Constants.GMX_FRF_ACCOUNT_GETTERS_ABI,
+    Constants.GMX_V2_READER_ABI,
+    Constants.IGMX_V2_DATASTORE_ABI,
+]
+
+
+def compile_function_selectors(abi):
+    '''
+    Compute the selector of every function of an ABI.
+
+    :param abi: required
+    :type abi: []Object
+
+    :returns: Object, selector per function name
+    '''
+    return {
+        f['name']: '0x' + function_abi_to_4byte_selector(f).hex()
+        for f in abi if f.get('type') == 'function'
+    }
+
+
+def compile_event_topics(abi):
+    '''
+    Compute the topic of every non-anonymous event of an ABI.
+
+    :param abi: required
+    :type abi: []Object
+
+    :returns: Object, event ABI per topic
+    '''
+    return {
+        '0x' + event_abi_to_log_topic(f).hex(): f
+        for f in abi if f.get('type') == 'event' and not f.get('anonymous')
+    }
+
+
+def load_json_abi(file_path):
+    '''
+    Load and parse a bundled JSON ABI.
+
+    :param file_path: required
+    :type file_path: string
+
+    :returns: []Object
+
+    :raises: FileNotFoundError
+    '''
+    with open(_get_goldlink_path(file_path), 'r') as abi_file:
+        return json.load(abi_file)
+
+
+def _get_goldlink_path(file_path):
+    '''
+    Get the absolute path of a file in the `goldlink` folder.
+
+    :returns: string
+    '''
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        '..',
+        file_path,
+    )
@@ -0,0 +1,128 @@
+"""Module providing an index of strategy account holdings for a GoldLink Strategy Bank."""
+
+import goldlink.constants as Constants
+from goldlink.modules.log_fetcher import LogFetcher
+
+# Strategy bank events that change the holdings of their `strategyAccount`.
+HOLDINGS_EVENTS = (
+    'OpenAccount',
+    'AddCollateral',
+    'BorrowFunds',
+    'RepayLoan',
+    'WithdrawCollateral',
+    'LiquidateLoan',
+)
+
+
+class AccountHealthIndex(object):
+    '''
+    Index of the holdings of every strategy account of a strategy bank. The index is
+    seeded once from the bank and then kept current from the bank's holdings events,
+    re-reading only the accounts touched since the last sync. Events are read through
+    a `LogFetcher`, so long ranges are chunked to the node's log limits.
+    '''
+
+    def __init__(
+        self,
+        reader,
+        log_fetcher=None,
+    ):
+        self.reader = reader
+        self.log_fetcher = log_fetcher or LogFetcher(web3=reader.web3)
+
+        # Block the index is synced to and holdings per strategy account.
+        self.last_block = None
+        self.holdings_by_account = {}
+
+    def sync(self, to_block=None):
+        '''
+        Bring the index up to date with `to_block`. The first sync reads the holdings of
+        every account in batches; later syncs read the holdings events since the last
+        sync and re-read the holdings of the accounts they touch.
+
+        :param to_block: optional
+        :type to_block: integer
+
+        :returns: []address, strategy accounts whose holdings were read
+        '''
+        if to_block is None:
+            to_block = self.reader.web3.eth.blockNumber
+
+        if self.last_block is None:
+            strategy_accounts = self.reader._call_function(
+                self.reader.strategy_bank.functions.getStrategyAccounts(0, 0),
+                block_identifier=to_block,
+            )
+        elif to_block > self.last_block:
+            strategy_accounts = self.get_touched_accounts(self.last_block + 1, to_block)
+        else:
+            strategy_accounts = []
+
+        holdings = self.reader.call_many(
+            [
+                (
+                    self.reader.strategy_bank.functions.getStrategyAccountHoldings(s),
+                    self.reader.parse_strategy_account_holdings,
+                )
+                for s in strategy_accounts
+            ],
+            allow_failure=False,
+            block_identifier=to_block,
+        )
+        for strategy_account, result in zip(strategy_accounts, holdings):
+            self.holdings_by_account[strategy_account] = result["result"]
+
+        self.last_block = max(to_block, self.last_block or 0)
+
+        return strategy_accounts
+
+    def get_touched_accounts(self, from_block, to_block):
+        '''
+        Get the strategy accounts whose holdings changed between two blocks, inclusive,
+        in order of first change.
+
+        :param from_block: required
+        :type from_block: integer
+
+        :param to_block: required
+        :type to_block: integer
+
+        :returns: []address
+        '''
+        events = self.log_fetcher.iter_events(
+            from_block,
+            to_block,
+            address=self.reader.strategy_bank.address,
+            event_names=HOLDINGS_EVENTS,
+            file_paths=[Constants.STRATEGY_BANK_ABI],
+        )
+
+        touched_accounts = {}
+        for event in events:
+            touched_accounts[event['args']['strategyAccount']] = None
+
+        return list(touched_accounts)
+
+    def get_holdings(self, strategy_account):
+        '''
+        Get the indexed holdings of a strategy account.
+
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :returns: Object | None, None if the account is not indexed
+        '''
+        return self.holdings_by_account.get(strategy_account)
+
+    def get_indebted_accounts(self):
+        '''
+        Get the indexed strategy accounts with an outstanding loan, the only ones that
+        can be liquidated.
+
+        :returns: []address
+        '''
+        return [
+            strategy_account
+            for strategy_account, holdings in self.holdings_by_account.items()
+            if holdings['loan']
+        ]
@@ -0,0 +1,136 @@
+"""Module providing an index of strategy accounts by owner for a GoldLink Strategy Bank."""
+
+import json
+import os
+
+from web3 import Web3
+
+import goldlink.constants as Constants
+from goldlink.modules.log_fetcher import LogFetcher
+
+
+class AccountOwnerIndex(object):
+    '''
+    Index of the strategy accounts of a strategy bank by owner. The index is seeded
+    once from the bank and then kept current from `OpenAccount` events, read through a
+    `LogFetcher`, optionally persisted to disk between runs.
+    '''
+
+    def __init__(
+        self,
+        reader,
+        path=None,
+        log_fetcher=None,
+    ):
+        self.reader = reader
+        self.path = path
+        self.log_fetcher = log_fetcher or LogFetcher(web3=reader.web3)
+
+        # Block the index is synced to and strategy accounts per owner.
+        self.last_block = None
+        self.accounts_by_owner = {}
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def sync(self, to_block=None):
+        '''
+        Bring the index up to date with `to_block`. The first sync reads every account
+        owner in batches; later syncs only process new `OpenAccount` events.
+
+        :param to_block: optional
+        :type to_block: integer
+
+        :returns: integer, block the index is synced to
+        '''
+        if to_block is None:
+            to_block = self.reader.web3.eth.blockNumber
+
+        if self.last_block is None:
+            strategy_accounts = self.reader.strategy_bank.functions.getStrategyAccounts(
+                0,
+                0,
+            ).call(block_identifier=to_block)
+            owners = self.reader.get_strategy_account_owners(
+                strategy_accounts,
+                block_identifier=to_block,
+            )
+            for strategy_account, owner in owners.items():
+                self._add(owner, strategy_account)
+        elif to_block > self.last_block:
+            events = self.log_fetcher.iter_events(
+                self.last_block + 1,
+                to_block,
+                address=self.reader.strategy_bank.address,
+                event_names=['OpenAccount'],
+                file_paths=[Constants.STRATEGY_BANK_ABI],
+            )
+            for event in events:
+                self._add(event['args']['owner'], event['args']['strategyAccount'])
+
+        self.last_block = max(to_block, self.last_block or 0)
+
+        if self.path:
+            self.save()
+
+        return self.last_block
+
+    def get_strategy_accounts(self, owner):
+        '''
+        Get the indexed strategy accounts owned by `owner`.
+
+        :param owner: required
+        :type owner: address
+
+        :returns: []address
+        '''
+        return list(self.accounts_by_owner.get(Web3.toChecksumAddress(owner), []))
+
+    # -----------------------------------------------------------
+    # Persistence Functions
+    # -----------------------------------------------------------
+
+    def save(self):
+        '''
+        Write the index to `path`, replacing the file atomically.
+        '''
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w') as index_file:
+            json.dump({
+                'strategy_bank': self.reader.strategy_bank.address,
+                'last_block': self.last_block,
+                'accounts_by_owner': self.accounts_by_owner,
+            }, index_file)
+        os.replace(temporary_path, self.path)
+
+    def load(self):
+        '''
+        Read the index from `path`.
+
+        :raises: ValueError
+        '''
+        with open(self.path, 'r') as index_file:
+            index = json.load(index_file)
+
+        if index['strategy_bank'] != self.reader.strategy_bank.address:
+            raise ValueError(
+                f'Index at {self.path} belongs to strategy bank {index["strategy_bank"]}',
+            )
+
+        self.last_block = index['last_block']
+        self.accounts_by_owner = index['accounts_by_owner']
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    def _add(self, owner, strategy_account):
+        '''
+        Add a strategy account to the index.
+        '''
+        if owner is None:
+            return
+
+        accounts = self.accounts_by_owner.setdefault(Web3.toChecksumAddress(owner), [])
+        if strategy_account not in accounts:
+            accounts.append(strategy_account)
@@ -0,0 +1,88 @@
+"""Module providing asynchronous reads of GoldLink Contracts."""
+
+import asyncio
+
+from goldlink.helpers import decode_function_result
+
+
+class AsyncCallHandler(object):
+
+    '''
+    Module for making the contract reads of a reader module asynchronously. Contract
+    functions are still built, encoded and decoded with the module's web3 instance,
+    which makes no requests, while calls are sent through `async_web3`. Mixed in ahead
+    of a reader module, so its single call getters return coroutines.
+    '''
+
+    def __init__(
+        self,
+        async_web3,
+    ):
+        self.async_web3 = async_web3
+
+    async def _call_function(
+        self,
+        function,
+        parser=None,
+        block_identifier='latest',
+    ):
+        '''
+        Call a contract function through the async web3 provider and parse its result.
+
+        :param function: required
+        :type function: function
+
+        :param parser: optional
+        :type parser: function
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: any
+
+        :raises: ContractLogicError
+        '''
+        return_data = await self.async_web3.eth.call(
+            {
+                'to': function.address,
+                'data': function._encode_transaction_data(),
+            },
+            block_identifier,
+        )
+        result = decode_function_result(self.web3, function.abi, return_data)
+        return parser(result) if parser else result
+
+    async def call_many(
+        self,
+        calls,
+        allow_failure=True,
+        block_identifier='latest',
+    ):
+        '''
+        Read many contract functions through Multicall3, sending every batch
+        concurrently. Takes the same calls as `MulticallHandler.call_many`.
+
+        :param calls: required
+        :type calls: []function
+
+        :param allow_failure: optional
+        :type allow_failure: boolean
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: []Object
+
+        :raises: ContractLogicError, DecodingError
+        '''
+        batches = self._get_multicall_batches(calls, allow_failure)
+        return_data = await asyncio.gather(*[
+            self._call_function(aggregate, block_identifier=block_identifier)
+            for _, aggregate in batches
+        ])
+
+        results = []
+        for (batch, _), batch_return_data in zip(batches, return_data):
+            results.extend(self._decode_multicall_batch(batch, batch_return_data, allow_failure))
+
+        return results
@@ -0,0 +1,142 @@
+"""Module providing asynchronous access to methods for reading from GoldLink Contracts."""
+
+import asyncio
+
+from web3 import Web3
+
+import goldlink.constants as Constants
+from goldlink.modules.async_call_handler import AsyncCallHandler
+from goldlink.modules.reader import Reader
+
+
+class AsyncReader(AsyncCallHandler, Reader):
+    '''
+    Module for reading from the GoldLink Protocol asynchronously. Offers every method of
+    `Reader`, returning coroutines.
+    '''
+
+    def __init__(
+        self,
+        web3,
+        async_web3,
+        network_id,
+        strategy_bank=None,
+        strategy_reserve=None,
+    ):
+        Reader.__init__(
+            self,
+            web3,
+            network_id,
+            strategy_bank=strategy_bank,
+            strategy_reserve=strategy_reserve,
+        )
+        AsyncCallHandler.__init__(self, async_web3)
+
+    # -----------------------------------------------------------
+    # Borrowing Functions
+    # -----------------------------------------------------------
+
+    async def get_strategy_accounts_for_bank(self, owner=None, stop=None):
+        '''
+        Get address of every strategy account for a bank or
+        just owned by `owner`.
+
+        :param owner: optional
+        :type owner: address
+
+        :param stop: optional
+        :type stop: integer
+
+        :returns: []address
+        '''
+        strategy_account_addresses = await self._call_function(
+            self.strategy_bank.functions.getStrategyAccounts(0, stop or 0),
+        )
+
+        if owner:
+            owners = await self.get_strategy_account_owners(strategy_account_addresses)
+            strategy_account_addresses = [
+                s for s in strategy_account_addresses if owners[s] == Web3.toChecksumAddress(owner)
+            ]
+
+        return strategy_account_addresses
+
+    async def get_strategy_account_owners(self, strategy_accounts, block_identifier='latest'):
+        '''
+        Get the owner of each strategy account, read in batches.
+
+        :param strategy_accounts: required
+        :type strategy_accounts: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, owner per strategy account
+        '''
+        owners = await self.call_many(
+            self._get_strategy_account_owner_calls(strategy_accounts),
+            block_identifier=block_identifier,
+        )
+        return {
+            s: owner["result"] for s, owner in zip(strategy_accounts, owners)
+        }
+
+    # -----------------------------------------------------------
+    # Account Snapshot Functions
+    # -----------------------------------------------------------
+
+    async def get_accounts_snapshot(
+        self,
+        strategy_accounts,
+        max_workers=None,
+        block_identifier='latest',
+    ):
+        '''
+        Get the holdings, value and liquidation status of many strategy accounts, with
+        at most `max_workers` multicall batches in flight.
+
+        :param strategy_accounts: required
+        :type strategy_accounts: []address
+
+        :param max_workers: optional
+        :type max_workers: integer
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: []Object, one record per strategy account in input order
+        '''
+        semaphore = asyncio.Semaphore(max_workers or Constants.DEFAULT_MAX_WORKERS)
+
+        # Three calls per account, so every chunk is read in a single multicall.
+        chunk_size = max(self.multicall_batch_size // 3, 1)
+
+        async def read_chunk(chunk):
+            async with semaphore:
+                return await self._get_accounts_snapshot_chunk(chunk, block_identifier)
+
+        chunk_records = await asyncio.gather(*[
+            read_chunk(strategy_accounts[start:start + chunk_size])
+            for start in range(0, len(strategy_accounts), chunk_size)
+        ])
+        return [record for records in chunk_records for record in records]
+
+    async def _get_accounts_snapshot_chunk(self, strategy_accounts, block_identifier):
+        '''
+        Read the snapshot records of a chunk of strategy accounts in one multicall.
+
+        :returns: []Object
+        '''
+        results = await self.call_many(
+            [
+                call
+                for strategy_account in strategy_accounts
+                for call in self._get_account_snapshot_calls(strategy_account)
+            ],
+            block_identifier=block_identifier,
+        )
+
+        return [
+            self.parse_account_snapshot(strategy_account, *results[index * 3:index * 3 + 3])
+            for index, strategy_account in enumerate(strategy_accounts)
+        ]
@@ -0,0 +1,231 @@
+"""Module providing asynchronous sending and handling of transactions for the GoldLink Contracts."""
+
+import goldlink.constants as Constants
+from goldlink.errors import TransactionReverted
+from goldlink.modules.transaction_handler import FEE_OPTIONS
+
+
+class AsyncTransactionHandler(object):
+
+    '''
+    Module for sending transactions to GoldLink Protocol asynchronously. Mixed in ahead
+    of a writer module, so its transaction methods return coroutines. Every field web3
+    would otherwise request while building a transaction is filled in through
+    `async_web3` first, so building and signing make no blocking requests.
+    '''
+
+    def __init__(
+        self,
+        async_web3,
+    ):
+        self.async_web3 = async_web3
+
+        # Chain ID, read on first transaction.
+        self._chain_id = None
+
+    async def send_transaction(
+        self,
+        method=None,
+        options=None,
+    ):
+        '''
+        Sign and send a transaction.
+
+        :param method: optional
+        :type method: function
+
+        :param options: optional
+        :type options: transactionOptions
+
+        :returns: hex
+
+        :raises: ValueError
+        '''
+        options = dict(self.send_options, **(options or {}))
+
+        # Set from in options.
+        if 'from' not in options:
+            options['from'] = self.default_address
+        if options.get('from') is None:
+            raise ValueError(
+                "options['from'] is not set, and no default address is set",
+            )
+        # Set nonce in options.
+        auto_detect_nonce = 'nonce' not in options
+        if auto_detect_nonce:
+            nonce_key = self.nonce_manager.get_key(self.async_web3, options['from'])
+            if not self.nonce_manager.is_synced(nonce_key):
+                self.nonce_manager.sync(
+                    nonce_key,
+                    await self._get_pending_transaction_count(options['from']),
+                    force=False,
+                )
+            elif self.nonce_manager.is_gap_check_due(nonce_key):
+                self.nonce_manager.check_gaps(
+                    nonce_key,
+                    await self._get_pending_transaction_count(options['from']),
+                )
+            options['nonce'] = self.nonce_manager.reserve(nonce_key)
+
+        try:
+            transaction_hash = await self._sign_and_send_transaction(
+                method,
+                options,
+                nonce_key if auto_detect_nonce else None,
+            )
+        except Exception:
+            if auto_detect_nonce:
+                self.nonce_manager.release(nonce_key, options['nonce'])
+            raise
+
+        if auto_detect_nonce:
+            self.nonce_manager.confirm(nonce_key, options['nonce'])
+
+        # Return hex of transaction hash.
+        return transaction_hash.hex()
+
+    async def _sign_and_send_transaction(
+        self,
+        method,
+        options,
+        nonce_key=None,
+    ):
+        '''
+        Fill in the fees, gas and chain ID of a transaction, then sign and send it. With a
+        nonce key, a nonce found to be used is replaced by a fresh one after resyncing
+        from the node.
+
+        :returns: HexBytes
+
+        :raises: ValueError
+        '''
+        # Set fees in options, unless any fee is set.
+        if not FEE_OPTIONS.intersection(options):
+            options.update(await self.fee_oracle.get_fee_options_async(self.async_web3))
+
+        # Set value in options.
+        if 'value' not in options:
+            options['value'] = 0
+
+        # Set gas in options, from samples of the function if cached gas is used and
+        # from a live estimate otherwise, or if it has too few samples.
+        gas_multiplier = options.pop(
+            'gasMultiplier',
+            Constants.DEFAULT_GAS_MULTIPLIER,
+        )
+        use_cached_gas = options.pop('useCachedGas', self.gas_estimator.use_cached_gas)
+        gas_key = self.gas_estimator.get_key(method)
+        if 'gas' not in options:
+            cached_gas = self.gas_estimator.get_cached_gas(gas_key)
+            if use_cached_gas and cached_gas is not None:
+                options['gas'] = int(cached_gas * gas_multiplier)
+            else:
+                try:
+                    estimated_gas = await self.async_web3.eth.estimate_gas(
+                        dict(
+                            options,
+                            to=method.address,
+                            data=method._encode_transaction_data(),
+                        ),
+                    )
+                except Exception:
+                    estimated_gas = cached_gas
+                else:
+                    self.gas_estimator.record(gas_key, estimated_gas)
+
+                if estimated_gas is None:
+                    options['gas'] = Constants.DEFAULT_GAS_AMOUNT
+                else:
+                    options['gas'] = int(estimated_gas * gas_multiplier)
+
+        # Set chain ID in options.
+        if 'chainId' not in options:
+            options['chainId'] = await self.get_chain_id()
+
+        # Sign and send transaction.
+        resyncs = 0
+        while True:
+            signed = self.sign_transaction(method, options)
+            try:
+                transaction_hash = await self.async_web3.eth.send_raw_transaction(
+                    signed.rawTransaction,
+                )
+                self.gas_estimator.track_transaction(transaction_hash.hex(), gas_key)
+                return transaction_hash
+            except ValueError as error:
+                if nonce_key is None or not self.nonce_manager.is_nonce_error(error):
+                    raise
+                if resyncs >= Constants.DEFAULT_MAX_NONCE_RESYNCS:
+                    self.nonce_manager.confirm(nonce_key, options['nonce'])
+                    raise
+
+            # The nonce was used by another sender, resync past it and take a new one.
+            resyncs += 1
+            used_nonce = options['nonce']
+            transaction_count = await self._get_pending_transaction_count(options['from'])
+            self.nonce_manager.confirm(nonce_key, used_nonce)
+            self.nonce_manager.sync(nonce_key, max(transaction_count, used_nonce + 1))
+            options['nonce'] = self.nonce_manager.reserve(nonce_key)
+
+    async def get_next_nonce(
+        self,
+        address,
+    ):
+        '''
+        Get the next nonce for the address.
+
+        :param address: required
+        :type address: string
+
+        :returns: integer
+        '''
+        nonce_key = self.nonce_manager.get_key(self.async_web3, address)
+        if not self.nonce_manager.is_synced(nonce_key):
+            self.nonce_manager.sync(
+                nonce_key,
+                await self._get_pending_transaction_count(address),
+                force=False,
+            )
+        return self.nonce_manager.get_next_nonce(nonce_key, None)
+
+    async def _get_pending_transaction_count(self, address):
+        '''
+        Get the transaction count of an address, including pending transactions.
+
+        :returns: integer
+        '''
+        return await self.async_web3.eth.get_transaction_count(address, 'pending')
+
+    async def get_chain_id(self):
+        '''
+        Get the chain ID, read once.
+
+        :returns: integer
+        '''
+        if self._chain_id is None:
+            self._chain_id = await self.async_web3.eth.chain_id
+        return self._chain_id
+
+    async def wait_for_transaction(
+        self,
+        transaction_hash,
+    ):
+        '''
+        Wait for a transaction to be mined and return the receipt.
+        Raise on revert.
+
+        :param transaction_hash: required
+        :type transaction_hash: number
+
+        :returns: transactionReceipt
+
+        :raises: TransactionReverted
+        '''
+        transaction_receipt = await self.async_web3.eth.wait_for_transaction_receipt(
+            transaction_hash,
+        )
+        self.gas_estimator.record_receipt(transaction_receipt)
+        if transaction_receipt['status'] == 0:
+            raise TransactionReverted(transaction_receipt)
+
+        return transaction_receipt
@@ -0,0 +1,35 @@
+"""Module providing asynchronous access to methods for writing to GoldLink Core Contracts."""
+
+from goldlink.modules.async_transaction_handler import AsyncTransactionHandler
+from goldlink.modules.writer import Writer
+
+
+class AsyncWriter(AsyncTransactionHandler, Writer):
+
+    '''
+    Module for sending non-strategy specific transactions to GoldLink Protocol
+    asynchronously. Offers every method of `Writer`, returning coroutines.
+    '''
+
+    def __init__(
+        self,
+        web3,
+        async_web3,
+        private_key,
+        send_options,
+        default_address,
+        strategy_bank=None,
+        strategy_reserve=None,
+        strategy_account=None,
+    ):
+        Writer.__init__(
+            self,
+            web3,
+            private_key,
+            send_options,
+            default_address,
+            strategy_bank=strategy_bank,
+            strategy_reserve=strategy_reserve,
+            strategy_account=strategy_account,
+        )
+        AsyncTransactionHandler.__init__(self, async_web3)
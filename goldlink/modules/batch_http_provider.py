@@ -0,0 +1,247 @@
+"""Module providing a web3 HTTP provider that sends JSON-RPC requests in batches."""
+
+import threading
+import time
+
+import requests
+from eth_utils import to_bytes
+from web3 import HTTPProvider
+from web3._utils.encoding import FriendlyJsonSerde
+
+import goldlink.constants as Constants
+
+
+class BatchHTTPProvider(HTTPProvider):
+
+    '''
+    HTTP provider that coalesces requests made concurrently, e.g. from several threads
+    sharing one client, into JSON-RPC batch requests. A request made while no other is
+    in progress is sent right away. Otherwise the first queued request waits up to
+    `flush_interval` seconds for others to queue behind it, and a batch is sent as soon
+    as `max_batch_size` requests are queued. Falls back to single requests if the node
+    rejects batches, with an HTTP error or a non-batch response. Requests from every
+    thread share one pooled session, closed by `close` unless passed in.
+    '''
+
+    def __init__(
+        self,
+        endpoint_uri=None,
+        request_kwargs=None,
+        session=None,
+        max_batch_size=None,
+        flush_interval=None,
+        pool_size=None,
+    ):
+        # The session is kept here rather than in web3's per-thread session cache.
+        super().__init__(endpoint_uri, request_kwargs)
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=pool_size or Constants.DEFAULT_MAX_WORKERS,
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+
+        self.max_batch_size = max_batch_size or Constants.DEFAULT_MAX_BATCH_SIZE
+        self.flush_interval = (
+            Constants.DEFAULT_BATCH_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        )
+        self.supports_batch = True
+
+        # Requests waiting to be sent in the next batch, and requests in progress.
+        self._pending = []
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def make_request(self, method, params):
+        '''
+        Queue a request and wait for its response.
+
+        :param method: required
+        :type method: string
+
+        :param params: required
+        :type params: []any
+
+        :returns: RPCResponse
+        '''
+        if not self.supports_batch or self.max_batch_size == 1:
+            return self._make_single_request(method, params)
+
+        request = _PendingRequest(method, params)
+        with self._lock:
+            self._active += 1
+            self._pending.append(request)
+            is_first = len(self._pending) == 1
+            # Nothing else could join the batch of a lone request, so don't wait.
+            flush = self._active == 1 or len(self._pending) >= self.max_batch_size
+            batch = self._take_pending() if flush else None
+
+        try:
+            if batch:
+                self._send(batch)
+            elif is_first:
+                time.sleep(self.flush_interval)
+                with self._lock:
+                    batch = self._take_pending()
+                if batch:
+                    self._send(batch)
+
+            request.done.wait()
+        finally:
+            with self._lock:
+                self._active -= 1
+
+        if request.error is not None:
+            raise request.error
+        return request.response
+
+    def close(self):
+        '''
+        Close the session, if not passed in.
+        '''
+        if self._owns_session:
+            self.session.close()
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    def _post(self, data):
+        '''
+        Post a JSON-RPC payload through the session.
+
+        :returns: bytes
+
+        :raises: HTTPError
+        '''
+        response = self.session.post(self.endpoint_uri, data=data, **self.get_request_kwargs())
+        response.raise_for_status()
+        return response.content
+
+    def _make_single_request(self, method, params):
+        '''
+        Send one request on its own.
+
+        :returns: RPCResponse
+        '''
+        return self.decode_rpc_response(self._post(self.encode_rpc_request(method, params)))
+
+    def _take_pending(self):
+        '''
+        Take every queued request. Must be called with the lock held.
+
+        :returns: []_PendingRequest
+        '''
+        batch = self._pending
+        self._pending = []
+        return batch
+
+    def _send(self, batch):
+        '''
+        Send queued requests and hand each its response.
+
+        :param batch: required
+        :type batch: []_PendingRequest
+        '''
+        try:
+            if len(batch) == 1:
+                batch[0].response = self._make_single_request(batch[0].method, batch[0].params)
+            else:
+                self._send_batch(batch)
+        except Exception as error:
+            for request in batch:
+                if request.response is None:
+                    request.error = error
+        finally:
+            for request in batch:
+                request.done.set()
+
+    def _send_batch(self, batch):
+        '''
+        Send several requests as one JSON-RPC batch.
+
+        :param batch: required
+        :type batch: []_PendingRequest
+        '''
+        requests_by_id = {}
+        payload = []
+        for request in batch:
+            request_id = next(self.request_counter)
+            requests_by_id[request_id] = request
+            payload.append({
+                'jsonrpc': '2.0',
+                'method': request.method,
+                'params': request.params or [],
+                'id': request_id,
+            })
+
+        try:
+            raw_response = self._post(to_bytes(text=FriendlyJsonSerde().json_encode(payload)))
+        except requests.exceptions.HTTPError as error:
+            # Nodes without batch support may reject batches at the HTTP level.
+            if not self.is_batch_rejection(error):
+                raise
+            self.supports_batch = False
+            self._send_singly(batch)
+            return
+        responses = self.decode_rpc_response(raw_response)
+
+        # Nodes without batch support may also answer with a single error object.
+        if not isinstance(responses, list):
+            self.supports_batch = False
+            self._send_singly(batch)
+            return
+
+        for response in responses:
+            request = requests_by_id.get(response.get('id'))
+            if request is not None:
+                request.response = response
+
+        for request in batch:
+            if request.response is None:
+                request.error = ValueError(
+                    f'No response to batched request {request.method}',
+                )
+
+    def _send_singly(self, batch):
+        '''
+        Send the requests of a batch one at a time, handing each its response or error.
+
+        :param batch: required
+        :type batch: []_PendingRequest
+        '''
+        for request in batch:
+            try:
+                request.response = self._make_single_request(request.method, request.params)
+            except Exception as error:
+                request.error = error
+
+    @staticmethod
+    def is_batch_rejection(error):
+        '''
+        Get whether an HTTP error means the node rejects batch requests, a client error
+        other than rate limiting.
+
+        :param error: required
+        :type error: HTTPError
+
+        :returns: boolean
+        '''
+        status_code = error.response.status_code if error.response is not None else None
+        return status_code is not None and 400 <= status_code < 500 and status_code != 429
+
+
+class _PendingRequest(object):
+    '''
+    Request queued for a batch, resolved once the batch response arrives.
+    '''
+
+    def __init__(self, method, params):
+        self.method = method
+        self.params = params
+        self.response = None
+        self.error = None
+        self.done = threading.Event()
@@ -1,9 +1,8 @@
 """Module for handling all interactions with GoldLink Contracts."""
 
-import json
-import os
-
 import goldlink.constants as Constants
+from goldlink.helpers import RawContractFunction
+from goldlink.modules.contract_registry import CONTRACT_REGISTRY
 
 
 class ContractHandler(object):
@@ -15,13 +14,9 @@ class ContractHandler(object):
         self,
         web3,
     ):
-        # Set web3.
+        # Set web3. Contracts are cached in the process-wide registry.
         self.web3 = web3
 
-        # Initialize empty cached contracts.
-        self.cached_contracts = {}
-        self.cached_gmx_frf_accounts = {}
-
     # -----------------------------------------------------------
     # ABI Getter Functions
     # -----------------------------------------------------------
@@ -79,13 +74,7 @@ class ContractHandler(object):
 
         :returns: Object
         '''
-        if strategy_account not in self.cached_gmx_frf_accounts and strategy_account in self.cached_contracts:
-            del self.cached_contracts[strategy_account]
-
-        strategy_obj = self.get_contract(strategy_account, Constants.GMX_FRF_STRATEGY_ACCOUNT_ABI)
-        self.cached_gmx_frf_accounts[strategy_account] = strategy_obj
-
-        return strategy_obj
+        return self.get_contract(strategy_account, Constants.GMX_FRF_STRATEGY_ACCOUNT_ABI)
 
     def get_gmxfrf_strategy_manager(self, strategy_manager):
         '''
@@ -109,6 +98,49 @@ class ContractHandler(object):
         '''
         return self.get_contract(account_getters, Constants.GMX_FRF_ACCOUNT_GETTERS_ABI)
 
+    def get_gmxfrf_account_getters_function(self, account_getters, fn_name, *args):
+        '''
+        Get a function of the GmxFrfAccountGetters library bound to `args`. The library's
+        ABI uses contract parameter types web3 cannot encode, so the function is called
+        by its raw signature.
+
+        :param account_getters: required
+        :type account_getters: address
+
+        :param fn_name: required
+        :type fn_name: string
+
+        :returns: RawContractFunction
+        '''
+        return self.get_raw_function(
+            account_getters,
+            Constants.GMX_FRF_ACCOUNT_GETTERS_ABI,
+            fn_name,
+            *args,
+        )
+
+    def get_raw_function(self, address, file_path, fn_name, *args):
+        '''
+        Get a function of the contract at `address` bound to `args`, without creating a
+        web3 contract for the address. Much cheaper when reading the same function from
+        many contracts, e.g. every strategy account.
+
+        :param address: required
+        :type address: address
+
+        :param file_path: required
+        :type file_path: string
+
+        :param fn_name: required
+        :type fn_name: string
+
+        :returns: RawContractFunction
+        '''
+        function_abi = next(
+            f for f in self.load_abi(file_path) if f.get('name') == fn_name
+        )
+        return RawContractFunction(self.web3, address, function_abi, *args)
+
     def get_gmx_v2_reader(self, gmx_v2_reader):
         '''
         Get ABI of the GmxV2Reader.
@@ -131,10 +163,45 @@ class ContractHandler(object):
         '''
         return self.get_contract(gmx_v2_datastore, Constants.IGMX_V2_DATASTORE_ABI)
 
+    def get_multicall3(self, multicall3):
+        '''
+        Get ABI of the Multicall3.
+
+        :param multicall3: required
+        :type multicall3: address
+
+        :returns: Object
+        '''
+        return self.get_contract(multicall3, Constants.MULTICALL3_ABI)
+
     # -----------------------------------------------------------
     # Utility Functions
     # -----------------------------------------------------------
 
+    def _call_function(
+        self,
+        function,
+        parser=None,
+        block_identifier='latest',
+    ):
+        '''
+        Call a contract function and parse its result. Every single call read goes
+        through here, so asynchronous modules can override how calls are made.
+
+        :param function: required
+        :type function: function
+
+        :param parser: optional
+        :type parser: function
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: any
+        '''
+        result = function.call(block_identifier=block_identifier)
+        return parser(result) if parser else result
+
     def create_contract(
         self,
         address,
@@ -154,14 +221,23 @@ class ContractHandler(object):
 
         :raises: FileNotFoundError
         '''
-        goldlink_folder = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            '..',
-        )
-        return self.web3.eth.contract(
-            address=address,
-            abi=json.load(open(os.path.join(goldlink_folder, file_path), 'r')),
-        )
+        return CONTRACT_REGISTRY.get_contract_factory(self.web3, file_path)(address=address)
+
+    def load_abi(
+        self,
+        file_path,
+    ):
+        '''
+        Load a bundled ABI, parsed once per process.
+
+        :param file_path: required
+        :type file_path: string
+
+        :returns: []Object
+
+        :raises: FileNotFoundError
+        '''
+        return CONTRACT_REGISTRY.load_abi(file_path)
 
     def get_contract(
         self,
@@ -182,9 +258,4 @@ class ContractHandler(object):
 
         :raises: FileNotFoundError
         '''
-        if address not in self.cached_contracts:
-            self.cached_contracts[address] = self.create_contract(
-                address,
-                file_path,
-            )
-        return self.cached_contracts[address]
+        return CONTRACT_REGISTRY.get_contract(self.web3, address, file_path)
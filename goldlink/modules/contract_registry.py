@@ -0,0 +1,177 @@
+"""Module providing a process-wide registry of GoldLink ABIs and contract objects."""
+
+import collections
+import threading
+import weakref
+
+import goldlink.constants as Constants
+from goldlink.modules.abi_loader import (
+    ABI_FILE_PATHS,
+    compile_event_topics,
+    compile_function_selectors,
+    load_json_abi,
+)
+
+
+class ContractRegistry(object):
+
+    '''
+    Thread-safe registry shared by every module in the process. Each bundled ABI is
+    parsed once, its function selectors and event topics are computed once when first
+    needed, a contract factory is prepared once per ABI and web3 instance, and
+    contracts are bound per (address, ABI). At most `max_contracts` bound contracts are kept per web3 instance,
+    evicting the least recently used, so scanning many accounts does not grow memory
+    without bound.
+    '''
+
+    def __init__(
+        self,
+        max_contracts=Constants.DEFAULT_MAX_CACHED_CONTRACTS,
+    ):
+        self.max_contracts = max_contracts
+
+        self._lock = threading.RLock()
+
+        # Parsed ABIs, and their function selectors and event topics, by file path.
+        self._abis = {}
+        self._selectors = {}
+        self._topics = {}
+
+        # Event ABIs by topic, merged across ABIs, by tuple of file paths.
+        self._event_tables = {}
+
+        # Contract factories by web3 instance and ABI file path.
+        self._factories = weakref.WeakKeyDictionary()
+
+        # Recently used bound contracts by web3 instance and (address, ABI file path).
+        self._contracts = weakref.WeakKeyDictionary()
+
+    def load_abi(self, file_path):
+        '''
+        Get a bundled ABI, loading it on first use. The returned ABI is shared and must
+        not be modified.
+
+        :param file_path: required
+        :type file_path: string
+
+        :returns: []Object
+
+        :raises: FileNotFoundError
+        '''
+        with self._lock:
+            if file_path not in self._abis:
+                self._abis[file_path] = load_json_abi(file_path)
+            return self._abis[file_path]
+
+    def get_function_selectors(self, file_path):
+        '''
+        Get the selector of every function in a bundled ABI, computed on first use.
+
+        :param file_path: required
+        :type file_path: string
+
+        :returns: Object, selector per function name
+
+        :raises: FileNotFoundError
+        '''
+        with self._lock:
+            if file_path not in self._selectors:
+                self._selectors[file_path] = compile_function_selectors(self.load_abi(file_path))
+            return self._selectors[file_path]
+
+    def get_event_abis_by_topic(self, file_path):
+        '''
+        Get the ABI of every event in a bundled ABI, keyed by its topic, computed on
+        first use.
+
+        :param file_path: required
+        :type file_path: string
+
+        :returns: Object, event ABI per topic
+
+        :raises: FileNotFoundError
+        '''
+        with self._lock:
+            if file_path not in self._topics:
+                self._topics[file_path] = compile_event_topics(self.load_abi(file_path))
+            return self._topics[file_path]
+
+    def get_merged_event_abis_by_topic(self, file_paths=None):
+        '''
+        Get the ABIs of every event in many bundled ABIs, all of them by default, keyed
+        by topic. Contracts may declare the same event with different indexed
+        parameters, so each topic maps to every distinct ABI declaring it.
+
+        :param file_paths: optional
+        :type file_paths: []string
+
+        :returns: Object, []event ABI per topic
+
+        :raises: FileNotFoundError
+        '''
+        key = tuple(file_paths or ABI_FILE_PATHS)
+        with self._lock:
+            if key not in self._event_tables:
+                event_abis_by_topic = {}
+                for file_path in key:
+                    for topic, event_abi in self.get_event_abis_by_topic(file_path).items():
+                        event_abis = event_abis_by_topic.setdefault(topic, [])
+                        if event_abi not in event_abis:
+                            event_abis.append(event_abi)
+                self._event_tables[key] = event_abis_by_topic
+            return self._event_tables[key]
+
+    def get_contract_factory(self, web3, file_path):
+        '''
+        Get the contract factory for an ABI, prepared once per web3 instance.
+
+        :param web3: required
+        :type web3: Web3
+
+        :param file_path: required
+        :type file_path: string
+
+        :returns: Contract
+
+        :raises: FileNotFoundError
+        '''
+        with self._lock:
+            factories = self._factories.setdefault(web3, {})
+            if file_path not in factories:
+                factories[file_path] = web3.eth.contract(abi=self.load_abi(file_path))
+            return factories[file_path]
+
+    def get_contract(self, web3, address, file_path):
+        '''
+        Get a contract object for `address` using an ABI, binding it on first use and
+        keeping it while recently used.
+
+        :param web3: required
+        :type web3: Web3
+
+        :param address: required
+        :type address: address
+
+        :param file_path: required
+        :type file_path: string
+
+        :returns: Contract
+
+        :raises: FileNotFoundError
+        '''
+        with self._lock:
+            contracts = self._contracts.setdefault(web3, collections.OrderedDict())
+            key = (address, file_path)
+            if key in contracts:
+                contracts.move_to_end(key)
+                return contracts[key]
+
+            contract = self.get_contract_factory(web3, file_path)(address=address)
+            contracts[key] = contract
+            while len(contracts) > self.max_contracts:
+                contracts.popitem(last=False)
+            return contract
+
+
+# Registry shared by all GoldLink modules in the process.
+CONTRACT_REGISTRY = ContractRegistry()
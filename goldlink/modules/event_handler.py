@@ -1,7 +1,7 @@
 """Module providing access to methods for handling events from GoldLink Contracts."""
 
 from goldlink.modules.contract_handler import ContractHandler
-from goldlink.helpers import handle_event
+from goldlink.helpers import decode_receipt, handle_event
 
 
 class EventHandler(ContractHandler):
@@ -16,6 +16,17 @@ class EventHandler(ContractHandler):
     ):
         ContractHandler.__init__(self, web3)
 
+    def decode_receipt(self, transaction_receipt):
+        '''
+        Decode every GoldLink event of a receipt in one pass.
+
+        :param transaction_receipt: required
+        :type transaction_receipt: transactionReceipt
+
+        :returns: []AttributeDict, in log order
+        '''
+        return decode_receipt(self.web3, transaction_receipt)
+
     # -----------------------------------------------------------
     # Lending Events
     # -----------------------------------------------------------
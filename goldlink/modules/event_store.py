@@ -0,0 +1,277 @@
+"""Module providing a persistent SQLite store of GoldLink events."""
+
+import json
+import sqlite3
+from collections.abc import Mapping
+
+from web3 import Web3
+
+import goldlink.constants as Constants
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS events (
+    address TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    block_hash TEXT NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    transaction_index INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    account TEXT NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (transaction_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_by_address ON events (address, block_number);
+CREATE INDEX IF NOT EXISTS events_by_account ON events (account, block_number);
+CREATE INDEX IF NOT EXISTS events_by_event ON events (event, block_number);
+CREATE TABLE IF NOT EXISTS sync_state (
+    address TEXT PRIMARY KEY,
+    last_block INTEGER NOT NULL
+);
+'''
+
+
+class EventStore(object):
+    '''
+    Store of the decoded events of GoldLink contracts in a local SQLite database. Each
+    contract is synced from where its last sync stopped, so history is only fetched
+    once. The last `reorg_depth` synced blocks may still be reorganized, so they are
+    rolled back and fetched again on every sync.
+    '''
+
+    def __init__(
+        self,
+        log_fetcher,
+        path,
+        reorg_depth=Constants.DEFAULT_REORG_DEPTH,
+        batch_size=Constants.DEFAULT_EVENT_STORE_BATCH_SIZE,
+    ):
+        self.log_fetcher = log_fetcher
+        self.path = path
+        self.reorg_depth = reorg_depth
+        self.batch_size = batch_size
+
+        self._connection = sqlite3.connect(path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        '''
+        Close the database.
+        '''
+        self._connection.close()
+
+    def sync(self, address, from_block=0, to_block=None, file_paths=None):
+        '''
+        Store the events of a contract up to `to_block`, starting from its last sync or
+        `from_block` on the first one. Progress is saved as events are stored, so an
+        interrupted sync resumes where it stopped.
+
+        :param address: required
+        :type address: address
+
+        :param from_block: optional
+        :type from_block: integer, first block of the first sync
+
+        :param to_block: optional
+        :type to_block: integer, latest block by default
+
+        :param file_paths: optional
+        :type file_paths: []string, ABIs to decode events with
+
+        :returns: integer, number of events stored
+        '''
+        address = Web3.toChecksumAddress(address)
+        if to_block is None:
+            to_block = self.log_fetcher.web3.eth.blockNumber
+
+        last_block = self.get_last_block(address)
+        if last_block is not None:
+            from_block = max(last_block - self.reorg_depth + 1, from_block)
+            self.rollback(address, from_block)
+        if from_block > to_block:
+            return 0
+
+        rows = []
+        event_count = 0
+        for event in self.log_fetcher.iter_events(
+            from_block,
+            to_block,
+            address=address,
+            file_paths=file_paths,
+        ):
+            # Events arrive in block order, so earlier blocks are complete.
+            if len(rows) >= self.batch_size and event['blockNumber'] > rows[-1][1]:
+                self._insert(address, rows, event['blockNumber'] - 1)
+                event_count += len(rows)
+                rows = []
+            rows.append(self._to_row(event))
+
+        self._insert(address, rows, to_block)
+        return event_count + len(rows)
+
+    def rollback(self, address, from_block):
+        '''
+        Delete the stored events of a contract from `from_block` on.
+
+        :param address: required
+        :type address: address
+
+        :param from_block: required
+        :type from_block: integer
+        '''
+        address = Web3.toChecksumAddress(address)
+        with self._connection:
+            self._connection.execute(
+                'DELETE FROM events WHERE address = ? AND block_number >= ?',
+                (address, from_block),
+            )
+            self._connection.execute(
+                'UPDATE sync_state SET last_block = MIN(last_block, ?) WHERE address = ?',
+                (from_block - 1, address),
+            )
+
+    def get_last_block(self, address):
+        '''
+        Get the block a contract is synced to.
+
+        :param address: required
+        :type address: address
+
+        :returns: integer | None, None if never synced
+        '''
+        row = self._connection.execute(
+            'SELECT last_block FROM sync_state WHERE address = ?',
+            (Web3.toChecksumAddress(address),),
+        ).fetchone()
+        return row['last_block'] if row else None
+
+    # -----------------------------------------------------------
+    # Querying Functions
+    # -----------------------------------------------------------
+
+    def get_events(
+        self,
+        account=None,
+        event=None,
+        address=None,
+        from_block=None,
+        to_block=None,
+    ):
+        '''
+        Get stored events in order, filtered by any of account, event name, contract
+        and block range.
+
+        :param account: optional
+        :type account: address, the strategy account an event concerns
+
+        :param event: optional
+        :type event: string
+
+        :param address: optional
+        :type address: address, the contract that emitted an event
+
+        :param from_block: optional
+        :type from_block: integer
+
+        :param to_block: optional
+        :type to_block: integer
+
+        :returns: []Object
+        '''
+        conditions, parameters = [], []
+        if account is not None:
+            conditions.append('account = ?')
+            parameters.append(Web3.toChecksumAddress(account))
+        if event is not None:
+            conditions.append('event = ?')
+            parameters.append(event)
+        if address is not None:
+            conditions.append('address = ?')
+            parameters.append(Web3.toChecksumAddress(address))
+        if from_block is not None:
+            conditions.append('block_number >= ?')
+            parameters.append(from_block)
+        if to_block is not None:
+            conditions.append('block_number <= ?')
+            parameters.append(to_block)
+
+        query = 'SELECT * FROM events'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY block_number, log_index'
+
+        return [
+            self.parse_row(row) for row in self._connection.execute(query, parameters)
+        ]
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    def _insert(self, address, rows, last_block):
+        '''
+        Store rows of events and advance the contract's last synced block, atomically.
+        '''
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                rows,
+            )
+            self._connection.execute(
+                'INSERT OR REPLACE INTO sync_state VALUES (?, ?)',
+                (address, last_block),
+            )
+
+    @staticmethod
+    def _to_row(event):
+        '''
+        Convert a decoded event to a row of the events table. An event concerns the
+        strategy account in its arguments, or the contract emitting it otherwise.
+
+        :returns: tuple
+        '''
+        return (
+            event['address'],
+            event['blockNumber'],
+            event['blockHash'].hex(),
+            event['transactionHash'].hex(),
+            event['transactionIndex'],
+            event['logIndex'],
+            event['event'],
+            event['args'].get('strategyAccount', event['address']),
+            json.dumps(event['args'], default=_to_json),
+        )
+
+    @staticmethod
+    def parse_row(row):
+        '''
+        Parse a row of the events table.
+
+        :param row: required
+        :type row: Row
+
+        :returns: Object
+        '''
+        return {
+            'address': row['address'],
+            'block_number': row['block_number'],
+            'block_hash': row['block_hash'],
+            'transaction_hash': row['transaction_hash'],
+            'transaction_index': row['transaction_index'],
+            'log_index': row['log_index'],
+            'event': row['event'],
+            'account': row['account'],
+            'args': json.loads(row['args']),
+        }
+
+
+def _to_json(value):
+    '''
+    Convert event argument values JSON cannot encode.
+    '''
+    if isinstance(value, bytes):
+        return Web3.toHex(value)
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f'Cannot store {type(value).__name__} in an event')
@@ -0,0 +1,258 @@
+"""Module providing a live stream of GoldLink events."""
+
+import asyncio
+import inspect
+import json
+
+import websockets
+from web3._utils.method_formatters import log_entry_formatter
+
+import goldlink.constants as Constants
+from goldlink.errors import RpcError
+from goldlink.helpers import decode_log
+from goldlink.modules.log_fetcher import EVENT_ABI_FILE_PATHS, LogFetcher
+
+# Queued when the stream stops, ending iteration.
+_STOPPED = object()
+
+
+class EventStream(object):
+    '''
+    Module for receiving the events of GoldLink contracts as they are emitted, as an
+    async iterator or through a callback. Logs are pushed over a websocket `eth_subscribe`
+    when `websocket_uri` is given, falling back to polling new block ranges with
+    `eth_getLogs` through `async_web3` if the websocket fails. Events are buffered in a
+    queue of at most `max_queue_size`; when it is full, reading logs waits for the
+    consumer. Subscriptions only push new logs, so `from_block` applies to polling.
+    Polling reads block ranges of at most `chunk_size`, halved when the node rejects
+    a range, and retries failed requests `max_retries` times in a row with exponential
+    backoff. A stopped stream ends iteration and cannot be restarted. Unknown
+    `event_names` raise ValueError, as a filter without topics would match every log.
+    '''
+
+    def __init__(
+        self,
+        async_web3,
+        websocket_uri=None,
+        address=None,
+        event_names=None,
+        file_paths=None,
+        from_block=None,
+        max_queue_size=Constants.DEFAULT_EVENT_QUEUE_SIZE,
+        poll_interval=Constants.DEFAULT_BLOCK_POLL_INTERVAL,
+        chunk_size=Constants.DEFAULT_LOG_CHUNK_SIZE,
+        max_retries=Constants.DEFAULT_MAX_RETRIES,
+        retry_backoff=Constants.DEFAULT_RETRY_BACKOFF,
+    ):
+        self.async_web3 = async_web3
+        self.websocket_uri = websocket_uri
+        self.from_block = from_block
+        self.max_queue_size = max_queue_size
+        self.poll_interval = poll_interval
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        # Transport logs are read through, 'websocket' or 'polling', once started.
+        self.transport = None
+
+        self._event_abis_by_topic = LogFetcher.get_event_abis_by_topic(
+            file_paths or EVENT_ABI_FILE_PATHS,
+        )
+        if event_names is not None:
+            self._event_abis_by_topic = LogFetcher.select_event_abis(
+                self._event_abis_by_topic,
+                event_names,
+            )
+
+        self._log_filter = {'topics': [list(self._event_abis_by_topic)]}
+        if address is not None:
+            self._log_filter['address'] = address
+
+        # Block and log index of the last event delivered, to resume without duplicates.
+        self._last_position = None
+        self._queue = None
+        self._task = None
+        self._stopped = False
+
+    async def start(self):
+        '''
+        Start reading logs in the background.
+
+        :raises: RuntimeError, if the stream was stopped
+        '''
+        if self._stopped:
+            raise RuntimeError('A stopped event stream cannot be restarted')
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._task = asyncio.ensure_future(self._produce())
+
+    async def stop(self):
+        '''
+        Stop reading logs. Iteration ends once the events already queued are read.
+        '''
+        if self._stopped:
+            return
+        self._stopped = True
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._put_stopped()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._queue is None:
+            if self._stopped:
+                raise StopAsyncIteration
+            await self.start()
+
+        item = await self._queue.get()
+        if item is _STOPPED:
+            # Left queued, so every consumer stops.
+            self._queue.put_nowait(_STOPPED)
+            raise StopAsyncIteration
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def run(self, callback):
+        '''
+        Pass every event to `callback`, awaiting it if it is a coroutine function, until
+        the stream is stopped.
+
+        :param callback: required
+        :type callback: function, taking an event
+        '''
+        async for event in self:
+            result = callback(event)
+            if inspect.isawaitable(result):
+                await result
+
+    # -----------------------------------------------------------
+    # Transport Functions
+    # -----------------------------------------------------------
+
+    async def _produce(self):
+        '''
+        Read logs until stopped, handing errors to the consumer.
+        '''
+        try:
+            if self.websocket_uri:
+                try:
+                    await self._subscribe()
+                except (OSError, websockets.exceptions.WebSocketException, RpcError):
+                    pass
+            await self._poll()
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            await self._queue.put(error)
+            self._stopped = True
+            self._put_stopped()
+
+    async def _subscribe(self):
+        '''
+        Read logs pushed by a websocket `eth_subscribe`, until the connection closes.
+        '''
+        async with websockets.connect(self.websocket_uri) as websocket:
+            await websocket.send(json.dumps({
+                'jsonrpc': '2.0',
+                'id': 1,
+                'method': 'eth_subscribe',
+                'params': ['logs', self._log_filter],
+            }))
+            response = json.loads(await websocket.recv())
+            if 'error' in response:
+                raise RpcError(response['error'])
+
+            self.transport = 'websocket'
+            async for message in websocket:
+                notification = json.loads(message)
+                if notification.get('method') == 'eth_subscription':
+                    await self._deliver(log_entry_formatter(notification['params']['result']))
+
+    async def _poll(self):
+        '''
+        Read the logs of every new block range, from the last event delivered on.
+        '''
+        self.transport = 'polling'
+        if self._last_position is not None:
+            from_block = self._last_position[0]
+        elif self.from_block is not None:
+            from_block = self.from_block
+        else:
+            from_block = await self.async_web3.eth.block_number
+
+        chunk_size = self.chunk_size
+        failures = 0
+        while True:
+            try:
+                head = await self.async_web3.eth.block_number
+                while from_block <= head:
+                    to_block = min(from_block + chunk_size - 1, head)
+                    try:
+                        logs = await self.async_web3.eth.get_logs(
+                            dict(self._log_filter, fromBlock=from_block, toBlock=to_block),
+                        )
+                    except ValueError as error:
+                        if to_block == from_block or not LogFetcher.is_log_range_error(error):
+                            raise
+                        chunk_size = max((to_block - from_block + 1) // 2, 1)
+                        continue
+
+                    for log in logs:
+                        await self._deliver(log)
+                    from_block = to_block + 1
+                    failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                failures += 1
+                if failures > self.max_retries:
+                    raise
+                await asyncio.sleep(self.retry_backoff * 2 ** (failures - 1))
+                continue
+
+            failures = 0
+            await asyncio.sleep(self.poll_interval)
+
+    async def _deliver(self, log):
+        '''
+        Decode a log and queue its event, waiting for room in the queue. Logs removed by
+        a reorg, already delivered or of unknown events are skipped.
+        '''
+        if log.get('removed') or not log['topics']:
+            return
+        position = (log['blockNumber'], log['logIndex'])
+        if self._last_position is not None and position <= self._last_position:
+            return
+        event = decode_log(self.async_web3, self._event_abis_by_topic, log)
+        if event is None:
+            return
+
+        await self._queue.put(event)
+        self._last_position = position
+
+    def _put_stopped(self):
+        '''
+        Queue the end of the stream, dropping the oldest event if the queue is full.
+        '''
+        if self._queue is None:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_STOPPED)
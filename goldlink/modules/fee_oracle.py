@@ -0,0 +1,264 @@
+"""Module providing a process-wide oracle of transaction fees."""
+
+import statistics
+import threading
+import time
+
+import goldlink.constants as Constants
+
+
+class FeeOracle(object):
+
+    '''
+    Thread-safe oracle of transaction fees, shared by every writer in the process. Fees
+    are read with one `eth_feeHistory` request per endpoint and cached per block: they
+    are reused for the block they were read for, given as `block_number` by callers
+    that track blocks, and otherwise for `max_age` seconds, under Arbitrum's block
+    time, so transactions sent together share one read. On chains
+    with EIP-1559 fees, such as Arbitrum, fees are a `maxFeePerGas` of
+    `base_fee_multiplier` times the next base fee plus a `maxPriorityFeePerGas` of the
+    median `reward_percentile` priority fee of recent blocks. Otherwise, or if fee
+    history is not supported, fees are a legacy `gasPrice`.
+    '''
+
+    def __init__(
+        self,
+        max_age=Constants.DEFAULT_FEE_MAX_AGE,
+        block_count=Constants.DEFAULT_FEE_HISTORY_BLOCKS,
+        reward_percentile=Constants.DEFAULT_PRIORITY_FEE_PERCENTILE,
+        base_fee_multiplier=Constants.DEFAULT_BASE_FEE_MULTIPLIER,
+    ):
+        self.max_age = max_age
+        self.block_count = block_count
+        self.reward_percentile = reward_percentile
+        self.base_fee_multiplier = base_fee_multiplier
+
+        self._lock = threading.Lock()
+
+        # Fee options, the time they were read and the block they are for, by endpoint.
+        self._fee_options = {}
+
+        # Locks held while reading the fees of an endpoint, so they are read once.
+        self._read_locks = {}
+
+    def get_fee_options(self, web3, block_number=None):
+        '''
+        Get the fee options of a transaction, read on first use and once cached fees
+        are stale, see get_cached_fee_options.
+
+        :param web3: required
+        :type web3: Web3
+
+        :param block_number: optional
+        :type block_number: integer, the latest block, if known
+
+        :returns: transactionOptions, with maxFeePerGas and maxPriorityFeePerGas or
+        gasPrice
+        '''
+        key = self.get_key(web3)
+        fee_options = self.get_cached_fee_options(key, block_number)
+        if fee_options is not None:
+            return fee_options
+
+        with self._get_read_lock(key):
+            fee_options = self.get_cached_fee_options(key, block_number)
+            if fee_options is None:
+                try:
+                    fee_history = web3.eth.fee_history(
+                        self.block_count,
+                        'latest',
+                        [self.reward_percentile],
+                    )
+                except Exception:
+                    fee_history = None
+
+                fee_options = self.parse_fee_history(fee_history)
+                if fee_options is None:
+                    try:
+                        gas_price = web3.eth.gasPrice
+                    except Exception:
+                        gas_price = None
+                    fee_options = self.parse_gas_price(gas_price)
+
+                self.set_fee_options(key, fee_options, self.get_fee_block(fee_history))
+
+        return dict(fee_options)
+
+    async def get_fee_options_async(self, async_web3, block_number=None):
+        '''
+        Get the fee options of a transaction through async web3, read on first use and
+        once cached fees are stale, see get_cached_fee_options.
+
+        :param async_web3: required
+        :type async_web3: Web3, with AsyncEth
+
+        :param block_number: optional
+        :type block_number: integer, the latest block, if known
+
+        :returns: transactionOptions, with maxFeePerGas and maxPriorityFeePerGas or
+        gasPrice
+        '''
+        key = self.get_key(async_web3)
+        fee_options = self.get_cached_fee_options(key, block_number)
+        if fee_options is not None:
+            return fee_options
+
+        try:
+            fee_history = await async_web3.eth.fee_history(
+                self.block_count,
+                'latest',
+                [self.reward_percentile],
+            )
+        except Exception:
+            fee_history = None
+
+        fee_options = self.parse_fee_history(fee_history)
+        if fee_options is None:
+            try:
+                gas_price = await async_web3.eth.gas_price
+            except Exception:
+                gas_price = None
+            fee_options = self.parse_gas_price(gas_price)
+
+        self.set_fee_options(key, fee_options, self.get_fee_block(fee_history))
+
+        return dict(fee_options)
+
+    def get_cached_fee_options(self, key, block_number=None):
+        '''
+        Get the cached fee options of an endpoint, if still fresh. Given the latest
+        block, fees are fresh if read for the block after it; otherwise, or if the
+        block of the fees is unknown, if read within `max_age`.
+
+        :param key: required
+        :type key: string, see get_key
+
+        :param block_number: optional
+        :type block_number: integer, the latest block, if known
+
+        :returns: transactionOptions | None
+        '''
+        with self._lock:
+            cached = self._fee_options.get(key)
+        if cached is None:
+            return None
+
+        fee_options, read_at, fee_block = cached
+        if block_number is not None and fee_block is not None:
+            is_fresh = fee_block == block_number + 1
+        else:
+            is_fresh = time.monotonic() - read_at <= self.max_age
+        return dict(fee_options) if is_fresh else None
+
+    def set_fee_options(self, key, fee_options, fee_block=None):
+        '''
+        Cache the fee options of an endpoint.
+
+        :param key: required
+        :type key: string, see get_key
+
+        :param fee_options: required
+        :type fee_options: transactionOptions
+
+        :param fee_block: optional
+        :type fee_block: integer, the block the fees are for
+        '''
+        with self._lock:
+            self._fee_options[key] = (dict(fee_options), time.monotonic(), fee_block)
+
+    def reset(self):
+        '''
+        Forget every cached fee, so fees are read again on use.
+        '''
+        with self._lock:
+            self._fee_options.clear()
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    def _get_read_lock(self, key):
+        '''
+        Get the lock held while reading the fees of an endpoint.
+
+        :returns: Lock
+        '''
+        with self._lock:
+            if key not in self._read_locks:
+                self._read_locks[key] = threading.Lock()
+            return self._read_locks[key]
+
+    def parse_fee_history(self, fee_history):
+        '''
+        Parse the EIP-1559 fee options of a fee history.
+
+        :param fee_history: required
+        :type fee_history: FeeHistory | None
+
+        :returns: transactionOptions | None, None if the chain has no base fee
+        '''
+        if not fee_history or not fee_history.get('baseFeePerGas'):
+            return None
+
+        # The last base fee is the one of the next block.
+        base_fee = fee_history['baseFeePerGas'][-1]
+        if not base_fee:
+            return None
+
+        rewards = [reward[0] for reward in fee_history.get('reward') or [] if reward]
+        priority_fee = int(statistics.median(rewards)) if rewards else 0
+
+        return {
+            'maxFeePerGas': base_fee * self.base_fee_multiplier + priority_fee,
+            'maxPriorityFeePerGas': priority_fee,
+        }
+
+    @staticmethod
+    def get_fee_block(fee_history):
+        '''
+        Get the block the fees of a fee history are for, the one after its last block.
+
+        :param fee_history: required
+        :type fee_history: FeeHistory | None
+
+        :returns: integer | None, None if the fee history has no base fee
+        '''
+        if not fee_history or not fee_history.get('baseFeePerGas'):
+            return None
+        oldest_block = fee_history.get('oldestBlock')
+        if oldest_block is None:
+            return None
+        if isinstance(oldest_block, str):
+            oldest_block = int(oldest_block, 16)
+        return oldest_block + len(fee_history['baseFeePerGas']) - 1
+
+    @staticmethod
+    def parse_gas_price(gas_price):
+        '''
+        Parse the legacy fee options of a gas price.
+
+        :param gas_price: required
+        :type gas_price: integer | None, None if it could not be read
+
+        :returns: transactionOptions
+        '''
+        if gas_price is None:
+            return {'gasPrice': Constants.DEFAULT_GAS_PRICE}
+        return {'gasPrice': gas_price + Constants.DEFAULT_GAS_PRICE_ADDITION}
+
+    @staticmethod
+    def get_key(web3):
+        '''
+        Get the key fees are cached under, the endpoint of web3.
+
+        :param web3: required
+        :type web3: Web3, sync or async
+
+        :returns: string
+        '''
+        provider = web3.provider
+        return str(getattr(provider, 'endpoint_uri', None) or id(provider))
+
+
+# Fee oracle shared by all GoldLink writers in the process.
+FEE_ORACLE = FeeOracle()
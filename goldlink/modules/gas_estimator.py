@@ -0,0 +1,157 @@
+"""Module providing a process-wide cache of transaction gas estimates."""
+
+import collections
+import threading
+
+import goldlink.constants as Constants
+
+
+class GasEstimator(object):
+
+    '''
+    Thread-safe cache of the gas used by contract functions, shared by every writer in
+    the process. Gas is sampled per function and argument shape, from live estimates
+    and from the gas used in receipts of transactions sent, keeping the most recent
+    `max_samples`. Once a function has `min_samples`, its gas can be taken from the
+    `percentile` of its samples instead of estimated live, which saves a request per
+    transaction on hot paths, and it backs up live estimates that fail.
+    '''
+
+    def __init__(
+        self,
+        use_cached_gas=False,
+        percentile=Constants.DEFAULT_GAS_PERCENTILE,
+        min_samples=Constants.DEFAULT_MIN_GAS_SAMPLES,
+        max_samples=Constants.DEFAULT_MAX_GAS_SAMPLES,
+        max_tracked_transactions=Constants.DEFAULT_MAX_TRACKED_TRANSACTIONS,
+    ):
+        self.use_cached_gas = use_cached_gas
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.max_tracked_transactions = max_tracked_transactions
+
+        self._lock = threading.Lock()
+
+        # Recent gas samples by key.
+        self._samples = {}
+
+        # Keys of recently sent transactions by hash, to sample the gas they use.
+        self._keys_by_transaction = collections.OrderedDict()
+
+    def get_cached_gas(self, key):
+        '''
+        Get the `percentile` of the gas samples of a key.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :returns: integer | None, None if the key has fewer than `min_samples`
+        '''
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples or len(samples) < self.min_samples:
+            return None
+
+        # Nearest-rank percentile.
+        rank = -(-len(samples) * self.percentile // 100)
+        return samples[max(rank, 1) - 1]
+
+    def record(self, key, gas):
+        '''
+        Sample the gas of a key.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :param gas: required
+        :type gas: integer
+        '''
+        with self._lock:
+            if key not in self._samples:
+                self._samples[key] = collections.deque(maxlen=self.max_samples)
+            self._samples[key].append(gas)
+
+    def track_transaction(self, transaction_hash, key):
+        '''
+        Remember the key of a sent transaction, to sample its gas used from its receipt.
+
+        :param transaction_hash: required
+        :type transaction_hash: hex
+
+        :param key: required
+        :type key: tuple, see get_key
+        '''
+        with self._lock:
+            self._keys_by_transaction[transaction_hash] = key
+            while len(self._keys_by_transaction) > self.max_tracked_transactions:
+                self._keys_by_transaction.popitem(last=False)
+
+    def record_receipt(self, transaction_receipt):
+        '''
+        Sample the gas used by a tracked transaction from its receipt. Receipts of
+        reverted or untracked transactions are ignored.
+
+        :param transaction_receipt: required
+        :type transaction_receipt: transactionReceipt
+        '''
+        transaction_hash = transaction_receipt['transactionHash']
+        if not isinstance(transaction_hash, str):
+            transaction_hash = transaction_hash.hex()
+
+        with self._lock:
+            key = self._keys_by_transaction.pop(transaction_hash, None)
+        if key is not None and transaction_receipt['status'] != 0:
+            self.record(key, transaction_receipt['gasUsed'])
+
+    def reset(self):
+        '''
+        Forget every gas sample.
+        '''
+        with self._lock:
+            self._samples.clear()
+            self._keys_by_transaction.clear()
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    @staticmethod
+    def get_key(method):
+        '''
+        Get the key gas of a contract function call is sampled under, its signature and
+        the shape of its arguments. Calls of one function on different contracts share
+        samples.
+
+        :param method: required
+        :type method: function
+
+        :returns: tuple
+        '''
+        abi = getattr(method, 'abi', None) or {}
+        signature = (
+            abi.get('name', getattr(method, 'fn_name', None)),
+            tuple(i['type'] for i in abi.get('inputs', ())),
+        )
+        return signature + (GasEstimator.get_shape(getattr(method, 'args', None) or ()),)
+
+    @staticmethod
+    def get_shape(value):
+        '''
+        Get the shape of an argument: the lengths of arrays, tuples and bytes, which
+        drive the gas a call uses, and the types of other values.
+
+        :param value: required
+        :type value: any
+
+        :returns: hashable
+        '''
+        if isinstance(value, (list, tuple)):
+            return tuple(GasEstimator.get_shape(v) for v in value)
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        return type(value).__name__
+
+
+# Gas estimator shared by all GoldLink writers in the process.
+GAS_ESTIMATOR = GasEstimator()
@@ -0,0 +1,248 @@
+"""Module providing a scanner for liquidatable strategy accounts of a GoldLink Strategy Bank."""
+
+import logging
+import threading
+
+import goldlink.constants as Constants
+
+logger = logging.getLogger(__name__)
+
+
+class LiquidationScanner(object):
+    '''
+    Module for finding liquidatable strategy accounts of a strategy bank. Every block,
+    the scanner picks up newly opened accounts, reads the accounts due for a check in
+    batches, confirms them with `isAccountLiquidatable` and emits the liquidatable ones
+    to `on_candidate`, least healthy first. Accounts close to the liquidation threshold
+    are re-checked every `risky_check_interval` blocks, the rest every
+    `safe_check_interval` blocks. A scan that fails is passed to `on_error`, or logged,
+    and retried with backoff while `run` keeps polling.
+    '''
+
+    def __init__(
+        self,
+        reader,
+        on_candidate,
+        risky_health_score_margin=Constants.DEFAULT_RISKY_HEALTH_SCORE_MARGIN,
+        risky_check_interval=Constants.DEFAULT_RISKY_CHECK_INTERVAL,
+        safe_check_interval=Constants.DEFAULT_SAFE_CHECK_INTERVAL,
+        max_workers=None,
+        on_error=None,
+        retry_backoff=Constants.DEFAULT_RETRY_BACKOFF,
+        max_backoff=Constants.DEFAULT_MAX_SCAN_BACKOFF,
+    ):
+        self.reader = reader
+        self.on_candidate = on_candidate
+        self.on_error = on_error
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.risky_health_score_margin = risky_health_score_margin
+        self.risky_check_interval = risky_check_interval
+        self.safe_check_interval = safe_check_interval
+        self.max_workers = max_workers
+
+        # Strategy accounts in bank order, with the block each is next checked at.
+        self.strategy_accounts = []
+        self.next_check_block = {}
+
+        # Latest health score per checked account, and the candidates already emitted.
+        self.health_scores = {}
+        self._emitted = set()
+
+        self.last_block = None
+        self._liquidatable_health_score = None
+        self._stopped = threading.Event()
+
+    @property
+    def liquidatable_health_score(self):
+        '''
+        Get the health score at or below which the bank liquidates, read once.
+        '''
+        if self._liquidatable_health_score is None:
+            self._liquidatable_health_score = self.reader._call_function(
+                self.reader.strategy_bank.functions.LIQUIDATABLE_HEALTH_SCORE(),
+            )
+        return self._liquidatable_health_score
+
+    def scan(self, block_number=None):
+        '''
+        Check the accounts due at `block_number` and emit the liquidatable ones. A
+        candidate whose `on_candidate` fails is passed to `on_error`, or logged, and
+        emitted again on the next block.
+
+        :param block_number: optional
+        :type block_number: integer
+
+        :returns: []Object, the candidates emitted
+        '''
+        if block_number is None:
+            block_number = self.reader.web3.eth.blockNumber
+
+        self.sync_strategy_accounts(block_number)
+
+        due_accounts = [
+            strategy_account for strategy_account in self.strategy_accounts
+            if self.next_check_block[strategy_account] <= block_number
+        ]
+        snapshots = self.reader.get_accounts_snapshot(
+            due_accounts,
+            max_workers=self.max_workers,
+            block_identifier=block_number,
+        )
+
+        # Accounts without a loan cannot be liquidated, nor can ones being liquidated.
+        indebted_snapshots = [
+            snapshot for snapshot in snapshots
+            if snapshot['loan'] and snapshot['liquidation_status'] == 0
+        ]
+        results = self.reader.call_many(
+            [
+                self.reader.strategy_bank.functions.isAccountLiquidatable(
+                    snapshot['strategy_account'],
+                    snapshot['account_value'],
+                )
+                for snapshot in indebted_snapshots
+            ],
+            block_identifier=block_number,
+        )
+        is_liquidatable = {
+            snapshot['strategy_account']: result['result']
+            for snapshot, result in zip(indebted_snapshots, results)
+        }
+
+        candidates = []
+        for snapshot in snapshots:
+            strategy_account = snapshot['strategy_account']
+            health_score = self.compute_health_score(snapshot)
+            self.health_scores[strategy_account] = health_score
+
+            # Re-check accounts near the threshold, or unreadable, sooner.
+            is_risky = (
+                health_score is None or
+                health_score <= self.liquidatable_health_score + self.risky_health_score_margin
+            )
+            self.next_check_block[strategy_account] = block_number + (
+                self.risky_check_interval if is_risky else self.safe_check_interval
+            )
+
+            if not is_liquidatable.get(strategy_account):
+                self._emitted.discard(strategy_account)
+            elif strategy_account not in self._emitted:
+                candidates.append(dict(
+                    snapshot,
+                    health_score=health_score,
+                    block_number=block_number,
+                ))
+
+        candidates.sort(key=lambda candidate: candidate['health_score'] or 0)
+        emitted_candidates = []
+        for candidate in candidates:
+            strategy_account = candidate['strategy_account']
+            try:
+                self.on_candidate(candidate)
+            except Exception as error:
+                # Emitted again on the next block, without holding back the others.
+                self.next_check_block[strategy_account] = block_number + 1
+                self._handle_error(error)
+                continue
+
+            self._emitted.add(strategy_account)
+            emitted_candidates.append(candidate)
+
+        self.last_block = block_number
+        return emitted_candidates
+
+    def run(self, poll_interval=Constants.DEFAULT_BLOCK_POLL_INTERVAL):
+        '''
+        Scan every new block until `stop` is called. Errors do not stop the scanner:
+        each is passed to `on_error`, or logged, and polling resumes after a backoff
+        that doubles with consecutive failures, up to `max_backoff` seconds.
+
+        :param poll_interval: optional
+        :type poll_interval: number, seconds between block number polls
+        '''
+        self._stopped.clear()
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                block_number = self.reader.web3.eth.blockNumber
+                if self.last_block is None or block_number > self.last_block:
+                    self.scan(block_number)
+            except Exception as error:
+                failures += 1
+                self._handle_error(error)
+                self._stopped.wait(
+                    min(self.retry_backoff * 2 ** (failures - 1), self.max_backoff),
+                )
+                continue
+
+            failures = 0
+            self._stopped.wait(poll_interval)
+
+    def stop(self):
+        '''
+        Stop `run` after the current scan.
+        '''
+        self._stopped.set()
+
+    def sync_strategy_accounts(self, block_number):
+        '''
+        Add the strategy accounts opened since the last sync, due for a check at once.
+
+        :param block_number: required
+        :type block_number: integer
+
+        :returns: []address, the new strategy accounts
+        '''
+        new_accounts = self.reader._call_function(
+            self.reader.strategy_bank.functions.getStrategyAccounts(
+                len(self.strategy_accounts),
+                0,
+            ),
+            block_identifier=block_number,
+        )
+        for strategy_account in new_accounts:
+            self.strategy_accounts.append(strategy_account)
+            self.next_check_block[strategy_account] = block_number
+
+        return new_accounts
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    def _handle_error(self, error):
+        '''
+        Pass an error of `run` or `on_candidate` to `on_error`, or log it. Errors of `on_error` itself are
+        logged, so they cannot stop the scanner either.
+        '''
+        if self.on_error is None:
+            logger.error('Liquidation scan failed', exc_info=error)
+            return
+
+        try:
+            self.on_error(error)
+        except Exception:
+            logger.exception('Liquidation scanner error handler failed')
+
+    @staticmethod
+    def compute_health_score(snapshot):
+        '''
+        Estimate the health score of an account snapshot, the share of its collateral
+        not lost to the loan exceeding the account value. Only used to prioritize
+        accounts; `isAccountLiquidatable` decides liquidations.
+
+        :param snapshot: required
+        :type snapshot: Object, from `get_accounts_snapshot`
+
+        :returns: integer | None, None if the snapshot is incomplete
+        '''
+        collateral, loan = snapshot['collateral'], snapshot['loan']
+        account_value = snapshot['account_value']
+        if collateral is None or loan is None or account_value is None:
+            return None
+        if collateral == 0:
+            return Constants.ONE_HUNDRED_PERCENT if loan == 0 else 0
+
+        loss = min(max(loan - account_value, 0), collateral)
+        return (collateral - loss) * Constants.ONE_HUNDRED_PERCENT // collateral
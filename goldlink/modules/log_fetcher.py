@@ -0,0 +1,218 @@
+"""Module providing historical log backfills for GoldLink Contracts."""
+
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+import goldlink.constants as Constants
+from goldlink.helpers import decode_log
+from goldlink.modules.contract_registry import CONTRACT_REGISTRY
+
+# ABIs of the contracts whose events are backfilled by default.
+EVENT_ABI_FILE_PATHS = [
+    Constants.STRATEGY_RESERVE_ABI,
+    Constants.STRATEGY_BANK_ABI,
+    Constants.STRATEGY_ACCOUNT_ABI,
+    Constants.GMX_FRF_STRATEGY_ACCOUNT_ABI,
+    Constants.GMX_FRF_STRATEGY_MANAGER_ABI,
+]
+
+# Fragments of the errors nodes return for a block range with too many logs.
+LOG_RANGE_ERRORS = (
+    'more than',
+    'too many',
+    'limit exceeded',
+    'response size',
+    'block range',
+    'range is too large',
+)
+
+
+class LogFetcher(object):
+    '''
+    Module for reading the logs of long block ranges. Ranges are split into chunks that
+    are fetched in parallel and yielded in block order as they arrive. The chunk size
+    adapts to the node: a chunk with too many logs is split in half and the chunk size
+    shrinks with it, while sparse chunks grow the chunk size.
+    '''
+
+    def __init__(
+        self,
+        web3,
+        chunk_size=Constants.DEFAULT_LOG_CHUNK_SIZE,
+        max_chunk_size=Constants.DEFAULT_MAX_LOG_CHUNK_SIZE,
+        target_logs_per_chunk=Constants.DEFAULT_TARGET_LOGS_PER_CHUNK,
+        max_workers=None,
+    ):
+        self.web3 = web3
+        self.chunk_size = chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_logs_per_chunk = target_logs_per_chunk
+        self.max_workers = max_workers or Constants.DEFAULT_MAX_WORKERS
+
+    def iter_events(
+        self,
+        from_block,
+        to_block,
+        address=None,
+        event_names=None,
+        file_paths=None,
+    ):
+        '''
+        Yield the decoded events of the GoldLink ABIs between two blocks, inclusive.
+
+        :param from_block: required
+        :type from_block: integer
+
+        :param to_block: required
+        :type to_block: integer
+
+        :param address: optional
+        :type address: address | []address, every contract by default
+
+        :param event_names: optional
+        :type event_names: []string, every event by default
+
+        :param file_paths: optional
+        :type file_paths: []string, EVENT_ABI_FILE_PATHS by default
+
+        :returns: generator of AttributeDict
+
+        :raises: ValueError
+        '''
+        event_abis_by_topic = self.get_event_abis_by_topic(file_paths or EVENT_ABI_FILE_PATHS)
+        if event_names is not None:
+            event_abis_by_topic = self.select_event_abis(event_abis_by_topic, event_names)
+
+        log_filter = {'topics': [list(event_abis_by_topic)]}
+        if address is not None:
+            log_filter['address'] = address
+
+        for log in self.iter_logs(log_filter, from_block, to_block):
+            event = decode_log(self.web3, event_abis_by_topic, log)
+            if event is not None:
+                yield event
+
+    def iter_logs(self, log_filter, from_block, to_block):
+        '''
+        Yield the raw logs matching a filter between two blocks, inclusive, in order.
+
+        :param log_filter: required
+        :type log_filter: FilterParams, without a block range
+
+        :param from_block: required
+        :type from_block: integer
+
+        :param to_block: required
+        :type to_block: integer
+
+        :returns: generator of LogReceipt
+
+        :raises: ValueError
+        '''
+        pending = collections.deque()
+        next_block = from_block
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            def submit(start, end):
+                return (start, end, executor.submit(self._get_logs, log_filter, start, end))
+
+            try:
+                while pending or next_block <= to_block:
+                    # Keep a chunk in flight per worker, in block order.
+                    while next_block <= to_block and len(pending) < self.max_workers:
+                        end = min(next_block + self.chunk_size - 1, to_block)
+                        pending.append(submit(next_block, end))
+                        next_block = end + 1
+
+                    start, end, future = pending.popleft()
+                    try:
+                        logs = future.result()
+                    except ValueError as error:
+                        if start == end or not self.is_log_range_error(error):
+                            raise
+                        middle = (start + end) // 2
+                        self.chunk_size = max(min(self.chunk_size, middle - start + 1), 1)
+                        pending.appendleft(submit(middle + 1, end))
+                        pending.appendleft(submit(start, middle))
+                        continue
+
+                    if (
+                        len(logs) < self.target_logs_per_chunk // 2 and
+                        end - start + 1 >= self.chunk_size
+                    ):
+                        self.chunk_size = min(self.chunk_size * 2, self.max_chunk_size)
+
+                    yield from logs
+            finally:
+                # Don't wait on chunks nobody will read when the consumer stops early.
+                for _, _, future in pending:
+                    future.cancel()
+
+    def _get_logs(self, log_filter, from_block, to_block):
+        '''
+        Get the logs matching a filter in one block range.
+
+        :returns: []LogReceipt
+        '''
+        return self.web3.eth.get_logs(dict(log_filter, fromBlock=from_block, toBlock=to_block))
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    @staticmethod
+    def get_event_abis_by_topic(file_paths):
+        '''
+        Get the ABIs of every event in many bundled ABIs, keyed by topic.
+
+        :param file_paths: required
+        :type file_paths: []string
+
+        :returns: Object, []event ABI per topic
+        '''
+        return CONTRACT_REGISTRY.get_merged_event_abis_by_topic(file_paths)
+
+    @staticmethod
+    def select_event_abis(event_abis_by_topic, event_names):
+        '''
+        Select the event ABIs of some events by name. Every name must match an event,
+        since a filter without topics would match every log.
+
+        :param event_abis_by_topic: required
+        :type event_abis_by_topic: Object, []event ABI per topic
+
+        :param event_names: required
+        :type event_names: []string
+
+        :returns: Object, []event ABI per topic
+
+        :raises: ValueError
+        '''
+        if not event_names:
+            raise ValueError('No event names given')
+
+        selected = {
+            topic: event_abis for topic, event_abis in event_abis_by_topic.items()
+            if event_abis[0]['name'] in event_names
+        }
+
+        unknown_names = set(event_names) - {
+            event_abis[0]['name'] for event_abis in selected.values()
+        }
+        if unknown_names:
+            raise ValueError(f'Unknown events: {", ".join(sorted(unknown_names))}')
+
+        return selected
+
+    @staticmethod
+    def is_log_range_error(error):
+        '''
+        Get whether an error means a block range holds too many logs for one request.
+
+        :param error: required
+        :type error: ValueError
+
+        :returns: boolean
+        '''
+        message = str(error).lower()
+        return any(fragment in message for fragment in LOG_RANGE_ERRORS)
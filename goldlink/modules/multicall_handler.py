@@ -0,0 +1,124 @@
+"""Module providing batched reads of GoldLink Contracts through Multicall3."""
+
+from eth_abi.exceptions import DecodingError
+from web3 import Web3
+
+import goldlink.constants as Constants
+from goldlink.helpers import decode_function_result
+
+
+class MulticallHandler():
+
+    '''
+    Module for aggregating contract reads into Multicall3 `aggregate3` requests.
+    '''
+
+    def __init__(
+        self,
+        network_id,
+        multicall_batch_size=None,
+    ):
+        # Multicall3 is deployed at the same address on most chains, so default to it.
+        self.multicall_address = Constants.CONTRACTS[Constants.MULTICALL3].get(
+            network_id,
+            Constants.CONTRACTS[Constants.MULTICALL3][Constants.NETWORK_ID_MAINNET],
+        )
+        self.multicall_batch_size = multicall_batch_size or Constants.DEFAULT_MULTICALL_BATCH_SIZE
+
+    def call_many(
+        self,
+        calls,
+        allow_failure=True,
+        block_identifier='latest',
+    ):
+        '''
+        Read many contract functions in as few round trips as possible.
+
+        Each call is either a contract function with its arguments bound, e.g.
+        `contract.functions.balanceOf(address)`, or a `(function, parser)` tuple
+        whose parser is applied to the decoded result, so batched reads can return
+        the same shapes as the individual getters. Results are returned in call order.
+
+        :param calls: required
+        :type calls: []function
+
+        :param allow_failure: optional
+        :type allow_failure: boolean
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: []Object
+
+        :raises: ContractLogicError, DecodingError
+        '''
+        results = []
+        for batch, aggregate in self._get_multicall_batches(calls, allow_failure):
+            return_data = aggregate.call(block_identifier=block_identifier)
+            results.extend(self._decode_multicall_batch(batch, return_data, allow_failure))
+
+        return results
+
+    def _get_multicall_batches(self, calls, allow_failure):
+        '''
+        Split calls into batches of at most `multicall_batch_size`, each with the
+        `aggregate3` call reading it.
+
+        :returns: [([](function, parser), function)]
+        '''
+        multicall = self.get_multicall3(self.multicall_address)
+        batches = []
+
+        for start in range(0, len(calls), self.multicall_batch_size):
+            batch = [
+                call if isinstance(call, tuple) else (call, None)
+                for call in calls[start:start + self.multicall_batch_size]
+            ]
+            aggregate = multicall.functions.aggregate3([
+                (
+                    function.address,
+                    allow_failure,
+                    Web3.toBytes(hexstr=function._encode_transaction_data()),
+                )
+                for function, _ in batch
+            ])
+            batches.append((batch, aggregate))
+
+        return batches
+
+    def _decode_multicall_batch(self, batch, return_data, allow_failure):
+        '''
+        Decode and parse the results of a batch of aggregated calls.
+
+        :returns: []Object
+        '''
+        return [
+            self._decode_call_result(function, parser, success, data, allow_failure)
+            for (function, parser), (success, data) in zip(batch, return_data)
+        ]
+
+    def _decode_call_result(self, function, parser, success, data, allow_failure):
+        '''
+        Decode and parse the result of a single aggregated call.
+
+        :returns: Object
+        '''
+        if success:
+            try:
+                result = decode_function_result(self.web3, function.abi, data)
+            except DecodingError:
+                # A call to an address without code succeeds with empty return data.
+                if not allow_failure:
+                    raise
+                success = False
+
+        if not success:
+            return {
+                "success": False,
+                "result": None,
+            }
+
+        return {
+            "success": True,
+            "result": parser(result) if parser else result,
+        }
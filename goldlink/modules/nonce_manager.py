@@ -0,0 +1,320 @@
+"""Module providing a process-wide manager of transaction nonces."""
+
+import threading
+import time
+
+from web3 import Web3
+
+import goldlink.constants as Constants
+
+# Fragments of the errors nodes return for a nonce already used.
+NONCE_ERRORS = (
+    'nonce too low',
+    'replacement transaction underpriced',
+)
+
+
+class _NonceState(object):
+    '''
+    Nonces of one address on one endpoint.
+    '''
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+        # Next unused nonce, None until synced from the node.
+        self.next_nonce = None
+
+        # Nonces handed out and not yet sent or released.
+        self.reserved = set()
+
+        # Nonces released below the next nonce, handed out again first.
+        self.gaps = set()
+
+        # Nonces sent above a gap or reservation, which the node may not count yet.
+        self.sent = set()
+
+        # Time the count was last compared with the node's, and the count of the node
+        # if it was short of the nonces sent then.
+        self.last_gap_check = None
+        self.short_count = None
+
+
+class NonceManager(object):
+
+    '''
+    Thread-safe manager of the nonces of every sending address, shared by every writer
+    in the process. Nonces are counted per endpoint and address from the node's pending
+    transaction count, and handed out under a lock so concurrent transactions never
+    share one. A nonce is reserved until its transaction is sent or released. Released
+    nonces are handed out again first, so a failed transaction leaves no gap stalling
+    the ones after it, and the count is resynced from the node when a nonce turns out
+    to be used. Every `gap_check_interval` seconds the count is also compared with the
+    node's: if the node stays short of the nonces sent over two checks, the missing
+    transactions were dropped, and their nonces become gaps handed out first.
+    '''
+
+    def __init__(
+        self,
+        gap_check_interval=Constants.DEFAULT_NONCE_GAP_CHECK_INTERVAL,
+    ):
+        self.gap_check_interval = gap_check_interval
+
+        self._lock = threading.Lock()
+        self._states = {}
+
+    def reserve(self, key, get_transaction_count=None):
+        '''
+        Hand out the lowest unused nonce, syncing from the node on first use and
+        checking it for dropped transactions when a check is due.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :param get_transaction_count: optional
+        :type get_transaction_count: function, returning the pending transaction count
+
+        :returns: integer
+
+        :raises: ValueError
+        '''
+        state = self._get_state(key)
+        if get_transaction_count is not None and self.is_gap_check_due(key):
+            self.check_gaps(key, get_transaction_count())
+
+        with state.lock:
+            if state.next_nonce is None:
+                if get_transaction_count is None:
+                    raise ValueError(f'Nonces of {key} are not synced')
+                self._sync(state, get_transaction_count())
+
+            if state.gaps:
+                nonce = min(state.gaps)
+                state.gaps.remove(nonce)
+            else:
+                nonce = state.next_nonce
+                state.next_nonce += 1
+            state.reserved.add(nonce)
+            return nonce
+
+    def confirm(self, key, nonce):
+        '''
+        Mark a reserved nonce as used, by a sent transaction or by another sender.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :param nonce: required
+        :type nonce: integer
+        '''
+        state = self._get_state(key)
+        with state.lock:
+            state.reserved.discard(nonce)
+            state.gaps.discard(nonce)
+
+            # Nonces sent below every gap and reservation are counted by the node.
+            pending = state.gaps | state.reserved
+            if pending:
+                lowest_pending = min(pending)
+                state.sent = {n for n in state.sent if n > lowest_pending}
+                if nonce > lowest_pending:
+                    state.sent.add(nonce)
+            else:
+                state.sent.clear()
+
+    def release(self, key, nonce):
+        '''
+        Return a reserved nonce whose transaction was not sent, to be handed out again.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :param nonce: required
+        :type nonce: integer
+        '''
+        state = self._get_state(key)
+        with state.lock:
+            if nonce not in state.reserved:
+                return
+            state.reserved.remove(nonce)
+            state.gaps.add(nonce)
+
+            # Gaps at the top are just unused nonces.
+            while state.next_nonce - 1 in state.gaps:
+                state.next_nonce -= 1
+                state.gaps.remove(state.next_nonce)
+
+    def sync(self, key, transaction_count, force=True):
+        '''
+        Resync the nonces of a key from the node's pending transaction count. Reserved
+        and sent nonces are kept, and unused nonces from the count up to them become
+        gaps to hand out first.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :param transaction_count: required
+        :type transaction_count: integer
+
+        :param force: optional
+        :type force: boolean, whether to resync a key already synced
+        '''
+        state = self._get_state(key)
+        with state.lock:
+            if force or state.next_nonce is None:
+                self._sync(state, transaction_count)
+
+    def is_gap_check_due(self, key):
+        '''
+        Get whether the nonces of a synced key are due to be checked against the node,
+        marking the check as started.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :returns: boolean
+        '''
+        state = self._get_state(key)
+        with state.lock:
+            now = time.monotonic()
+            if state.next_nonce is None or now - state.last_gap_check < self.gap_check_interval:
+                return False
+            state.last_gap_check = now
+            return True
+
+    def check_gaps(self, key, transaction_count):
+        '''
+        Compare the nonces of a key with the node's pending transaction count. A count
+        short of the nonces sent is allowed once, as the node may not have seen the
+        latest transactions yet. If it is still short and unchanged on the next check,
+        those transactions were dropped and the nonces are resynced from the count.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :param transaction_count: required
+        :type transaction_count: integer
+
+        :returns: boolean, whether the nonces were resynced
+        '''
+        state = self._get_state(key)
+        with state.lock:
+            if state.next_nonce is None:
+                return False
+
+            # The node counts every nonce sent below the lowest gap or reservation.
+            pending = state.gaps | state.reserved
+            expected_count = min(pending) if pending else state.next_nonce
+            if transaction_count >= expected_count:
+                state.short_count = None
+                return False
+
+            if state.short_count != transaction_count:
+                state.short_count = transaction_count
+                return False
+
+            self._sync(state, transaction_count)
+            return True
+
+    def is_synced(self, key):
+        '''
+        Get whether the nonces of a key were synced from the node.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :returns: boolean
+        '''
+        return self._get_state(key).next_nonce is not None
+
+    def get_next_nonce(self, key, get_transaction_count):
+        '''
+        Get the nonce the next reservation will hand out, without reserving it.
+
+        :param key: required
+        :type key: tuple, see get_key
+
+        :param get_transaction_count: required
+        :type get_transaction_count: function, returning the pending transaction count
+
+        :returns: integer
+        '''
+        state = self._get_state(key)
+        with state.lock:
+            if state.next_nonce is None:
+                self._sync(state, get_transaction_count())
+            return min(state.gaps) if state.gaps else state.next_nonce
+
+    def reset(self, key=None):
+        '''
+        Forget the nonces of a key, or of every key, so they are synced again on use.
+
+        :param key: optional
+        :type key: tuple, see get_key
+        '''
+        with self._lock:
+            if key is None:
+                self._states.clear()
+            else:
+                self._states.pop(key, None)
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    def _get_state(self, key):
+        '''
+        Get the nonces of a key, creating them on first use.
+
+        :returns: _NonceState
+        '''
+        with self._lock:
+            if key not in self._states:
+                self._states[key] = _NonceState()
+            return self._states[key]
+
+    @staticmethod
+    def _sync(state, transaction_count):
+        '''
+        Set the nonces of a state from a pending transaction count, holding its lock.
+        '''
+        state.sent = {n for n in state.sent if n >= transaction_count}
+        used = state.reserved | state.sent
+        state.next_nonce = max([transaction_count] + [n + 1 for n in used])
+        state.gaps = set(range(transaction_count, state.next_nonce)) - used
+        state.last_gap_check = time.monotonic()
+        state.short_count = None
+
+    @staticmethod
+    def get_key(web3, address):
+        '''
+        Get the key nonces of an address are counted under, its endpoint and address.
+
+        :param web3: required
+        :type web3: Web3, sync or async
+
+        :param address: required
+        :type address: address
+
+        :returns: tuple
+        '''
+        provider = web3.provider
+        endpoint = getattr(provider, 'endpoint_uri', None) or id(provider)
+        return (str(endpoint), Web3.toChecksumAddress(address))
+
+    @staticmethod
+    def is_nonce_error(error):
+        '''
+        Get whether an error means a transaction's nonce was already used.
+
+        :param error: required
+        :type error: ValueError
+
+        :returns: boolean
+        '''
+        message = str(error).lower()
+        return any(fragment in message for fragment in NONCE_ERRORS)
+
+
+# Nonce manager shared by all GoldLink writers in the process.
+NONCE_MANAGER = NonceManager()
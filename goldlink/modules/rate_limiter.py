@@ -0,0 +1,32 @@
+"""Module providing a thread-safe request rate limiter."""
+
+import threading
+import time
+
+
+class RateLimiter(object):
+
+    '''
+    Module for spacing requests shared by many threads to at most
+    `max_requests_per_second`. Requests beyond the rate wait for their slot.
+    '''
+
+    def __init__(
+        self,
+        max_requests_per_second,
+    ):
+        self.interval = 1 / max_requests_per_second
+        self._next_request_at = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        '''
+        Wait until a request may be sent.
+        '''
+        with self._lock:
+            now = time.monotonic()
+            request_at = max(now, self._next_request_at)
+            self._next_request_at = request_at + self.interval
+
+        if request_at > now:
+            time.sleep(request_at - now)
@@ -1,9 +1,18 @@
 """Module providing access to methods for reading from GoldLink Contracts."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from web3 import Web3
+
+import goldlink.constants as Constants
+from goldlink.helpers import call_with_retries
 from goldlink.modules.contract_handler import ContractHandler
+from goldlink.modules.multicall_handler import MulticallHandler
+from goldlink.modules.rate_limiter import RateLimiter
 
 
-class Reader(ContractHandler):
+class Reader(ContractHandler, MulticallHandler):
     '''
     Module for reading from the GoldLink Protocol.
     '''
@@ -16,16 +25,49 @@ class Reader(ContractHandler):
         strategy_reserve=None,
     ):
         ContractHandler.__init__(self, web3)
+        MulticallHandler.__init__(self, network_id)
 
         self.network_id = network_id
 
-        self.strategy_bank = None
-        self.strategy_reserve = None
+        # Contracts are bound on first use.
+        self.strategy_bank_address = strategy_bank
+        self.strategy_reserve_address = strategy_reserve
+
+        # Thread pool reading snapshots, kept across calls so its threads keep their
+        # connections.
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def close(self):
+        '''
+        Shut down the thread pool reading snapshots, if started.
+        '''
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    # -----------------------------------------------------------
+    # Strategy Contracts
+    # -----------------------------------------------------------
+
+    @property
+    def strategy_bank(self):
+        '''
+        Get the StrategyBank contract, if a strategy bank was provided.
+        '''
+        if self.strategy_bank_address:
+            return self.get_strategy_bank(self.strategy_bank_address)
+        return None
 
-        if strategy_bank:
-            self.strategy_bank = self.get_strategy_bank(strategy_bank)
-        if strategy_reserve:
-            self.strategy_reserve = self.get_strategy_reserve(strategy_reserve)
+    @property
+    def strategy_reserve(self):
+        '''
+        Get the StrategyReserve contract, if a strategy reserve was provided.
+        '''
+        if self.strategy_reserve_address:
+            return self.get_strategy_reserve(self.strategy_reserve_address)
+        return None
 
     # -----------------------------------------------------------
     # Address Querying Functions
@@ -38,9 +80,9 @@ class Reader(ContractHandler):
         :returns: address
         '''
         if self.strategy_reserve:
-            return self.strategy_reserve.functions.STRATEGY_ASSET().call()
+            return self._call_function(self.strategy_reserve.functions.STRATEGY_ASSET())
         if self.strategy_bank:
-            return self.strategy_bank.functions.STRATEGY_ASSET().call()
+            return self._call_function(self.strategy_bank.functions.STRATEGY_ASSET())
 
     def get_strategy_bank_for_reserve(self):
         '''
@@ -48,7 +90,7 @@ class Reader(ContractHandler):
 
         :returns: address
         '''
-        return self.strategy_reserve.functions.STRATEGY_BANK().call()
+        return self._call_function(self.strategy_reserve.functions.STRATEGY_BANK())
 
     def get_strategy_reserve_for_bank(self):
         '''
@@ -56,7 +98,7 @@ class Reader(ContractHandler):
 
         :returns: address
         '''
-        return self.strategy_bank.functions.STRATEGY_RESERVE().call()
+        return self._call_function(self.strategy_bank.functions.STRATEGY_RESERVE())
 
     # -----------------------------------------------------------
     # ERC20 Querying Functions
@@ -74,7 +116,7 @@ class Reader(ContractHandler):
 
         :returns: integer
         '''
-        return self.get_erc20(erc20).functions.balanceOf(address).call()
+        return self._call_function(self.get_erc20(erc20).functions.balanceOf(address))
 
     # -----------------------------------------------------------
     # Borrowing Functions
@@ -102,10 +144,33 @@ class Reader(ContractHandler):
         ).call()
 
         if owner:
-            strategy_account_addresses = [s for s in strategy_account_addresses if self.get_strategy_account(s).functions.getOwner().call() == owner]
+            owners = self.get_strategy_account_owners(strategy_account_addresses)
+            strategy_account_addresses = [
+                s for s in strategy_account_addresses if owners[s] == Web3.toChecksumAddress(owner)
+            ]
 
         return strategy_account_addresses
 
+    def get_strategy_account_owners(self, strategy_accounts, block_identifier='latest'):
+        '''
+        Get the owner of each strategy account, read in batches.
+
+        :param strategy_accounts: required
+        :type strategy_accounts: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, owner per strategy account
+        '''
+        owners = self.call_many(
+            self._get_strategy_account_owner_calls(strategy_accounts),
+            block_identifier=block_identifier,
+        )
+        return {
+            s: owner["result"] for s, owner in zip(strategy_accounts, owners)
+        }
+
     def get_strategy_account_holdings(self, strategy_account):
         '''
         Get holdings for a strategy account.
@@ -115,14 +180,10 @@ class Reader(ContractHandler):
 
         :returns: AttributeDict
         '''
-        holdings = self.strategy_bank.functions.getStrategyAccountHoldings(
-            strategy_account,
-        ).call()
-        return {
-            'collateral': holdings[0],
-            'loan': holdings[1],
-            'interestIndexLast': holdings[2]
-        }
+        return self._call_function(
+            self.strategy_bank.functions.getStrategyAccountHoldings(strategy_account),
+            self.parse_strategy_account_holdings,
+        )
 
     def get_strategy_account_holdings_after_paying_interest(self, strategy_account):
         '''
@@ -133,12 +194,10 @@ class Reader(ContractHandler):
 
         :returns: AttributeDict
         '''
-        holdings = self.strategy_bank.functions.getStrategyAccountHoldingsAfterPayingInterest(strategy_account).call()
-        return {
-            'collateral': holdings[0],
-            'loan': holdings[1],
-            'interestIndexLast': holdings[2]
-        }
+        return self._call_function(
+            self.strategy_bank.functions.getStrategyAccountHoldingsAfterPayingInterest(strategy_account),
+            self.parse_strategy_account_holdings,
+        )
 
     def get_withdrawable_collateral(self, strategy_account):
         '''
@@ -149,7 +208,7 @@ class Reader(ContractHandler):
 
         :returns: integer
         '''
-        return self.strategy_bank.functions.getWithdrawableCollateral(strategy_account).call()
+        return self._call_function(self.strategy_bank.functions.getWithdrawableCollateral(strategy_account))
 
     def get_account_liquidation_status(self, strategy_account):
         '''
@@ -160,7 +219,7 @@ class Reader(ContractHandler):
 
         :returns: integer, 0 == not liquidatable
         '''
-        return self.get_strategy_account(strategy_account).functions.getAccountLiquidationStatus().call()
+        return self._call_function(self.get_strategy_account(strategy_account).functions.getAccountLiquidationStatus())
 
     def get_account_value(self, strategy_account):
         '''
@@ -171,4 +230,179 @@ class Reader(ContractHandler):
 
         :returns: integer
         '''
-        return self.get_strategy_account(strategy_account).functions.getAccountValue().call()
+        return self._call_function(self.get_strategy_account(strategy_account).functions.getAccountValue())
+
+    # -----------------------------------------------------------
+    # Account Snapshot Functions
+    # -----------------------------------------------------------
+
+    def get_accounts_snapshot(
+        self,
+        strategy_accounts,
+        max_workers=None,
+        max_requests_per_second=None,
+        max_retries=None,
+        block_identifier='latest',
+    ):
+        '''
+        Get the holdings, value and liquidation status of many strategy accounts.
+        Accounts are read in multicall batches spread over a bounded thread pool, kept
+        by the reader across calls and shut down by `close`. Failed batches are
+        retried, and a batch whose retries run out or that reverts raises.
+
+        :param strategy_accounts: required
+        :type strategy_accounts: []address
+
+        :param max_workers: optional
+        :type max_workers: integer
+
+        :param max_requests_per_second: optional
+        :type max_requests_per_second: number, unlimited by default
+
+        :param max_retries: optional
+        :type max_retries: integer
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: []Object, one record per strategy account in input order
+        '''
+        max_workers = max_workers or Constants.DEFAULT_MAX_WORKERS
+        if max_retries is None:
+            max_retries = Constants.DEFAULT_MAX_RETRIES
+        rate_limiter = RateLimiter(max_requests_per_second) if max_requests_per_second else None
+
+        # Three calls per account, so every chunk is read in a single multicall.
+        chunk_size = max(self.multicall_batch_size // 3, 1)
+        chunks = [
+            strategy_accounts[start:start + chunk_size]
+            for start in range(0, len(strategy_accounts), chunk_size)
+        ]
+
+        def read_chunk(chunk):
+            return call_with_retries(
+                lambda: self._get_accounts_snapshot_chunk(chunk, block_identifier),
+                max_retries=max_retries,
+                rate_limiter=rate_limiter,
+            )
+
+        if max_workers == Constants.DEFAULT_MAX_WORKERS:
+            chunk_records = self._get_executor().map(read_chunk, chunks)
+        else:
+            # Pools of other sizes last one call, so a pool in use is never replaced.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                chunk_records = list(executor.map(read_chunk, chunks))
+
+        return [record for records in chunk_records for record in records]
+
+    def _get_accounts_snapshot_chunk(self, strategy_accounts, block_identifier):
+        '''
+        Read the snapshot records of a chunk of strategy accounts in one multicall.
+
+        :returns: []Object
+        '''
+        results = self.call_many(
+            [
+                call
+                for strategy_account in strategy_accounts
+                for call in self._get_account_snapshot_calls(strategy_account)
+            ],
+            block_identifier=block_identifier,
+        )
+
+        return [
+            self.parse_account_snapshot(strategy_account, *results[index * 3:index * 3 + 3])
+            for index, strategy_account in enumerate(strategy_accounts)
+        ]
+
+    def _get_executor(self):
+        '''
+        Get the thread pool reading snapshots with the default number of workers,
+        started on first use and kept until `close`.
+
+        :returns: ThreadPoolExecutor
+        '''
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=Constants.DEFAULT_MAX_WORKERS)
+            return self._executor
+
+    def _get_strategy_account_owner_calls(self, strategy_accounts):
+        '''
+        Get the calls reading the owner of each strategy account. Strategy account
+        functions are raw, so no contract is created per account.
+
+        :returns: []function
+        '''
+        return [
+            self.get_raw_function(s, Constants.STRATEGY_ACCOUNT_ABI, 'getOwner')
+            for s in strategy_accounts
+        ]
+
+    def _get_account_snapshot_calls(self, strategy_account):
+        '''
+        Get the calls reading the snapshot record of a strategy account. Strategy
+        account functions are raw, so no contract is created per account.
+
+        :returns: []function
+        '''
+        return [
+            (
+                self.strategy_bank.functions.getStrategyAccountHoldings(strategy_account),
+                self.parse_strategy_account_holdings,
+            ),
+            self.get_raw_function(strategy_account, Constants.STRATEGY_ACCOUNT_ABI, 'getAccountValue'),
+            self.get_raw_function(
+                strategy_account,
+                Constants.STRATEGY_ACCOUNT_ABI,
+                'getAccountLiquidationStatus',
+            ),
+        ]
+
+    # -----------------------------------------------------------
+    # Parsing Functions
+    # -----------------------------------------------------------
+
+    @staticmethod
+    def parse_strategy_account_holdings(holdings):
+        '''
+        Parse raw strategy account holdings.
+
+        :param holdings: required
+        :type holdings: tuple
+
+        :returns: AttributeDict
+        '''
+        return {
+            'collateral': holdings[0],
+            'loan': holdings[1],
+            'interestIndexLast': holdings[2]
+        }
+
+    @staticmethod
+    def parse_account_snapshot(strategy_account, holdings, account_value, liquidation_status):
+        '''
+        Parse the batched reads of a strategy account into a snapshot record. Fields
+        whose read failed are None.
+
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :param holdings: required
+        :type holdings: Object, multicall result
+
+        :param account_value: required
+        :type account_value: Object, multicall result
+
+        :param liquidation_status: required
+        :type liquidation_status: Object, multicall result
+
+        :returns: Object
+        '''
+        return {
+            'strategy_account': strategy_account,
+            'collateral': holdings["result"]["collateral"] if holdings["success"] else None,
+            'loan': holdings["result"]["loan"] if holdings["success"] else None,
+            'account_value': account_value["result"],
+            'liquidation_status': liquidation_status["result"],
+        }
@@ -0,0 +1,391 @@
+"""Module providing asynchronous access to methods for reading from GoldLink Contracts for the GMX Funding-rate Farming strategy."""
+
+from web3 import Web3
+
+from goldlink.modules.async_call_handler import AsyncCallHandler
+from goldlink.modules.strategies.gmx_frf.gmx_frf_reader import GmxFrfReader
+
+
+class AsyncGmxFrfReader(AsyncCallHandler, GmxFrfReader):
+    '''
+    Module for reading from the GoldLink Protocol for the GMX Funding-rate Farming strategy
+    asynchronously. Offers every method of `GmxFrfReader`, returning coroutines, and
+    shares its market metadata cache format. Calls are built and parsed by the helpers
+    of `GmxFrfReader`, so only how they are awaited differs.
+    '''
+
+    def __init__(
+        self,
+        web3,
+        async_web3,
+        network_id,
+        market_metadata_path=None,
+    ):
+        GmxFrfReader.__init__(
+            self,
+            web3,
+            network_id,
+            market_metadata_path=market_metadata_path,
+        )
+        AsyncCallHandler.__init__(self, async_web3)
+
+    # -----------------------------------------------------------
+    # Market Querying Functions
+    # -----------------------------------------------------------
+
+    async def get_token_addresses_for_market(self, market):
+        '''
+        Get addresses for market. Cached after the first read, since they never change.
+
+        :param market: required
+        :type market: address
+
+        :returns: Object
+        '''
+        return (await self.get_market_metadata(market))["token_addresses"]
+
+    async def get_market_info(self, market, block_identifier='latest'):
+        '''
+        Get market information.
+
+        :param market: required
+        :type market: address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object
+        '''
+        market_infos = await self.get_all_market_infos(
+            [market],
+            block_identifier=block_identifier,
+        )
+        return market_infos[Web3.toChecksumAddress(market)]
+
+    async def get_all_market_infos(self, markets=None, block_identifier='latest'):
+        '''
+        Get the information of many markets, all available markets by default.
+
+        :param markets: optional
+        :type markets: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, information per market
+        '''
+        if markets is None:
+            markets = await self.get_available_markets()
+        markets = [Web3.toChecksumAddress(market) for market in markets]
+
+        await self._warm_uncached_market_metadata(markets)
+
+        asset_prices = await self.get_asset_prices(
+            self._get_market_tokens(markets),
+            block_identifier=block_identifier,
+        )
+        results = await self.call_many(
+            self._get_market_info_calls(markets, asset_prices),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+
+        return self.parse_results_by_key(markets, results)
+
+    async def get_market_net_funding_rate(self, market):
+        '''
+        Get net funding rate for a market.
+
+        :param market: required
+        :type market: address
+
+        :returns: integer
+        '''
+        market_info = await self.get_market_info(market)
+
+        return self.compute_net_funding_rate(
+            market_info["next_funding"]["funding_factor_per_second"],
+            market_info["next_funding"]["longs_pay_shorts"],
+            market_info["borrowing_factor_per_second_for_shorts"],
+        )
+
+    # -----------------------------------------------------------
+    # Market Metadata Functions
+    # -----------------------------------------------------------
+
+    async def get_market_metadata(self, market, refresh=False):
+        '''
+        Get a market's static metadata, read on first use and cached after.
+
+        :param market: required
+        :type market: address
+
+        :param refresh: optional
+        :type refresh: boolean
+
+        :returns: Object
+        '''
+        market = Web3.toChecksumAddress(market)
+        metadata = None if refresh else self.market_metadata.get(market)
+        if metadata is None:
+            metadata = (await self.warm_market_metadata([market]))[market]
+        return metadata
+
+    async def warm_market_metadata(self, markets=None, block_identifier='latest'):
+        '''
+        Read and cache the metadata of `markets`, all available markets by default, in
+        two batched round trips.
+
+        :param markets: optional
+        :type markets: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, metadata per market
+        '''
+        if markets is None:
+            markets = await self.get_available_markets()
+        markets = [Web3.toChecksumAddress(market) for market in markets]
+        if not markets:
+            return {}
+
+        market_results = await self.call_many(
+            self._get_market_metadata_calls(markets),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+        tokens = self.parse_market_metadata_tokens(market_results)
+
+        # Synthetic index tokens have no contract, so their decimals may be missing.
+        decimals_results = await self.call_many(
+            [self.get_erc20(token).functions.decimals() for token in tokens],
+            block_identifier=block_identifier,
+        )
+
+        metadata_by_market = self.parse_market_metadata(
+            markets,
+            market_results,
+            self.parse_results_by_key(tokens, decimals_results),
+        )
+        self.market_metadata.update(metadata_by_market)
+
+        return metadata_by_market
+
+    # -----------------------------------------------------------
+    # Asset Querying Functions
+    # -----------------------------------------------------------
+
+    async def get_asset_prices(self, assets, block_identifier='latest'):
+        '''
+        Get the prices of many assets for the strategy, in one batched round trip.
+
+        :param assets: required
+        :type assets: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, price per asset
+        '''
+        results = await self.call_many(
+            self._get_asset_price_calls(assets),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+
+        return self.parse_results_by_key(assets, results)
+
+    # -----------------------------------------------------------
+    # Individual Order/Position Querying Functions
+    # -----------------------------------------------------------
+
+    async def get_position(self, market, strategy_account):
+        '''
+        Get a position.
+
+        :param market: required
+        :type market: address
+
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :returns: Object
+        '''
+        return await self._call_function(
+            self.gmx_v2_reader.functions.getPosition(
+                self.data_store_address,
+                await self.get_position_key(market, strategy_account),
+            ),
+            self.parse_position,
+        )
+
+    async def get_position_info(self, market, strategy_account, block_identifier='latest'):
+        '''
+        Get a position's info.
+
+        :param market: required
+        :type market: address
+
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object
+        '''
+        market = Web3.toChecksumAddress(market)
+        position_key = await self.get_position_key(market, strategy_account)
+
+        tokens = self._get_market_tokens([market])
+        position_info_context = self.parse_position_info_context(tokens, await self.call_many(
+            self._get_position_info_context_calls(tokens),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        ))
+
+        return await self._call_function(
+            self._get_position_info_call(market, position_key, *position_info_context),
+            self.parse_position_info,
+            block_identifier=block_identifier,
+        )
+
+    # -----------------------------------------------------------
+    # Account-wide Position Querying Functions
+    # -----------------------------------------------------------
+
+    async def get_all_positions(self, strategy_account, block_identifier='latest'):
+        '''
+        Get every position of an account.
+
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: []Object
+        '''
+        positions_by_account = await self.get_all_positions_for_accounts(
+            [strategy_account],
+            block_identifier=block_identifier,
+        )
+        return positions_by_account[strategy_account]
+
+    async def get_all_positions_for_accounts(self, strategy_accounts, block_identifier='latest'):
+        '''
+        Get every position of many accounts, in batched round trips.
+
+        :param strategy_accounts: required
+        :type strategy_accounts: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, positions per account
+        '''
+        results = await self.call_many(
+            self._get_account_positions_calls(strategy_accounts),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+
+        return self.parse_results_by_key(strategy_accounts, results)
+
+    async def get_all_position_infos(self, strategy_account, block_identifier='latest'):
+        '''
+        Get the info of every position of an account.
+
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: []Object
+        '''
+        position_infos_by_account = await self.get_all_position_infos_for_accounts(
+            [strategy_account],
+            block_identifier=block_identifier,
+        )
+        return position_infos_by_account[strategy_account]
+
+    async def get_all_position_infos_for_accounts(self, strategy_accounts, block_identifier='latest'):
+        '''
+        Get the info of every position of many accounts.
+
+        :param strategy_accounts: required
+        :type strategy_accounts: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, position infos per account
+        '''
+        positions_by_account = await self.get_all_positions_for_accounts(
+            strategy_accounts,
+            block_identifier=block_identifier,
+        )
+
+        markets = self.get_position_markets(positions_by_account)
+        await self._warm_uncached_market_metadata(markets)
+
+        tokens = self._get_market_tokens(markets)
+        position_info_context = self.parse_position_info_context(tokens, await self.call_many(
+            self._get_position_info_context_calls(tokens),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        ))
+
+        accounts_with_positions = [
+            strategy_account for strategy_account in strategy_accounts
+            if positions_by_account[strategy_account]
+        ]
+        results = await self.call_many(
+            self._get_account_position_info_list_calls(
+                accounts_with_positions,
+                positions_by_account,
+                *position_info_context,
+            ),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+
+        return self.parse_position_infos_by_account(
+            strategy_accounts,
+            accounts_with_positions,
+            results,
+        )
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    async def get_position_key(self, market, strategy_account):
+        '''
+        Get a position's key.
+
+        :param market: required
+        :type market: address
+
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :returns: str
+        '''
+        market_addresses = await self.get_token_addresses_for_market(market)
+        return self.compute_position_key(
+            strategy_account,
+            market,
+            market_addresses['long_token'],
+            False,
+        )
+
+    async def _warm_uncached_market_metadata(self, markets):
+        '''
+        Read the metadata of the markets missing from the cache.
+        '''
+        uncached_markets = [market for market in markets if not self.market_metadata.get(market)]
+        if uncached_markets:
+            await self.warm_market_metadata(uncached_markets)
@@ -0,0 +1,31 @@
+"""Module providing asynchronous access to methods for writing to GoldLink GMX Frf Contracts."""
+
+from goldlink.modules.async_transaction_handler import AsyncTransactionHandler
+from goldlink.modules.strategies.gmx_frf.gmx_frf_writer import GmxFrfWriter
+
+
+class AsyncGmxFrfWriter(AsyncTransactionHandler, GmxFrfWriter):
+
+    '''
+    Module for sending GMX Funding-rate Farming Strategy specific transactions to GoldLink
+    Protocol asynchronously. Offers every method of `GmxFrfWriter`, returning coroutines.
+    '''
+
+    def __init__(
+        self,
+        web3,
+        async_web3,
+        private_key,
+        default_address,
+        send_options,
+        strategy_account=None,
+    ):
+        GmxFrfWriter.__init__(
+            self,
+            web3,
+            private_key,
+            default_address,
+            send_options,
+            strategy_account=strategy_account,
+        )
+        AsyncTransactionHandler.__init__(self, async_web3)
@@ -29,3 +29,8 @@ CONTRACTS = {
         NETWORK_ID_FUJI: '0x5699dde37406bcA54598813Ee6517758d656daE5'
     }
 }
+
+# ------------ GMX V2 Reader ------------
+
+# End index used to read every entry of a GMX V2 Reader list, clamped by the reader.
+MAX_LIST_END = 2 ** 256 - 1
@@ -4,11 +4,12 @@ from web3 import Web3
 from eth_abi import encode_abi
 
 from goldlink.modules.contract_handler import ContractHandler
-from goldlink.helpers import send_raw_query
-from goldlink.modules.strategies.gmx_frf.constants import CONTRACTS, ACCOUNT_GETTERS, MANAGER, GMX_V2_READER, DATA_STORE
+from goldlink.modules.multicall_handler import MulticallHandler
+from goldlink.modules.strategies.gmx_frf.market_metadata_cache import MarketMetadataCache
+from goldlink.modules.strategies.gmx_frf.constants import CONTRACTS, ACCOUNT_GETTERS, MANAGER, GMX_V2_READER, DATA_STORE, MAX_LIST_END
 
 
-class GmxFrfReader(ContractHandler):
+class GmxFrfReader(ContractHandler, MulticallHandler):
     '''
     Module for reading from the GoldLink Protocol for the GMX Funding-rate Farming strategy.
     '''
@@ -17,8 +18,10 @@ class GmxFrfReader(ContractHandler):
         self,
         web3,
         network_id,
+        market_metadata_path=None,
     ):
         ContractHandler.__init__(self, web3)
+        MulticallHandler.__init__(self, network_id)
 
         self.network_id = network_id
 
@@ -28,10 +31,37 @@ class GmxFrfReader(ContractHandler):
         self.manager_address = CONTRACTS[MANAGER][self.network_id]
         self.data_store_address = CONTRACTS[DATA_STORE][self.network_id]
 
-        # Set strategy specific contracts.
-        self.manager = self.get_gmxfrf_strategy_manager(self.manager_address)
-        self.gmx_v2_reader = self.get_gmx_v2_reader(self.gmx_v2_reader_address)
-        self.igmx_v2_datastore = self.get_igmx_v2_datastore(self.data_store_address)
+        # Static market metadata, read on first use and optionally persisted to disk.
+        self.market_metadata = MarketMetadataCache(
+            self.network_id,
+            self.data_store_address,
+            path=market_metadata_path,
+        )
+
+    # -----------------------------------------------------------
+    # Strategy Contracts
+    # -----------------------------------------------------------
+
+    @property
+    def manager(self):
+        '''
+        Get the GmxFrfStrategyManager contract, bound on first use.
+        '''
+        return self.get_gmxfrf_strategy_manager(self.manager_address)
+
+    @property
+    def gmx_v2_reader(self):
+        '''
+        Get the GmxV2Reader contract, bound on first use.
+        '''
+        return self.get_gmx_v2_reader(self.gmx_v2_reader_address)
+
+    @property
+    def igmx_v2_datastore(self):
+        '''
+        Get the IGmxV2DataStore contract, bound on first use.
+        '''
+        return self.get_igmx_v2_datastore(self.data_store_address)
 
     # -----------------------------------------------------------
     # Strategy Config Querying Functions
@@ -46,7 +76,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return self.manager.functions.liquidationFeePercent(asset).call()
+        return self._call_function(self.manager.functions.liquidationFeePercent(asset))
 
     def get_callback_gas_limit(self):
         '''
@@ -54,7 +84,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return self.manager.functions.getCallbackGasLimit().call()
+        return self._call_function(self.manager.functions.getCallbackGasLimit())
 
     def get_execution_fee_buffer_percent(self):
         '''
@@ -62,7 +92,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return self.manager.functions.getExecutionFeeBufferPercent().call()
+        return self._call_function(self.manager.functions.getExecutionFeeBufferPercent())
 
     def get_liquidation_order_timeout_deadline(self):
         '''
@@ -70,7 +100,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return self.manager.functions.getLiquidationOrderTimeoutDeadline().call()
+        return self._call_function(self.manager.functions.getLiquidationOrderTimeoutDeadline())
 
     def get_profit_withdrawal_buffer_percent(self):
         '''
@@ -78,7 +108,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return self.manager.functions.getProfitWithdrawalBufferPercent().call()
+        return self._call_function(self.manager.functions.getProfitWithdrawalBufferPercent())
 
     def get_referral_code(self):
         '''
@@ -86,7 +116,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: bytes
         '''
-        return self.manager.functions.getReferralCode().call()
+        return self._call_function(self.manager.functions.getReferralCode())
 
     # -----------------------------------------------------------
     # Market Querying Functions
@@ -94,112 +124,65 @@ class GmxFrfReader(ContractHandler):
 
     def get_token_addresses_for_market(self, market):
         '''
-        Get addresses for market.
+        Get addresses for market. Cached after the first read, since they never change.
 
         :param market: required
         :type market: address
 
         :returns: Object
         '''
-        token_addresses = self.gmx_v2_reader.functions.getMarket(
-            self.data_store_address,
-            market
-        ).call()
+        return self.get_market_metadata(market)["token_addresses"]
 
-        return {
-            "market_token": token_addresses[0],
-            "index_token": token_addresses[1],
-            "long_token": token_addresses[2],
-            "short_token": token_addresses[3],
-        }
-
-    def get_market_info(self, market):
+    def get_market_info(self, market, block_identifier='latest'):
         '''
         Get market information.
 
         :param market: required
         :type market: address
 
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
         :returns: Object
         '''
-        market_addresses = self.get_token_addresses_for_market(market)
-        short_prices = self.get_asset_price(market_addresses['short_token'])
-        long_prices = self.get_asset_price(market_addresses['long_token'])
+        return self.get_all_market_infos(
+            [market],
+            block_identifier=block_identifier,
+        )[Web3.toChecksumAddress(market)]
 
-        market_info = self.gmx_v2_reader.functions.getMarketInfo(
-            self.data_store_address,
-            (
-                (long_prices["price"], long_prices["price"]),
-                (long_prices["price"], long_prices["price"]),
-                (short_prices["price"], short_prices["price"]),
-            ),
-            market
-        ).call()
+    def get_all_market_infos(self, markets=None, block_identifier='latest'):
+        '''
+        Get the information of many markets, all available markets by default. Prices
+        of every market token and the market infos are each read in one batched round
+        trip, with market token addresses from the market metadata cache, so the number
+        of requests does not grow with the number of markets.
+
+        :param markets: optional
+        :type markets: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, information per market
+        '''
+        if markets is None:
+            markets = self.get_available_markets()
+        markets = [Web3.toChecksumAddress(market) for market in markets]
+
+        self._warm_uncached_market_metadata(markets)
+
+        asset_prices = self.get_asset_prices(
+            self._get_market_tokens(markets),
+            block_identifier=block_identifier,
+        )
+        results = self.call_many(
+            self._get_market_info_calls(markets, asset_prices),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+
+        return self.parse_results_by_key(markets, results)
 
-        return {
-            "market": {
-                "market_token": market_info[0][0],
-                "index_token": market_info[0][1],
-                "long_token": market_info[0][2],
-                "short_token": market_info[0][3],
-            },
-            "borrowing_factor_per_second_for_longs": market_info[1],
-            "borrowing_factor_per_second_for_shorts": market_info[2],
-            "base_funding": {
-                "funding_fee_amount_per_size": {
-                    "long": {
-                        "long_token": market_info[3][0][0][0],
-                        "short_token": market_info[3][0][0][1],
-                    },
-                    "short": {
-                        "long_token": market_info[3][0][1][0],
-                        "short_token": market_info[3][0][1][1],
-                    },
-                },
-                "claimable_funding_amount_per_size": {
-                    "long": {
-                        "long_token": market_info[3][1][0][0],
-                        "short_token": market_info[3][1][0][1],
-                    },
-                    "short": {
-                        "long_token": market_info[3][1][1][0],
-                        "short_token": market_info[3][1][1][1],
-                    },
-                }
-            },
-            "next_funding": {
-                "longs_pay_shorts": market_info[4][0],
-                "funding_factor_per_second": market_info[4][1],
-                "next_saved_funding_factor_per_second": market_info[4][2],
-                "funding_fee_amount_per_size_delta": {
-                    "long": {
-                        "long_token": market_info[4][3][0][0],
-                        "short_token": market_info[4][3][0][1],
-                    },
-                    "short": {
-                        "long_token": market_info[4][3][1][0],
-                        "short_token": market_info[4][3][1][1],
-                    },
-                },
-                "claimable_funding_amount_per_size_delta": {
-                    "long": {
-                        "long_token": market_info[4][4][0][0],
-                        "short_token": market_info[4][4][0][1],
-                    },
-                    "short": {
-                        "long_token": market_info[4][4][1][0],
-                        "short_token": market_info[4][4][1][1],
-                    },
-                },
-            },
-            "virtual_inventory": {
-                "virtual_pool_amount_for_long_token": market_info[5][0],
-                "virtual_pool_amount_for_short_token": market_info[5][1],
-                "virtual_inventory_for_positions": market_info[5][2],
-            },
-            "is_disabled": market_info[6]
-        }
-    
     def get_market_net_funding_rate(self, market):
         '''
         Get net funding rate for a market.
@@ -208,18 +191,14 @@ class GmxFrfReader(ContractHandler):
         :type market: address
 
         :returns: integer
-        ''' 
+        '''
         market_info = self.get_market_info(market)
-        net_funding = market_info["next_funding"]["funding_factor_per_second"]
-        direction = -1
-        if market_info["next_funding"]["longs_pay_shorts"]:
-            direction = 1
-        
-        net_funding = net_funding * direction
-        net_funding = net_funding - market_info["borrowing_factor_per_second_for_shorts"]
-        net_funding = net_funding * 60 * 60
 
-        return net_funding
+        return self.compute_net_funding_rate(
+            market_info["next_funding"]["funding_factor_per_second"],
+            market_info["next_funding"]["longs_pay_shorts"],
+            market_info["borrowing_factor_per_second_for_shorts"],
+        )
 
     def get_available_markets(self):
         '''
@@ -227,7 +206,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: []address
         '''
-        return self.manager.functions.getAvailableMarkets().call()
+        return self._call_function(self.manager.functions.getAvailableMarkets())
 
     def get_market_configuration(self, market):
         '''
@@ -238,7 +217,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: Object
         '''
-        return self.manager.functions.getMarketConfiguration(market).call()
+        return self._call_function(self.manager.functions.getMarketConfiguration(market))
 
     def get_market_unwind_configuration(self, market):
         '''
@@ -249,7 +228,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: Object
         '''
-        return self.manager.functions.getMarketUnwindConfiguration(market).call()
+        return self._call_function(self.manager.functions.getMarketUnwindConfiguration(market))
 
     def get_is_approved_market(self, market):
         '''
@@ -260,7 +239,72 @@ class GmxFrfReader(ContractHandler):
 
         :returns: boolean
         '''
-        return self.manager.functions.isApprovedMarket(market).call()
+        return self._call_function(self.manager.functions.isApprovedMarket(market))
+
+    # -----------------------------------------------------------
+    # Market Metadata Functions
+    # -----------------------------------------------------------
+
+    def get_market_metadata(self, market, refresh=False):
+        '''
+        Get a market's static metadata: its token addresses, the decimals of its tokens
+        and the strategy's market configuration. Read on first use and cached after;
+        the market configuration is a snapshot, re-read when `refresh` is set.
+
+        :param market: required
+        :type market: address
+
+        :param refresh: optional
+        :type refresh: boolean
+
+        :returns: Object
+        '''
+        market = Web3.toChecksumAddress(market)
+        metadata = None if refresh else self.market_metadata.get(market)
+        if metadata is None:
+            metadata = self.warm_market_metadata([market])[market]
+        return metadata
+
+    def warm_market_metadata(self, markets=None, block_identifier='latest'):
+        '''
+        Read and cache the metadata of `markets`, all available markets by default, in
+        two batched round trips.
+
+        :param markets: optional
+        :type markets: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, metadata per market
+        '''
+        if markets is None:
+            markets = self.get_available_markets()
+        markets = [Web3.toChecksumAddress(market) for market in markets]
+        if not markets:
+            return {}
+
+        market_results = self.call_many(
+            self._get_market_metadata_calls(markets),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+        tokens = self.parse_market_metadata_tokens(market_results)
+
+        # Synthetic index tokens have no contract, so their decimals may be missing.
+        decimals_results = self.call_many(
+            [self.get_erc20(token).functions.decimals() for token in tokens],
+            block_identifier=block_identifier,
+        )
+
+        metadata_by_market = self.parse_market_metadata(
+            markets,
+            market_results,
+            self.parse_results_by_key(tokens, decimals_results),
+        )
+        self.market_metadata.update(metadata_by_market)
+
+        return metadata_by_market
 
     # -----------------------------------------------------------
     # Asset Querying Functions
@@ -275,7 +319,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: address
         '''
-        return self.manager.functions.getAssetOracle(asset).call()
+        return self._call_function(self.manager.functions.getAssetOracle(asset))
 
     def get_asset_oracle_configuration(self,  asset):
         '''
@@ -286,7 +330,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: Object
         '''
-        return self.manager.functions.getAssetOracleConfiguration(asset).call()
+        return self._call_function(self.manager.functions.getAssetOracleConfiguration(asset))
 
     def get_asset_price(self, asset):
         '''
@@ -297,12 +341,30 @@ class GmxFrfReader(ContractHandler):
 
         :returns: object
         '''
-        asset_price = self.manager.functions.getAssetPrice(asset).call()
+        return self._call_function(
+            self.manager.functions.getAssetPrice(asset),
+            self.parse_asset_price,
+        )
 
-        return {
-            "price": asset_price[0],
-            "decimals": asset_price[1],
-        }
+    def get_asset_prices(self, assets, block_identifier='latest'):
+        '''
+        Get the prices of many assets for the strategy, in one batched round trip.
+
+        :param assets: required
+        :type assets: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, price per asset
+        '''
+        results = self.call_many(
+            self._get_asset_price_calls(assets),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+
+        return self.parse_results_by_key(assets, results)
 
     def get_registered_assets(self):
         '''
@@ -310,7 +372,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: []address
         '''
-        return self.manager.functions.getRegisteredAssets().call()
+        return self._call_function(self.manager.functions.getRegisteredAssets())
 
     # -----------------------------------------------------------
     # GMX Contract Querying Functions
@@ -322,7 +384,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: address
         '''
-        return self.manager.functions.gmxV2ExchangeRouter().call()
+        return self._call_function(self.manager.functions.gmxV2ExchangeRouter())
 
     def get_gmx_v2_order_vault(self):
         '''
@@ -330,7 +392,7 @@ class GmxFrfReader(ContractHandler):
 
         :returns: address
         '''
-        return self.manager.functions.gmxV2OrderVault().call()
+        return self._call_function(self.manager.functions.gmxV2OrderVault())
 
     def get_referral_storage(self):
         '''
@@ -338,7 +400,7 @@ class GmxFrfReader(ContractHandler):
 
         :return: address
         '''
-        return self.manager.functions.gmxV2ReferralStorage().call()
+        return self._call_function(self.manager.functions.gmxV2ReferralStorage())
 
     def get_ui_fee_receiver(self):
         '''
@@ -346,7 +408,7 @@ class GmxFrfReader(ContractHandler):
 
         :return: address
         '''
-        return self.manager.functions.getUiFeeReceiver().call()
+        return self._call_function(self.manager.functions.getUiFeeReceiver())
 
     # -----------------------------------------------------------
     # Account Querying Functions
@@ -361,13 +423,12 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return send_raw_query(
-            self.web3.provider.endpoint_uri,
+        return self._call_function(self.get_gmxfrf_account_getters_function(
             self.account_getters_address,
-            "getAccountOrdersValueUSD(IGmxFrfStrategyManager,address)",
+            "getAccountOrdersValueUSD",
             self.manager_address,
             strategy_account,
-        )
+        ))
 
     def get_account_positions_value_usd(self, strategy_account):
         '''
@@ -378,13 +439,12 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return send_raw_query(
-            self.web3.provider.endpoint_uri,
+        return self._call_function(self.get_gmxfrf_account_getters_function(
             self.account_getters_address,
-            "getAccountPositionsValueUSD(IGmxFrfStrategyManager,address)",
+            "getAccountPositionsValueUSD",
             self.manager_address,
             strategy_account
-        )
+        ))
 
     def get_account_value_usdc(self, strategy_account):
         '''
@@ -395,17 +455,18 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return send_raw_query(
-            self.web3.provider.endpoint_uri,
+        return self._call_function(self.get_gmxfrf_account_getters_function(
             self.account_getters_address,
-            "getAccountValueUsdc(IGmxFrfStrategyManager,address)",
+            "getAccountValueUsdc",
             self.manager_address,
             strategy_account
-        )
+        ))
 
     def get_settled_funding_fees(self, strategy_account, market, short_token, long_token):
         '''
-        Get an account's settled funding fees for a market.
+        Get an account's settled funding fees for a market, per token. Up to 0.0.9 this
+        returned one integer packing both amounts, the short token amount in the high
+        256 bits and the long token amount in the low 256 bits.
 
         :param strategy_account: required
         :type strategy_account: address
@@ -419,17 +480,19 @@ class GmxFrfReader(ContractHandler):
         :param long_token: required
         :type long_token: address
 
-        :returns: integer
-        '''
-        return send_raw_query(
-            self.web3.provider.endpoint_uri,
-            self.account_getters_address,
-            "getSettledFundingFees(IGmxV2DataStore,address,address,address,address)",
-            self.data_store_address,
-            strategy_account,
-            market,
-            short_token,
-            long_token
+        :returns: Object, with short_token_amount_settled and long_token_amount_settled
+        '''
+        return self._call_function(
+            self.get_gmxfrf_account_getters_function(
+                self.account_getters_address,
+                "getSettledFundingFees",
+                self.data_store_address,
+                strategy_account,
+                market,
+                short_token,
+                long_token
+            ),
+            self.parse_settled_funding_fees,
         )
 
     def get_settled_funding_fees_for_token(self, strategy_account, market, token):
@@ -448,7 +511,7 @@ class GmxFrfReader(ContractHandler):
         :returns: integer
         '''
         key = self.get_claimable_funding_key(market, token, strategy_account)
-        return self.igmx_v2_datastore.functions.getUint(key).call()
+        return self._call_function(self.igmx_v2_datastore.functions.getUint(key))
 
     def get_settled_funding_fees_value_usd(self, strategy_account):
         '''
@@ -459,13 +522,12 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return send_raw_query(
-            self.web3.provider.endpoint_uri,
+        return self._call_function(self.get_gmxfrf_account_getters_function(
             self.account_getters_address,
-            "getSettledFundingFeesValueUSD(IGmxFrfStrategyManager,address)",
+            "getSettledFundingFeesValueUSD",
             self.manager_address,
             strategy_account
-        )
+        ))
 
     def get_is_liquidation_finished(self, strategy_account):
         '''
@@ -476,15 +538,12 @@ class GmxFrfReader(ContractHandler):
 
         :returns: boolean
         '''
-        is_finished = send_raw_query(
-            self.web3.provider.endpoint_uri,
+        return self._call_function(self.get_gmxfrf_account_getters_function(
             self.account_getters_address,
-            "isLiquidationFinished(IGmxFrfStrategyManager,address)",
+            "isLiquidationFinished",
             self.manager_address,
             strategy_account
-        )
-
-        return is_finished == 0
+        ))
 
     # -----------------------------------------------------------
     # Individual Order/Position Querying Functions
@@ -499,13 +558,12 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return send_raw_query(
-            self.web3.provider.endpoint_uri,
+        return self._call_function(self.get_gmxfrf_account_getters_function(
             self.account_getters_address,
-            "getOrderValueUSD(IGmxFrfStrategyManager,bytes32)",
+            "getOrderValueUSD",
             self.manager_address,
             order_id
-        )
+        ))
 
     def get_position_value_usd(self, strategy_account, market):
         '''
@@ -519,14 +577,13 @@ class GmxFrfReader(ContractHandler):
 
         :returns: integer
         '''
-        return send_raw_query(
-            self.web3.provider.endpoint_uri,
+        return self._call_function(self.get_gmxfrf_account_getters_function(
             self.account_getters_address,
-            "getPositionValue(IGmxFrfStrategyManager,address,address)",
+            "getPositionValue",
             self.manager_address,
             strategy_account,
             market
-        )
+        ))
 
     def get_position(self, market, strategy_account):
         '''
@@ -543,76 +600,791 @@ class GmxFrfReader(ContractHandler):
 
         :returns: Object
         '''
+        return self._call_function(
+            self.gmx_v2_reader.functions.getPosition(
+                self.data_store_address,
+                self.get_position_key(market, strategy_account),
+            ),
+            self.parse_position,
+        )
+
+    def get_position_info(self, market, strategy_account, block_identifier='latest'):
+        '''
+        Get a position's info. Market token addresses come from the market metadata
+        cache, and the prices and GMX addresses the query depends on are read in one
+        batched round trip before the position info itself.
+
+        :param market: required
+        :type market: address
+
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object
+        '''
+        market = Web3.toChecksumAddress(market)
         position_key = self.get_position_key(market, strategy_account)
 
-        position = self.gmx_v2_reader.functions.getPosition(
-            self.data_store_address,
-            position_key,
-        ).call()
+        tokens = self._get_market_tokens([market])
+        position_info_context = self.parse_position_info_context(tokens, self.call_many(
+            self._get_position_info_context_calls(tokens),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        ))
+
+        return self._call_function(
+            self._get_position_info_call(market, position_key, *position_info_context),
+            self.parse_position_info,
+            block_identifier=block_identifier,
+        )
 
-        return {
-            "addresses": {
-                "account": position[0][0],
-                "market": position[0][1],
-                "collateral_token": position[0][2],
-            },
-            "numbers": {
-                "size_in_usd": position[1][0],
-                "size_in_tokens": position[1][1],
-                "collateral_amount": position[1][2],
-                "borrowing_factor": position[1][3],
-                "funding_fee_amount_per_size": position[1][4],
-                "long_token_claimable_funding_amount_per_size": position[1][5],
-                "short_token_claimable_funding_amount_per_size": position[1][6],
-                "increased_at_block": position[1][7],
-                "decreased_at_block": position[1][8],
-            },
-            "flags": {
-                "isLong": position[2][0],
-            }
-        }
+    # -----------------------------------------------------------
+    # Account-wide Position Querying Functions
+    # -----------------------------------------------------------
 
-    def get_position_info(self, market, strategy_account):
+    def get_all_positions(self, strategy_account, block_identifier='latest'):
         '''
-        Get a position's info.
+        Get every position of an account.
 
-        :param market: required
-        :type market: address
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: []Object
+        '''
+        return self.get_all_positions_for_accounts(
+            [strategy_account],
+            block_identifier=block_identifier,
+        )[strategy_account]
+
+    def get_all_positions_for_accounts(self, strategy_accounts, block_identifier='latest'):
+        '''
+        Get every position of many accounts, in batched round trips.
+
+        :param strategy_accounts: required
+        :type strategy_accounts: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, positions per account
+        '''
+        results = self.call_many(
+            self._get_account_positions_calls(strategy_accounts),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+
+        return self.parse_results_by_key(strategy_accounts, results)
+
+    def get_all_position_infos(self, strategy_account, block_identifier='latest'):
+        '''
+        Get the info of every position of an account.
 
         :param strategy_account: required
         :type strategy_account: address
 
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: []Object
+        '''
+        return self.get_all_position_infos_for_accounts(
+            [strategy_account],
+            block_identifier=block_identifier,
+        )[strategy_account]
+
+    def get_all_position_infos_for_accounts(self, strategy_accounts, block_identifier='latest'):
+        '''
+        Get the info of every position of many accounts. Positions, prices and the
+        infos are each read in one batched round trip, with market token addresses
+        from the market metadata cache.
+
+        :param strategy_accounts: required
+        :type strategy_accounts: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: Object, position infos per account
+        '''
+        positions_by_account = self.get_all_positions_for_accounts(
+            strategy_accounts,
+            block_identifier=block_identifier,
+        )
+
+        markets = self.get_position_markets(positions_by_account)
+        self._warm_uncached_market_metadata(markets)
+
+        tokens = self._get_market_tokens(markets)
+        position_info_context = self.parse_position_info_context(tokens, self.call_many(
+            self._get_position_info_context_calls(tokens),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        ))
+
+        accounts_with_positions = [
+            strategy_account for strategy_account in strategy_accounts
+            if positions_by_account[strategy_account]
+        ]
+        results = self.call_many(
+            self._get_account_position_info_list_calls(
+                accounts_with_positions,
+                positions_by_account,
+                *position_info_context,
+            ),
+            allow_failure=False,
+            block_identifier=block_identifier,
+        )
+
+        return self.parse_position_infos_by_account(
+            strategy_accounts,
+            accounts_with_positions,
+            results,
+        )
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    def get_position_key(self, market, strategy_account):
+        '''
+        Get a position's key.
+
         :param market: required
         :type market: address
 
-        :returns: Object
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :returns: str
         '''
         market_addresses = self.get_token_addresses_for_market(market)
-        short_prices = self.get_asset_price(market_addresses['short_token'])
-        long_prices = self.get_asset_price(market_addresses['long_token'])
+        return self.compute_position_key(
+            strategy_account,
+            market,
+            market_addresses['long_token'],
+            False,
+        )
 
-        position = self.get_position(market, strategy_account)
+    @staticmethod
+    def compute_net_funding_rate(
+        funding_factor_per_second,
+        longs_pay_shorts,
+        borrowing_factor_per_second_for_shorts,
+    ):
+        '''
+        Compute the hourly net funding rate earned by the strategy's short position: the
+        funding factor, signed by which side pays, less the short borrowing factor.
+        Works on integers and on NumPy arrays alike.
 
-        position_info = self.gmx_v2_reader.functions.getPositionInfo(
-            self.data_store_address,
-            self.get_referral_storage(),
-            self.get_position_key(market, strategy_account),
-            (
-                (long_prices["price"], long_prices["price"]),
-                (long_prices["price"], long_prices["price"]),
-                (short_prices["price"], short_prices["price"]),
-            ),
-            position["numbers"]["size_in_usd"],
-            self.get_ui_fee_receiver(),
-            True,
-        ).call()
+        :param funding_factor_per_second: required
+        :type funding_factor_per_second: integer
 
-        return {
-            "position": {
-                "addresses": {
-                    "account": position_info[0][0][0],
-                    "market": position_info[0][0][1],
-                    "collateral_token": position_info[0][0][2],
+        :param longs_pay_shorts: required
+        :type longs_pay_shorts: boolean
+
+        :param borrowing_factor_per_second_for_shorts: required
+        :type borrowing_factor_per_second_for_shorts: integer
+
+        :returns: integer
+        '''
+        direction = longs_pay_shorts * 2 - 1
+        net_funding = funding_factor_per_second * direction
+        net_funding = net_funding - borrowing_factor_per_second_for_shorts
+        return net_funding * 60 * 60
+
+    @staticmethod
+    def compute_position_key(account, market, collateral_token, is_long):
+        '''
+        Compute the key of a position from its addresses and direction.
+
+        :param account: required
+        :type account: address
+
+        :param market: required
+        :type market: address
+
+        :param collateral_token: required
+        :type collateral_token: address
+
+        :param is_long: required
+        :type is_long: boolean
+
+        :returns: str
+        '''
+        return Web3.solidityKeccak(
+            ['bytes'],
+            [encode_abi(
+                ['address', 'address', 'address', 'bool'],
+                [account, market, collateral_token, is_long],
+            )],
+        ).hex()
+
+    def _get_market_prices(self, market, price_by_token):
+        '''
+        Get the index, long and short token prices of a market, as GMX V2 Reader takes
+        them, from prices by token. The index token is priced as the long token. The
+        market's metadata must be cached.
+
+        :returns: tuple
+        '''
+        market_addresses = self.market_metadata.get(market)["token_addresses"]
+        long_price = price_by_token[market_addresses['long_token']]
+        short_price = price_by_token[market_addresses['short_token']]
+        return (
+            (long_price, long_price),
+            (long_price, long_price),
+            (short_price, short_price),
+        )
+
+    @staticmethod
+    def get_position_markets(positions_by_account):
+        '''
+        Get the markets of positions of accounts.
+
+        :param positions_by_account: required
+        :type positions_by_account: Object
+
+        :returns: set
+        '''
+        return {
+            position["addresses"]["market"]
+            for positions in positions_by_account.values()
+            for position in positions
+        }
+
+    def _warm_uncached_market_metadata(self, markets):
+        '''
+        Read the metadata of the markets missing from the cache.
+        '''
+        uncached_markets = [market for market in markets if not self.market_metadata.get(market)]
+        if uncached_markets:
+            self.warm_market_metadata(uncached_markets)
+
+    def _get_market_tokens(self, markets):
+        '''
+        Get the long and short tokens of markets, without duplicates. The markets'
+        metadata must be cached.
+
+        :returns: []address
+        '''
+        return list({
+            self.market_metadata.get(market)["token_addresses"][token]: None
+            for market in markets
+            for token in ("long_token", "short_token")
+        })
+
+    def get_claimable_funding_key(self, market, token, strategy_account):
+        '''
+        Get a position's claimable funding key.
+
+        :param market: required
+        :type market: address
+
+        :param token: required
+        :type token: address
+
+        :param strategy_account: required
+        :type strategy_account: address
+
+        :returns: str
+        '''
+        encoded_key = Web3.solidityKeccak(
+            ['bytes'],
+            [encode_abi(
+                ['string'],
+                ['CLAIMABLE_FUNDING_AMOUNT'],
+            )]
+        )
+
+        return Web3.solidityKeccak(
+            ['bytes'],
+            [encode_abi(
+                ['bytes32', 'address', 'address', 'address'],
+                [encoded_key, market, token, strategy_account],
+            )],
+        ).hex()
+
+    # -----------------------------------------------------------
+    # Call Building Functions
+    # -----------------------------------------------------------
+
+    def _get_market_info_calls(self, markets, asset_prices):
+        '''
+        Get the calls reading the information of markets, priced with `asset_prices`.
+        The markets' metadata must be cached.
+
+        :returns: []function
+        '''
+        price_by_token = {token: price["price"] for token, price in asset_prices.items()}
+        return [
+            (
+                self.gmx_v2_reader.functions.getMarketInfo(
+                    self.data_store_address,
+                    self._get_market_prices(market, price_by_token),
+                    market,
+                ),
+                self.parse_market_info,
+            )
+            for market in markets
+        ]
+
+    def _get_market_metadata_calls(self, markets):
+        '''
+        Get the calls reading the token addresses and configuration of markets, two per
+        market.
+
+        :returns: []function
+        '''
+        return [
+            call
+            for market in markets
+            for call in (
+                (
+                    self.gmx_v2_reader.functions.getMarket(self.data_store_address, market),
+                    self.parse_token_addresses_for_market,
+                ),
+                (
+                    self.manager.functions.getMarketConfiguration(market),
+                    self.parse_market_configuration,
+                ),
+            )
+        ]
+
+    def _get_asset_price_calls(self, assets):
+        '''
+        Get the calls reading the prices of assets.
+
+        :returns: []function
+        '''
+        return [
+            (self.manager.functions.getAssetPrice(asset), self.parse_asset_price)
+            for asset in assets
+        ]
+
+    def _get_account_positions_calls(self, strategy_accounts):
+        '''
+        Get the calls reading every position of accounts.
+
+        :returns: []function
+        '''
+        return [
+            (
+                self.gmx_v2_reader.functions.getAccountPositions(
+                    self.data_store_address,
+                    strategy_account,
+                    0,
+                    MAX_LIST_END,
+                ),
+                lambda positions: [self.parse_position(position) for position in positions],
+            )
+            for strategy_account in strategy_accounts
+        ]
+
+    def _get_position_info_context_calls(self, tokens):
+        '''
+        Get the calls reading what position info queries depend on: the GMX referral
+        storage, the UI fee receiver and the prices of `tokens`.
+
+        :returns: []function
+        '''
+        return [
+            self.manager.functions.gmxV2ReferralStorage(),
+            self.manager.functions.getUiFeeReceiver(),
+        ] + self._get_asset_price_calls(tokens)
+
+    def _get_position_info_call(
+        self,
+        market,
+        position_key,
+        referral_storage,
+        ui_fee_receiver,
+        price_by_token,
+    ):
+        '''
+        Get the call reading a position's info. The market's metadata must be cached.
+
+        :returns: function
+        '''
+        # The size delta is ignored when the position's own size is used.
+        return self.gmx_v2_reader.functions.getPositionInfo(
+            self.data_store_address,
+            referral_storage,
+            position_key,
+            self._get_market_prices(market, price_by_token),
+            0,
+            ui_fee_receiver,
+            True,
+        )
+
+    def _get_account_position_info_list_calls(
+        self,
+        strategy_accounts,
+        positions_by_account,
+        referral_storage,
+        ui_fee_receiver,
+        price_by_token,
+    ):
+        '''
+        Get the calls reading the info of every position of accounts, one per account.
+        The metadata of the positions' markets must be cached.
+
+        :returns: []function
+        '''
+        return [
+            (
+                self.gmx_v2_reader.functions.getAccountPositionInfoList(
+                    self.data_store_address,
+                    referral_storage,
+                    [
+                        self.compute_position_key(
+                            position["addresses"]["account"],
+                            position["addresses"]["market"],
+                            position["addresses"]["collateral_token"],
+                            position["flags"]["isLong"],
+                        )
+                        for position in positions_by_account[strategy_account]
+                    ],
+                    [
+                        self._get_market_prices(
+                            position["addresses"]["market"],
+                            price_by_token,
+                        )
+                        for position in positions_by_account[strategy_account]
+                    ],
+                    ui_fee_receiver,
+                ),
+                lambda position_infos: [
+                    self.parse_position_info(position_info) for position_info in position_infos
+                ],
+            )
+            for strategy_account in strategy_accounts
+        ]
+
+    # -----------------------------------------------------------
+    # Parsing Functions
+    # -----------------------------------------------------------
+
+    @staticmethod
+    def parse_results_by_key(keys, results):
+        '''
+        Parse multicall results into their results by key, in order.
+
+        :param keys: required
+        :type keys: []any
+
+        :param results: required
+        :type results: []Object, multicall results
+
+        :returns: Object
+        '''
+        return {key: result["result"] for key, result in zip(keys, results)}
+
+    @staticmethod
+    def parse_market_metadata_tokens(market_results):
+        '''
+        Parse the index, long and short tokens of markets, without duplicates, from
+        their metadata reads.
+
+        :param market_results: required
+        :type market_results: []Object, multicall results of the market metadata calls
+
+        :returns: []address
+        '''
+        return list({
+            result["result"][token]: None
+            for result in market_results[0::2]
+            for token in ("index_token", "long_token", "short_token")
+        })
+
+    @staticmethod
+    def parse_market_metadata(markets, market_results, decimals_by_token):
+        '''
+        Parse the metadata of markets from their metadata reads and token decimals.
+
+        :param markets: required
+        :type markets: []address
+
+        :param market_results: required
+        :type market_results: []Object, multicall results of the market metadata calls
+
+        :param decimals_by_token: required
+        :type decimals_by_token: Object
+
+        :returns: Object, metadata per market
+        '''
+        return {
+            market: {
+                "token_addresses": token_addresses["result"],
+                "decimals": {
+                    token: decimals_by_token[token_addresses["result"][token]]
+                    for token in ("index_token", "long_token", "short_token")
+                },
+                "market_configuration": configuration["result"],
+            }
+            for market, token_addresses, configuration in zip(
+                markets,
+                market_results[0::2],
+                market_results[1::2],
+            )
+        }
+
+    @staticmethod
+    def parse_position_info_context(tokens, results):
+        '''
+        Parse the reads position info queries depend on.
+
+        :param tokens: required
+        :type tokens: []address
+
+        :param results: required
+        :type results: []Object, multicall results of the position info context calls
+
+        :returns: tuple, referral storage, UI fee receiver and price per token
+        '''
+        return (
+            results[0]["result"],
+            results[1]["result"],
+            {token: result["result"]["price"] for token, result in zip(tokens, results[2:])},
+        )
+
+    @staticmethod
+    def parse_position_infos_by_account(strategy_accounts, accounts_with_positions, results):
+        '''
+        Parse the position info reads of accounts, with no infos for accounts without
+        positions.
+
+        :param strategy_accounts: required
+        :type strategy_accounts: []address
+
+        :param accounts_with_positions: required
+        :type accounts_with_positions: []address
+
+        :param results: required
+        :type results: []Object, multicall results
+
+        :returns: Object, position infos per account
+        '''
+        position_infos_by_account = {strategy_account: [] for strategy_account in strategy_accounts}
+        for strategy_account, result in zip(accounts_with_positions, results):
+            position_infos_by_account[strategy_account] = result["result"]
+
+        return position_infos_by_account
+
+    @staticmethod
+    def parse_token_addresses_for_market(token_addresses):
+        '''
+        Parse raw market token addresses.
+
+        :param token_addresses: required
+        :type token_addresses: tuple
+
+        :returns: Object
+        '''
+        return {
+            "market_token": token_addresses[0],
+            "index_token": token_addresses[1],
+            "long_token": token_addresses[2],
+            "short_token": token_addresses[3],
+        }
+
+    @staticmethod
+    def parse_market_configuration(market_configuration):
+        '''
+        Parse a raw market configuration.
+
+        :param market_configuration: required
+        :type market_configuration: tuple
+
+        :returns: Object
+        '''
+        return {
+            "order_pricing_parameters": {
+                "max_swap_slippage_percent": market_configuration[0][0],
+                "max_position_slippage_percent": market_configuration[0][1],
+                "min_order_size_usd": market_configuration[0][2],
+                "max_order_size_usd": market_configuration[0][3],
+                "increase_enabled": market_configuration[0][4],
+            },
+            "shared_order_parameters": {
+                "callback_gas_limit": market_configuration[1][0],
+                "execution_fee_buffer_percent": market_configuration[1][1],
+                "referral_code": Web3.toHex(market_configuration[1][2]),
+                "ui_fee_receiver": market_configuration[1][3],
+                "withdrawal_buffer_percentage": market_configuration[1][4],
+            },
+            "position_parameters": {
+                "min_position_size_usd": market_configuration[2][0],
+                "max_position_size_usd": market_configuration[2][1],
+            },
+            "unwind_parameters": {
+                "max_delta_proportion": market_configuration[3][0],
+                "min_swap_rebalance_size": market_configuration[3][1],
+                "max_position_leverage": market_configuration[3][2],
+                "unwind_fee": market_configuration[3][3],
+            },
+        }
+
+    @staticmethod
+    def parse_market_info(market_info):
+        '''
+        Parse raw market information.
+
+        :param market_info: required
+        :type market_info: tuple
+
+        :returns: Object
+        '''
+        return {
+            "market": {
+                "market_token": market_info[0][0],
+                "index_token": market_info[0][1],
+                "long_token": market_info[0][2],
+                "short_token": market_info[0][3],
+            },
+            "borrowing_factor_per_second_for_longs": market_info[1],
+            "borrowing_factor_per_second_for_shorts": market_info[2],
+            "base_funding": {
+                "funding_fee_amount_per_size": {
+                    "long": {
+                        "long_token": market_info[3][0][0][0],
+                        "short_token": market_info[3][0][0][1],
+                    },
+                    "short": {
+                        "long_token": market_info[3][0][1][0],
+                        "short_token": market_info[3][0][1][1],
+                    },
+                },
+                "claimable_funding_amount_per_size": {
+                    "long": {
+                        "long_token": market_info[3][1][0][0],
+                        "short_token": market_info[3][1][0][1],
+                    },
+                    "short": {
+                        "long_token": market_info[3][1][1][0],
+                        "short_token": market_info[3][1][1][1],
+                    },
+                }
+            },
+            "next_funding": {
+                "longs_pay_shorts": market_info[4][0],
+                "funding_factor_per_second": market_info[4][1],
+                "next_saved_funding_factor_per_second": market_info[4][2],
+                "funding_fee_amount_per_size_delta": {
+                    "long": {
+                        "long_token": market_info[4][3][0][0],
+                        "short_token": market_info[4][3][0][1],
+                    },
+                    "short": {
+                        "long_token": market_info[4][3][1][0],
+                        "short_token": market_info[4][3][1][1],
+                    },
+                },
+                "claimable_funding_amount_per_size_delta": {
+                    "long": {
+                        "long_token": market_info[4][4][0][0],
+                        "short_token": market_info[4][4][0][1],
+                    },
+                    "short": {
+                        "long_token": market_info[4][4][1][0],
+                        "short_token": market_info[4][4][1][1],
+                    },
+                },
+            },
+            "virtual_inventory": {
+                "virtual_pool_amount_for_long_token": market_info[5][0],
+                "virtual_pool_amount_for_short_token": market_info[5][1],
+                "virtual_inventory_for_positions": market_info[5][2],
+            },
+            "is_disabled": market_info[6]
+        }
+
+    @staticmethod
+    def parse_asset_price(asset_price):
+        '''
+        Parse a raw asset price.
+
+        :param asset_price: required
+        :type asset_price: tuple
+
+        :returns: Object
+        '''
+        return {
+            "price": asset_price[0],
+            "decimals": asset_price[1],
+        }
+
+    @staticmethod
+    def parse_settled_funding_fees(settled_funding_fees):
+        '''
+        Parse raw settled funding fees.
+
+        :param settled_funding_fees: required
+        :type settled_funding_fees: tuple
+
+        :returns: Object
+        '''
+        return {
+            "short_token_amount_settled": settled_funding_fees[0],
+            "long_token_amount_settled": settled_funding_fees[1],
+        }
+
+    @staticmethod
+    def parse_position(position):
+        '''
+        Parse a raw position.
+
+        :param position: required
+        :type position: tuple
+
+        :returns: Object
+        '''
+        return {
+            "addresses": {
+                "account": position[0][0],
+                "market": position[0][1],
+                "collateral_token": position[0][2],
+            },
+            "numbers": {
+                "size_in_usd": position[1][0],
+                "size_in_tokens": position[1][1],
+                "collateral_amount": position[1][2],
+                "borrowing_factor": position[1][3],
+                "funding_fee_amount_per_size": position[1][4],
+                "long_token_claimable_funding_amount_per_size": position[1][5],
+                "short_token_claimable_funding_amount_per_size": position[1][6],
+                "increased_at_block": position[1][7],
+                "decreased_at_block": position[1][8],
+                "increased_at_time": position[1][9],
+                "decreased_at_time": position[1][10],
+            },
+            "flags": {
+                "isLong": position[2][0],
+            }
+        }
+
+    @staticmethod
+    def parse_position_info(position_info):
+        '''
+        Parse a raw position's info.
+
+        :param position_info: required
+        :type position_info: tuple
+
+        :returns: Object
+        '''
+        return {
+            "position": {
+                "addresses": {
+                    "account": position_info[0][0][0],
+                    "market": position_info[0][0][1],
+                    "collateral_token": position_info[0][0][2],
                 },
                 "numbers": {
                     "size_in_usd": position_info[0][1][0],
@@ -624,6 +1396,8 @@ class GmxFrfReader(ContractHandler):
                     "short_token_claimable_funding_amount_per_size": position_info[0][1][6],
                     "increased_at_block": position_info[0][1][7],
                     "decreased_at_block": position_info[0][1][8],
+                    "increased_at_time": position_info[0][1][9],
+                    "decreased_at_time": position_info[0][1][10],
                 },
                 "flags": {
                     "isLong": position_info[0][2][0],
@@ -682,60 +1456,3 @@ class GmxFrfReader(ContractHandler):
             "uncapped_base_pnl_usd": position_info[4],
             "pnl_after_price_impact_usd": position_info[5],
         }
-
-    # -----------------------------------------------------------
-    # Utility Functions
-    # -----------------------------------------------------------
-
-    def get_position_key(self, market, strategy_account):
-        '''
-        Get a position's key.
-
-        :param market: required
-        :type market: address
-
-        :param strategy_account: required
-        :type strategy_account: address
-
-        :returns: str
-        '''
-        market_addresses = self.get_token_addresses_for_market(market)
-        return Web3.solidityKeccak(
-            ['bytes'],
-            [encode_abi(
-                ['address', 'address', 'address', 'bool'],
-                [strategy_account, market, market_addresses['long_token'], False],
-            )],
-        ).hex()
-
-    def get_claimable_funding_key(self, market, token, strategy_account):
-        '''
-        Get a position's claimable funding key.
-
-        :param market: required
-        :type market: address
-
-        :param token: required
-        :type token: address
-
-        :param strategy_account: required
-        :type strategy_account: address
-
-        :returns: str
-        '''
-        encoded_key = Web3.solidityKeccak(
-            ['bytes'],
-            [encode_abi(
-                ['string'],
-                ['CLAIMABLE_FUNDING_AMOUNT'],
-            )]
-        )
-
-        return Web3.solidityKeccak(
-            ['bytes'],
-            [encode_abi(
-                ['bytes32', 'address', 'address', 'address'],
-                [encoded_key, market, token, strategy_account],
-            )],
-        ).hex()
-        
\ No newline at end of file
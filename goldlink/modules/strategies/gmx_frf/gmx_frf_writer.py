@@ -2,6 +2,7 @@
 
 from goldlink.modules.contract_handler import ContractHandler
 from goldlink.modules.transaction_handler import TransactionHandler
+from goldlink.modules.strategies.gmx_frf.multi_call_builder import GmxFrfMultiCallBuilder
 
 
 class GmxFrfWriter(ContractHandler, TransactionHandler):
@@ -484,6 +485,19 @@ class GmxFrfWriter(ContractHandler, TransactionHandler):
             options=send_options,
         )
 
+    def build_multi_call(self):
+        '''
+        Build a multi-call for the strategy account, batching calls to the methods of
+        this writer into one transaction, e.g.
+        `writer.build_multi_call().claim_funding_fees(markets, assets).claim_collateral(
+        market, asset, time_key).send()`.
+
+        :returns: GmxFrfMultiCallBuilder
+
+        :raises: ValueError
+        '''
+        return GmxFrfMultiCallBuilder(self)
+
     # -----------------------------------------------------------
     # Utilities
     # -----------------------------------------------------------
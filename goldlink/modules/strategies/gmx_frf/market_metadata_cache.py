@@ -0,0 +1,106 @@
+"""Module providing a cache of static GMX market metadata for the GMX Funding-rate Farming strategy."""
+
+import json
+import os
+import threading
+
+
+class MarketMetadataCache(object):
+    '''
+    Thread-safe cache of per-market metadata: market token addresses, token decimals and
+    the strategy's market configuration. Entries are never modified once added and may
+    be shared between threads; they are only replaced on refresh. The cache can be
+    persisted to disk between runs.
+    '''
+
+    def __init__(
+        self,
+        network_id,
+        data_store_address,
+        path=None,
+    ):
+        self.network_id = network_id
+        self.data_store_address = data_store_address
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._metadata_by_market = {}
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def get(self, market):
+        '''
+        Get the cached metadata of a market. The returned metadata is shared and must
+        not be modified.
+
+        :param market: required
+        :type market: address
+
+        :returns: Object | None
+        '''
+        return self._metadata_by_market.get(market)
+
+    def update(self, metadata_by_market):
+        '''
+        Add or replace the metadata of markets, saving the cache if a path is set.
+
+        :param metadata_by_market: required
+        :type metadata_by_market: Object
+        '''
+        with self._lock:
+            self._metadata_by_market = {**self._metadata_by_market, **metadata_by_market}
+
+            if self.path:
+                self.save()
+
+    def clear(self):
+        '''
+        Remove every market from the cache.
+        '''
+        with self._lock:
+            self._metadata_by_market = {}
+
+    def get_markets(self):
+        '''
+        Get the markets in the cache.
+
+        :returns: []address
+        '''
+        return list(self._metadata_by_market)
+
+    # -----------------------------------------------------------
+    # Persistence Functions
+    # -----------------------------------------------------------
+
+    def save(self):
+        '''
+        Write the cache to `path`, replacing the file atomically.
+        '''
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w') as cache_file:
+            json.dump({
+                'network_id': self.network_id,
+                'data_store': self.data_store_address,
+                'markets': self._metadata_by_market,
+            }, cache_file)
+        os.replace(temporary_path, self.path)
+
+    def load(self):
+        '''
+        Read the cache from `path`.
+
+        :raises: ValueError
+        '''
+        with open(self.path, 'r') as cache_file:
+            cache = json.load(cache_file)
+
+        if (
+            cache['network_id'] != self.network_id or
+            cache['data_store'] != self.data_store_address
+        ):
+            raise ValueError(
+                f'Market metadata at {self.path} belongs to network {cache["network_id"]}',
+            )
+
+        self._metadata_by_market = cache['markets']
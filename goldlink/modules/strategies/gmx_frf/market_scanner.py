@@ -0,0 +1,159 @@
+"""Module providing a columnar funding-rate scanner over the GMX Funding-rate Farming strategy markets."""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from goldlink.modules.strategies.gmx_frf.gmx_frf_reader import GmxFrfReader
+
+# Columns of a market table. Factors are GMX fixed point values as floats, precise
+# enough for ranking.
+MARKET_TABLE_DTYPE = [
+    ('market', 'U42'),
+    ('funding_factor_per_second', 'f8'),
+    ('borrowing_factor_per_second_for_longs', 'f8'),
+    ('borrowing_factor_per_second_for_shorts', 'f8'),
+    ('longs_pay_shorts', '?'),
+    ('is_disabled', '?'),
+    ('net_funding_rate', 'f8'),
+]
+
+
+class MarketScanner(object):
+    '''
+    Module for ranking the strategy markets by funding rate. A scan reads every market
+    in one bulk snapshot into a NumPy structured array, one row per market, which can
+    then be sorted and filtered without further requests. Requires NumPy.
+    '''
+
+    def __init__(
+        self,
+        gmx_frf_reader,
+    ):
+        if np is None:
+            raise ImportError(
+                'NumPy is required for the market scanner, install ' +
+                'goldlink-client-python[scanner]',
+            )
+
+        self.gmx_frf_reader = gmx_frf_reader
+
+    def scan(self, markets=None, block_identifier='latest'):
+        '''
+        Read the funding of many markets, all available markets by default.
+
+        :param markets: optional
+        :type markets: []address
+
+        :param block_identifier: optional
+        :type block_identifier: integer | string
+
+        :returns: ndarray, with MARKET_TABLE_DTYPE
+        '''
+        return self.build_market_table(
+            self.gmx_frf_reader.get_all_market_infos(
+                markets,
+                block_identifier=block_identifier,
+            ),
+        )
+
+    # -----------------------------------------------------------
+    # Table Functions
+    # -----------------------------------------------------------
+
+    @staticmethod
+    def build_market_table(market_infos):
+        '''
+        Build a market table from parsed market infos.
+
+        :param market_infos: required
+        :type market_infos: Object, information per market
+
+        :returns: ndarray, with MARKET_TABLE_DTYPE
+        '''
+        table = np.empty(len(market_infos), dtype=MARKET_TABLE_DTYPE)
+        table['market'] = list(market_infos)
+        table['funding_factor_per_second'] = [
+            market_info["next_funding"]["funding_factor_per_second"]
+            for market_info in market_infos.values()
+        ]
+        table['borrowing_factor_per_second_for_longs'] = [
+            market_info["borrowing_factor_per_second_for_longs"]
+            for market_info in market_infos.values()
+        ]
+        table['borrowing_factor_per_second_for_shorts'] = [
+            market_info["borrowing_factor_per_second_for_shorts"]
+            for market_info in market_infos.values()
+        ]
+        table['longs_pay_shorts'] = [
+            market_info["next_funding"]["longs_pay_shorts"]
+            for market_info in market_infos.values()
+        ]
+        table['is_disabled'] = [
+            market_info["is_disabled"] for market_info in market_infos.values()
+        ]
+        table['net_funding_rate'] = GmxFrfReader.compute_net_funding_rate(
+            table['funding_factor_per_second'],
+            table['longs_pay_shorts'],
+            table['borrowing_factor_per_second_for_shorts'],
+        )
+        return table
+
+    @staticmethod
+    def sort_markets(table, column='net_funding_rate', descending=True):
+        '''
+        Sort a market table by a column.
+
+        :param table: required
+        :type table: ndarray
+
+        :param column: optional
+        :type column: string
+
+        :param descending: optional
+        :type descending: boolean
+
+        :returns: ndarray
+        '''
+        order = np.argsort(table[column], kind='stable')
+        return table[order[::-1] if descending else order]
+
+    @staticmethod
+    def top_markets(table, k, column='net_funding_rate', include_disabled=False):
+        '''
+        Get the `k` markets with the highest value of a column, highest first.
+
+        :param table: required
+        :type table: ndarray
+
+        :param k: required
+        :type k: integer
+
+        :param column: optional
+        :type column: string
+
+        :param include_disabled: optional
+        :type include_disabled: boolean
+
+        :returns: ndarray
+        '''
+        if not include_disabled:
+            table = table[~table['is_disabled']]
+        if k < len(table):
+            table = table[np.argpartition(-table[column], k)[:k]]
+        return MarketScanner.sort_markets(table, column)
+
+    @staticmethod
+    def to_dataframe(table):
+        '''
+        Convert a market table to a pandas DataFrame indexed by market. Requires pandas.
+
+        :param table: required
+        :type table: ndarray
+
+        :returns: DataFrame
+        '''
+        import pandas as pd
+
+        return pd.DataFrame.from_records(table, index='market')
@@ -0,0 +1,80 @@
+"""Module providing a builder of GMX Frf strategy account multi-calls."""
+
+import copy
+
+from hexbytes import HexBytes
+
+# Writer methods that cannot be batched in a multi-call.
+_UNBATCHED_METHODS = {'multi_call', 'build_multi_call', 'set_strategy_account'}
+
+
+class GmxFrfMultiCallBuilder(object):
+    '''
+    Builder of a multi-call of a GMX Funding-rate Farming strategy account. Offers the
+    transaction methods of `GmxFrfWriter`, without send options, which add a call to the
+    multi-call and return the builder, so calls can be chained. `send` sends every call
+    in one `multicall` transaction, with its gas estimated once.
+    '''
+
+    def __init__(
+        self,
+        writer,
+    ):
+        if writer.strategy_account is None:
+            raise ValueError('Strategy account is not set on the writer')
+
+        self.writer = writer
+        self.data = []
+
+        # Copy of the writer adding the transactions of its methods to the multi-call.
+        self._recorder = copy.copy(writer)
+        self._recorder.send_transaction = self._add_call
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name in _UNBATCHED_METHODS:
+            raise AttributeError(f'{name} cannot be added to a multi-call')
+
+        writer_method = getattr(self._recorder, name)
+        if not callable(writer_method):
+            raise AttributeError(f'{name} is not a writer method')
+
+        def add_call(*args, **kwargs):
+            writer_method(*args, **kwargs)
+            return self
+
+        return add_call
+
+    def __len__(self):
+        return len(self.data)
+
+    def send(self, send_options=None):
+        '''
+        Send every call in one multi-call transaction.
+
+        :param send_options: optional
+        :type send_options: sendOptions
+
+        :returns: transactionHash
+
+        :raises: ValueError, TransactionReverted
+        '''
+        if not self.data:
+            raise ValueError('No calls were added to the multi-call')
+        return self.writer.multi_call(list(self.data), send_options=send_options)
+
+    # -----------------------------------------------------------
+    # Utility Functions
+    # -----------------------------------------------------------
+
+    def _add_call(self, method=None, options=None):
+        '''
+        Add the call of a transaction to the multi-call, in place of sending it.
+        '''
+        if options:
+            raise ValueError('Send options apply to the whole multi-call, pass them to send')
+        if method.address != self.writer.strategy_account.address:
+            raise ValueError(
+                f'A multi-call of {self.writer.strategy_account.address} cannot call '
+                f'{method.address}',
+            )
+        self.data.append(HexBytes(method._encode_transaction_data()))
@@ -2,6 +2,12 @@
 
 import goldlink.constants as Constants
 from goldlink.errors import TransactionReverted
+from goldlink.modules.fee_oracle import FEE_ORACLE
+from goldlink.modules.gas_estimator import GAS_ESTIMATOR
+from goldlink.modules.nonce_manager import NONCE_MANAGER
+
+# Options setting the fees of a transaction.
+FEE_OPTIONS = {'gasPrice', 'maxFeePerGas', 'maxPriorityFeePerGas'}
 
 
 class TransactionHandler():
@@ -22,8 +28,10 @@ class TransactionHandler():
         self.default_address = default_address
         self.send_options = send_options
 
-        # Initialize mapping of next nonce per address.
-        self._next_nonce_for_address = {}
+        # Nonces, fees and gas samples are shared by every writer in the process.
+        self.nonce_manager = NONCE_MANAGER
+        self.fee_oracle = FEE_ORACLE
+        self.gas_estimator = GAS_ESTIMATOR
 
     def send_transaction(
         self,
@@ -55,67 +63,101 @@ class TransactionHandler():
         # Set nonce in options.
         auto_detect_nonce = 'nonce' not in options
         if auto_detect_nonce:
-            options['nonce'] = self.get_next_nonce(options['from'])
+            nonce_key = self.nonce_manager.get_key(self.web3, options['from'])
+            options['nonce'] = self.nonce_manager.reserve(
+                nonce_key,
+                lambda: self._get_pending_transaction_count(options['from']),
+            )
 
-        # Set gas price in options.
-        if 'gasPrice' not in options:
-            try:
-                options['gasPrice'] = (
-                    self.web3.eth.gasPrice + Constants.DEFAULT_GAS_PRICE_ADDITION
-                )
-            except Exception:
-                options['gasPrice'] = Constants.DEFAULT_GAS_PRICE
+        try:
+            transaction_hash = self._sign_and_send_transaction(
+                method,
+                options,
+                nonce_key if auto_detect_nonce else None,
+            )
+        except Exception:
+            if auto_detect_nonce:
+                self.nonce_manager.release(nonce_key, options['nonce'])
+            raise
+
+        if auto_detect_nonce:
+            self.nonce_manager.confirm(nonce_key, options['nonce'])
+
+        # Return hex of transaction hash.
+        return transaction_hash.hex()
+
+    def _sign_and_send_transaction(
+        self,
+        method,
+        options,
+        nonce_key=None,
+    ):
+        '''
+        Fill in the fees and gas of a transaction, then sign and send it. With a nonce
+        key, a nonce found to be used is replaced by a fresh one after resyncing from the
+        node.
+
+        :returns: HexBytes
+
+        :raises: ValueError
+        '''
+        # Set fees in options, unless any fee is set.
+        if not FEE_OPTIONS.intersection(options):
+            options.update(self.fee_oracle.get_fee_options(self.web3))
 
         # Set value in options.
         if 'value' not in options:
             options['value'] = 0
 
-        # Set gas in options.
+        # Set gas in options, from samples of the function if cached gas is used and
+        # from a live estimate otherwise, or if it has too few samples.
         gas_multiplier = options.pop(
             'gasMultiplier',
             Constants.DEFAULT_GAS_MULTIPLIER,
         )
+        use_cached_gas = options.pop('useCachedGas', self.gas_estimator.use_cached_gas)
+        gas_key = self.gas_estimator.get_key(method)
         if 'gas' not in options:
-            try:
-                options['gas'] = int(
-                    method.estimateGas(options) * gas_multiplier
-                )
-            except Exception:
-                options['gas'] = Constants.DEFAULT_GAS_AMOUNT
-
-        # Sign and send transaction.
-        signed = self.sign_transaction(method, options)
-        try:
-            transaction_hash = self.web3.eth.sendRawTransaction(
-                signed.rawTransaction,
-            )
-        except ValueError as error:
-            # Try to resend with higher nonce if nonce is too low.
-            while (
-                auto_detect_nonce and
-                (
-                    'nonce too low' in str(error) or
-                    'replacement transaction underpriced' in str(error)
-                )
-            ):
+            cached_gas = self.gas_estimator.get_cached_gas(gas_key)
+            if use_cached_gas and cached_gas is not None:
+                options['gas'] = int(cached_gas * gas_multiplier)
+            else:
                 try:
-                    options['nonce'] += 1
-                    signed = self.sign_transaction(method, options)
-                    transaction_hash = self.web3.eth.sendRawTransaction(
-                        signed.rawTransaction,
-                    )
-                except ValueError as inner_error:
-                    error = inner_error
+                    estimated_gas = method.estimateGas(options)
+                except Exception:
+                    estimated_gas = cached_gas
                 else:
-                    break  # Break on success...
-            else:
-                raise error  # ...and raise error otherwise.
+                    self.gas_estimator.record(gas_key, estimated_gas)
 
-        # Update next nonce for the account.
-        self._next_nonce_for_address[options['from']] = options['nonce'] + 1
+                if estimated_gas is None:
+                    options['gas'] = Constants.DEFAULT_GAS_AMOUNT
+                else:
+                    options['gas'] = int(estimated_gas * gas_multiplier)
 
-        # Return hex of transaction hash.
-        return transaction_hash.hex()
+        # Sign and send transaction.
+        resyncs = 0
+        while True:
+            signed = self.sign_transaction(method, options)
+            try:
+                transaction_hash = self.web3.eth.sendRawTransaction(signed.rawTransaction)
+                self.gas_estimator.track_transaction(transaction_hash.hex(), gas_key)
+                return transaction_hash
+            except ValueError as error:
+                if nonce_key is None or not self.nonce_manager.is_nonce_error(error):
+                    raise
+                if resyncs >= Constants.DEFAULT_MAX_NONCE_RESYNCS:
+                    self.nonce_manager.confirm(nonce_key, options['nonce'])
+                    raise
+
+            # The nonce was used by another sender, resync past it and take a new one.
+            resyncs += 1
+            used_nonce = options['nonce']
+            self.nonce_manager.confirm(nonce_key, used_nonce)
+            self.nonce_manager.sync(
+                nonce_key,
+                max(self._get_pending_transaction_count(options['from']), used_nonce + 1),
+            )
+            options['nonce'] = self.nonce_manager.reserve(nonce_key)
 
     def get_next_nonce(
         self,
@@ -124,21 +166,23 @@ class TransactionHandler():
         '''
         Get the next nonce for the address.
 
-        :param method: required
-        :type method: function
-
         :param address: required
         :type address: string
 
         :returns: integer
+        '''
+        return self.nonce_manager.get_next_nonce(
+            self.nonce_manager.get_key(self.web3, address),
+            lambda: self._get_pending_transaction_count(address),
+        )
 
-        :raises: TransactionReverted
+    def _get_pending_transaction_count(self, address):
         '''
-        if self._next_nonce_for_address.get(address) is None:
-            self._next_nonce_for_address[address] = (
-                self.web3.eth.getTransactionCount(address)
-            )
-        return self._next_nonce_for_address[address]
+        Get the transaction count of an address, including pending transactions.
+
+        :returns: integer
+        '''
+        return self.web3.eth.getTransactionCount(address, 'pending')
 
     def sign_transaction(
         self,
@@ -182,6 +226,7 @@ class TransactionHandler():
         transaction_receipt = self.web3.eth.waitForTransactionReceipt(
             transaction_hash,
         )
+        self.gas_estimator.record_receipt(transaction_receipt)
         if transaction_receipt['status'] == 0:
             raise TransactionReverted(transaction_receipt)
 
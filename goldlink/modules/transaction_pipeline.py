@@ -0,0 +1,212 @@
+"""Module providing pipelined submission of transactions to GoldLink Contracts."""
+
+import threading
+import time
+from concurrent.futures import Future
+
+from web3.exceptions import TimeExhausted
+
+import goldlink.constants as Constants
+from goldlink.errors import TransactionReverted
+
+
+class TransactionPipeline(object):
+    '''
+    Module for sending many transactions without waiting on each. Transactions are
+    signed and sent back to back through a writer, taking consecutive nonces, and
+    return futures. Their receipts are tracked together by one background poller that
+    reads each new block once and only fetches the receipts of tracked transactions it
+    contains. A future resolves to the receipt, or raises `TransactionReverted` on
+    revert and `TimeExhausted` if not mined within `timeout` seconds.
+    '''
+
+    def __init__(
+        self,
+        writer,
+        poll_interval=Constants.DEFAULT_BLOCK_POLL_INTERVAL,
+        timeout=Constants.DEFAULT_TRANSACTION_TIMEOUT,
+    ):
+        self.writer = writer
+        self.web3 = writer.web3
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+
+        # Future and deadline per tracked transaction hash.
+        self._pending = {}
+
+        # Next block to read for tracked transactions, and the poller reading them.
+        self._next_block = None
+        self._poller = None
+
+        # Transactions announced and not yet tracked, keeping the poller running.
+        self._starting = 0
+
+    def submit(self, method, options=None):
+        '''
+        Sign and send a transaction, and track its receipt.
+
+        :param method: required
+        :type method: function
+
+        :param options: optional
+        :type options: transactionOptions
+
+        :returns: Future, of transactionReceipt
+
+        :raises: ValueError
+        '''
+        self._start_tracking(include_head=False)
+        try:
+            transaction_hash = self.writer.send_transaction(method=method, options=options)
+        except Exception:
+            with self._lock:
+                self._starting -= 1
+            raise
+        return self._track(transaction_hash)
+
+    def submit_many(self, transactions):
+        '''
+        Sign and send transactions back to back, and track their receipts. A
+        transaction that fails to send fails its future without stopping the others.
+
+        :param transactions: required
+        :type transactions: [](method, transactionOptions) | []method
+
+        :returns: []Future, of transactionReceipt, in order
+        '''
+        futures = []
+        for transaction in transactions:
+            method, options = transaction if isinstance(transaction, tuple) else (transaction, None)
+            try:
+                futures.append(self.submit(method, options))
+            except Exception as error:
+                future = Future()
+                future.set_exception(error)
+                futures.append(future)
+
+        return futures
+
+    def track(self, transaction_hash):
+        '''
+        Track the receipt of a transaction sent since the latest block, such as one
+        returned by a writer method.
+
+        :param transaction_hash: required
+        :type transaction_hash: hex
+
+        :returns: Future, of transactionReceipt
+        '''
+        self._start_tracking(include_head=True)
+        return self._track(transaction_hash)
+
+    def wait(self, futures):
+        '''
+        Wait for the receipts of futures.
+
+        :param futures: required
+        :type futures: []Future
+
+        :returns: []transactionReceipt, in order
+
+        :raises: TransactionReverted, TimeExhausted
+        '''
+        return [future.result() for future in futures]
+
+    # -----------------------------------------------------------
+    # Polling Functions
+    # -----------------------------------------------------------
+
+    def _start_tracking(self, include_head):
+        '''
+        Announce a transaction about to be tracked. If none is tracked, blocks are read
+        from the latest one, or the one after it for transactions not yet sent.
+        '''
+        with self._lock:
+            self._starting += 1
+            if self._next_block is not None:
+                return
+
+        try:
+            block_number = self.web3.eth.blockNumber
+        except Exception:
+            with self._lock:
+                self._starting -= 1
+            raise
+
+        if not include_head:
+            block_number += 1
+        with self._lock:
+            if self._next_block is None or block_number < self._next_block:
+                self._next_block = block_number
+
+    def _track(self, transaction_hash):
+        '''
+        Track an announced transaction, starting the poller if it is not running.
+
+        :returns: Future, of transactionReceipt
+        '''
+        future = Future()
+        with self._lock:
+            self._starting -= 1
+            self._pending[self.web3.toHex(hexstr=transaction_hash)] = (
+                future,
+                time.monotonic() + self.timeout,
+            )
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._poll, daemon=True)
+                self._poller.start()
+
+        return future
+
+    def _poll(self):
+        '''
+        Read new blocks until no transaction is tracked.
+        '''
+        while True:
+            try:
+                head = self.web3.eth.blockNumber
+                while self._next_block <= head:
+                    self._read_block(self._next_block)
+                    self._next_block += 1
+            except Exception:
+                # Retried on the next poll, until transactions time out.
+                pass
+
+            now = time.monotonic()
+            with self._lock:
+                for transaction_hash, (future, deadline) in list(self._pending.items()):
+                    if now > deadline:
+                        del self._pending[transaction_hash]
+                        future.set_exception(TimeExhausted(
+                            f'Transaction {transaction_hash} is not in the chain after '
+                            f'{self.timeout} seconds',
+                        ))
+                if not self._pending and not self._starting:
+                    self._next_block = None
+                    self._poller = None
+                    return
+
+            time.sleep(self.poll_interval)
+
+    def _read_block(self, block_number):
+        '''
+        Resolve the futures of the tracked transactions mined in a block.
+        '''
+        block = self.web3.eth.getBlock(block_number)
+        with self._lock:
+            mined = [
+                transaction_hash.hex() for transaction_hash in block['transactions']
+                if transaction_hash.hex() in self._pending
+            ]
+
+        for transaction_hash in mined:
+            transaction_receipt = self.web3.eth.getTransactionReceipt(transaction_hash)
+            with self._lock:
+                future, _ = self._pending.pop(transaction_hash)
+            if transaction_receipt['status'] == 0:
+                future.set_exception(TransactionReverted(transaction_receipt))
+            else:
+                future.set_result(transaction_receipt)
+            self.writer.gas_estimator.record_receipt(transaction_receipt)
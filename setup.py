@@ -27,6 +27,9 @@ setup(
     license='Apache 2.0',
     author_email='info@goldlink.io',
     install_requires=REQUIREMENTS,
+    extras_require={
+        'scanner': ['numpy'],
+    },
     keywords='goldlink defi arb arbitrum ethereum eth',
     classifiers=[
         'Intended Audience :: Developers',